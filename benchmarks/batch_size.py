@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="string", default="1000,10000,50000,200000",
+    help="Comma separated list of key list sizes to benchmark")
+
+optparser.add_option(
+    "--max-keys", dest="max_keys", type="string", default="0,1000,2500,5000,10000",
+    help="Comma separated list of max_keys batch policies to benchmark")
+
+optparser.add_option(
+    "--max-concurrent", dest="max_concurrent", type="int", default=0,
+    help="Maximum number of batch requests in flight, 0 for all threads")
+
+optparser.add_option(
+    "--async-threads", dest="async_threads", type="int", default=8,
+    help="Number of threads of the client's pool")
+
+optparser.add_option(
+    "--runs", dest="runs", type="int", default=3,
+    help="Number of get_many calls averaged per measure")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ],
+    'async_threads': options.async_threads
+}
+
+################################################################################
+# Application
+################################################################################
+
+def run(client, keys, max_keys):
+    policy = {'max_keys': max_keys, 'max_concurrent': options.max_concurrent}
+    start = time.time()
+    for i in xrange(options.runs):
+        client.get_many(keys, policy)
+    return len(keys) * options.runs / (time.time() - start)
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+sizes = [int(n) for n in options.keys.split(',')]
+max_keys = [int(n) for n in options.max_keys.split(',')]
+
+records = [(options.namespace, options.set, i) for i in xrange(max(sizes))]
+client.put_many([(key, {'i': key[2]}) for key in records])
+
+print("{0:>8} {1:>9} {2:>12}".format("keys", "max_keys", "keys/sec"))
+
+for size in sizes:
+    keys = records[:size]
+    for n in max_keys:
+        try:
+            kps = run(client, keys, n)
+            print("{0:>8} {1:>9} {2:>12.0f}".format(size, n, kps))
+        except Exception, eargs:
+            # A single batch larger than batch-max-requests is refused
+            print("{0:>8} {1:>9} {2:>12}".format(size, n, getattr(eargs, 'msg', eargs)))
+
+client.remove_many(records)
+
+client.close()
+
+sys.exit(0)
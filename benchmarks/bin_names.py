@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--records", dest="records", type="int", default=5000,
+    help="Number of records read per run")
+
+optparser.add_option(
+    "--bins", dest="bins", type="int", default=20,
+    help="Number of bins per record")
+
+optparser.add_option(
+    "--runs", dest="runs", type="int", default=10,
+    help="Number of runs")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Application
+################################################################################
+
+def convert(client, keys):
+    start = time.time()
+    for i in xrange(options.runs):
+        records = client.get_many(keys, None, {'ordered': True})
+    return (records, len(keys) * options.runs / (time.time() - start))
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+keys = [(options.namespace, options.set, i) for i in xrange(options.records)]
+bins = dict(('bin%d' % b, b) for b in xrange(options.bins))
+client.put_many([(key, bins) for key in keys])
+
+(records, rps) = convert(client, keys)
+
+# Every bin name object which is not shared by all the records is an
+# allocation made while converting them
+names = set()
+for (key, meta, record_bins) in records:
+    names.update(id(name) for name in record_bins)
+
+print("{0:>12} {1:>6} {2:>14} {3:>22}".format("records", "bins", "records/sec", "bin name objects/rec"))
+print("{0:>12} {1:>6} {2:>14.0f} {3:>22.3f}".format(
+    len(records), options.bins, rps, float(len(names)) / len(records)))
+
+client.remove_many(keys)
+
+client.close()
+
+sys.exit(0)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import multiprocessing
+import os
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--workers", dest="workers", type="int", default=8,
+    help="Number of worker processes forked per run")
+
+optparser.add_option(
+    "--runs", dest="runs", type="int", default=5,
+    help="Number of runs per mode")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Application
+################################################################################
+
+key = (options.namespace, options.set, 'fork-benchmark')
+
+def connect():
+    return aerospike.client(config).connect(options.username, options.password)
+
+def worker(mode, client, forked, queue):
+    # start-up: time from fork until the worker is ready to serve
+    if mode == 'reconnect':
+        client = connect()
+    ready = time.time()
+    client.get(key)
+    done = time.time()
+    queue.put((ready - forked, done - ready))
+    client.close()
+
+def run(mode, client):
+    queue = multiprocessing.Queue()
+    workers = []
+    for n in range(options.workers):
+        forked = time.time()
+        p = multiprocessing.Process(target=worker, args=(mode, client, forked, queue))
+        p.start()
+        workers.append(p)
+    results = [queue.get() for p in workers]
+    for p in workers:
+        p.join()
+    startup = sum(r[0] for r in results) / len(results)
+    first = sum(r[1] for r in results) / len(results)
+    return (startup, first)
+
+try:
+    client = connect()
+    client.put(key, {'i': 1})
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+print("{0:>10} {1:>14} {2:>18}".format("mode", "startup (ms)", "first get (ms)"))
+
+# reconnect: each worker connects a new client by hand
+# inherit: each worker uses the client of the parent, rebuilt on first use
+for mode in ['reconnect', 'inherit']:
+    startup = 0.0
+    first = 0.0
+    for i in range(options.runs):
+        (s, f) = run(mode, client)
+        startup += s
+        first += f
+    print("{0:>10} {1:>14.2f} {2:>18.2f}".format(
+        mode, startup * 1000 / options.runs, first * 1000 / options.runs))
+
+client.remove(key)
+client.close()
+
+sys.exit(0)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import threading
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=10000,
+    help="Number of unique keys")
+
+optparser.add_option(
+    "--ops", dest="ops", type="int", default=20000,
+    help="Number of operations performed per run")
+
+optparser.add_option(
+    "--threads", dest="threads", type="int", default=32,
+    help="Number of Python threads issuing requests")
+
+optparser.add_option(
+    "--max-conns", dest="max_conns", type="string", default="4,8,16,32,64,300",
+    help="Comma separated list of max_conns_per_node values to benchmark")
+
+optparser.add_option(
+    "--thread-pool-sizes", dest="thread_pool_sizes", type="string", default="1,2,4,8,16",
+    help="Comma separated list of thread_pool_size values to benchmark with get_many")
+
+optparser.add_option(
+    "--batch", dest="batch", type="int", default=100,
+    help="Number of keys per get_many")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Application
+################################################################################
+
+def connect(**tuning):
+    config = {
+        'hosts': [ (options.host, options.port) ]
+    }
+    config.update(tuning)
+    return aerospike.client(config).connect(options.username, options.password)
+
+def key(i):
+    return (options.namespace, options.set, i % options.keys)
+
+def kvs_worker(client, count, offset):
+    for i in xrange(count):
+        client.get(key(offset + i))
+
+def batch_worker(client, count, offset):
+    for i in xrange(count):
+        client.get_many([key(offset + i * options.batch + j) for j in xrange(options.batch)])
+
+def run(client, worker, ops):
+    per_thread = ops / options.threads
+    threads = [
+        threading.Thread(target=worker, args=(client, per_thread, n * per_thread))
+        for n in range(options.threads)
+    ]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+    return (per_thread * options.threads) / elapsed
+
+try:
+    client = connect()
+    for i in xrange(options.keys):
+        client.put(key(i), {'i': i})
+    client.close()
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+print("get with {0} threads".format(options.threads))
+print("{0:>20} {1:>12}".format("max_conns_per_node", "ops/sec"))
+for max_conns in [int(n) for n in options.max_conns.split(',')]:
+    client = connect(max_conns_per_node=max_conns)
+    tps = run(client, kvs_worker, options.ops)
+    print("{0:>20} {1:>12.0f}".format(client.config()['max_conns_per_node'], tps))
+    client.close()
+
+print()
+print("get_many of {0} keys with {1} threads".format(options.batch, options.threads))
+print("{0:>20} {1:>12}".format("thread_pool_size", "keys/sec"))
+for size in [int(n) for n in options.thread_pool_sizes.split(',')]:
+    client = connect(thread_pool_size=size)
+    tps = run(client, batch_worker, options.ops / options.batch) * options.batch
+    print("{0:>20} {1:>12.0f}".format(client.config()['thread_pool_size'], tps))
+    client.close()
+
+sys.exit(0)
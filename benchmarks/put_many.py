@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--records", dest="records", type="int", default=100000,
+    help="Number of records written per run")
+
+optparser.add_option(
+    "--chunk", dest="chunk", type="int", default=10000,
+    help="Number of records per put_many call")
+
+optparser.add_option(
+    "--async-threads", dest="async_threads", type="int", default=8,
+    help="Number of threads of the client's pool")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ],
+    'async_threads': options.async_threads
+}
+
+################################################################################
+# Application
+################################################################################
+
+def make_records():
+    return [((options.namespace, options.set, i), {'i': i, 's': 'value %d' % i})
+            for i in xrange(options.records)]
+
+def put_loop(client, records):
+    for (key, bins) in records:
+        client.put(key, bins)
+
+def put_many(client, records):
+    for offset in xrange(0, len(records), options.chunk):
+        status = client.put_many(records[offset:offset + options.chunk])
+        if any(status):
+            raise Exception("{0} writes failed".format(sum(1 for s in status if s)))
+
+def run(fn, client, records):
+    start = time.time()
+    fn(client, records)
+    return len(records) / (time.time() - start)
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+records = make_records()
+
+print("{0:>10} {1:>14} {2:>8}".format("method", "records/sec", "speedup"))
+
+baseline = run(put_loop, client, records)
+print("{0:>10} {1:>14.0f} {2:>7.2f}x".format("put", baseline, 1.0))
+
+tps = run(put_many, client, records)
+print("{0:>10} {1:>14.0f} {2:>7.2f}x".format("put_many", tps, tps / baseline))
+
+for (key, bins) in records:
+    client.remove(key)
+
+client.close()
+
+sys.exit(0)
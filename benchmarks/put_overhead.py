@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--ops", dest="ops", type="int", default=50000,
+    help="Number of puts per record shape")
+
+optparser.add_option(
+    "--values", dest="values", type="string", default="0,16,1024,4096",
+    help="Comma separated list of serialized values per record")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Application
+################################################################################
+
+def record(nvalues):
+    # Every bytearray takes an as_bytes of the static pool of the put
+    bins = {'i': 1}
+    if nvalues:
+        bins['l'] = [bytearray('v')] * nvalues
+    return bins
+
+def run(client, bins):
+    key = (options.namespace, options.set, 'put_overhead')
+    start = time.time()
+    for i in xrange(options.ops):
+        client.put(key, bins)
+    elapsed = time.time() - start
+    client.remove(key)
+    return elapsed
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+print("{0:>8} {1:>12} {2:>12}".format("values", "puts/sec", "usec/put"))
+
+for nvalues in [int(n) for n in options.values.split(',')]:
+    try:
+        elapsed = run(client, record(nvalues))
+    except Exception, eargs:
+        print("{0:>8} error: {1}".format(nvalues, eargs))
+        continue
+    print("{0:>8} {1:>12.0f} {2:>12.1f}".format(
+        nvalues, options.ops / elapsed, elapsed * 1e6 / options.ops))
+
+client.close()
+
+sys.exit(0)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--records", dest="records", type="int", default=100000,
+    help="Number of records to write before scanning. 0 to scan the existing records.")
+
+optparser.add_option(
+    "--batch-sizes", dest="batch_sizes", type="string", default="0,1,10,100,1000",
+    help="Comma separated list of batch sizes to benchmark. 0 invokes the callback per record.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Application
+################################################################################
+
+def run(client, batch_size):
+    count = [0]
+    if batch_size:
+        def callback(records):
+            count[0] += len(records)
+    else:
+        def callback(record):
+            count[0] += 1
+    scan = client.scan(options.namespace, options.set)
+    start = time.time()
+    scan.foreach(callback, batch_size=batch_size)
+    elapsed = time.time() - start
+    return count[0], count[0] / elapsed
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+for i in xrange(options.records):
+    client.put((options.namespace, options.set, i), {'i': i, 's': str(i)})
+
+print("{0:>10} {1:>10} {2:>12}".format("batch_size", "records", "records/sec"))
+
+for batch_size in [int(n) for n in options.batch_sizes.split(',')]:
+    records, rps = run(client, batch_size)
+    print("{0:>10} {1:>10} {2:>12.0f}".format(batch_size, records, rps))
+
+client.close()
+
+sys.exit(0)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import threading
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace to use.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set to use.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=10000,
+    help="Number of unique keys")
+
+optparser.add_option(
+    "--ops", dest="ops", type="int", default=20000,
+    help="Number of operations performed per run")
+
+optparser.add_option(
+    "--threads", dest="threads", type="string", default="1,2,4,8,16",
+    help="Comma separated list of thread counts to benchmark")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Application
+################################################################################
+
+def worker(client, count, offset):
+    for i in xrange(count):
+        key = (options.namespace, options.set, (offset + i) % options.keys)
+        client.put(key, {'i': i})
+        client.get(key)
+
+def run(client, nthreads):
+    per_thread = options.ops / nthreads
+    threads = [
+        threading.Thread(target=worker, args=(client, per_thread, n * per_thread))
+        for n in range(nthreads)
+    ]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+    return (per_thread * nthreads * 2) / elapsed
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(1)
+
+print("{0:>8} {1:>12} {2:>8}".format("threads", "ops/sec", "scaling"))
+
+baseline = None
+for nthreads in [int(n) for n in options.threads.split(',')]:
+    tps = run(client, nthreads)
+    if baseline is None:
+        baseline = tps
+    print("{0:>8} {1:>12.0f} {2:>7.2f}x".format(nthreads, tps, tps / baseline))
+
+client.close()
+
+sys.exit(0)
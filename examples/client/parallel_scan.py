@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Copyright 2013-2014 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from __future__ import print_function
+
+import aerospike
+import multiprocessing
+import sys
+import time
+
+from optparse import OptionParser
+
+################################################################################
+# Options Parsing
+################################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-b", "--bins", dest="bins", type="string", action="append",
+    help="Bins to select from each record.")
+
+optparser.add_option(
+    "--processes", dest="processes", type="int", default=multiprocessing.cpu_count(),
+    help="Maximum number of worker processes. Each one scans a node of the cluster.")
+
+optparser.add_option(
+    "--batch-size", dest="batch_size", type="int", default=1000,
+    help="Number of records passed to each callback of the workers.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+################################################################################
+# Client Configuration
+################################################################################
+
+config = {
+    'hosts': [ (options.host, options.port) ]
+}
+
+################################################################################
+# Workers
+################################################################################
+
+# The client of the worker process
+worker_client = None
+
+def init_worker():
+    # Each worker connects its own client, which decodes the records of its
+    # node on its own core.
+    global worker_client
+    worker_client = aerospike.client(config).connect(options.username, options.password)
+
+def scan_node(node):
+    namespace = options.namespace if options.namespace and options.namespace != 'None' else None
+    set = options.set if options.set and options.set != 'None' else None
+
+    s = worker_client.scan(namespace, set)
+
+    if options.bins and len(options.bins) > 0:
+        # project specified bins
+        s.select(*options.bins)
+
+    # reduce the records of the node to a partial result, only the partial
+    # results are sent back to the parent process
+    partial = {'records': 0, 'bins': 0}
+
+    def callback(records):
+        partial['records'] += len(records)
+        for (key, meta, bins) in records:
+            partial['bins'] += len(bins)
+
+    s.foreach(callback, batch_size=options.batch_size, node=node)
+
+    return partial
+
+################################################################################
+# Application
+################################################################################
+
+exitCode = 0
+
+try:
+
+    # ----------------------------------------------------------------------------
+    # Resolve the names of the nodes of the cluster
+    # ----------------------------------------------------------------------------
+
+    client = aerospike.client(config).connect(options.username, options.password)
+
+    nodes = []
+    for host in client.get_nodes():
+        response = client.info_node('node', host)
+        nodes.append(response.split('\t')[1].strip())
+
+    # The workers use their own connections
+    client.close()
+
+    # ----------------------------------------------------------------------------
+    # Scan each node in a worker process and merge the partial results
+    # ----------------------------------------------------------------------------
+
+    try:
+
+        processes = max(1, min(options.processes, len(nodes)))
+        pool = multiprocessing.Pool(processes, init_worker)
+
+        start = time.time()
+        partials = pool.map(scan_node, nodes)
+        elapsed = time.time() - start
+
+        pool.close()
+        pool.join()
+
+        records = sum(partial['records'] for partial in partials)
+        bins = sum(partial['bins'] for partial in partials)
+
+        print("---")
+        print("OK, %d records (%d bins) scanned from %d nodes by %d processes in %.2f seconds (%.0f records/sec)." % (
+            records, bins, len(nodes), processes, elapsed, records / elapsed if elapsed else 0))
+
+    except Exception as e:
+        print("error: {0}".format(e), file=sys.stderr)
+        exitCode = 2
+
+except Exception, eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    exitCode = 3
+
+################################################################################
+# Exit
+################################################################################
+
+sys.exit(exitCode)
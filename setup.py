@@ -277,7 +277,9 @@ setup(
                 'src/main/log.c',
                 'src/main/client/type.c',
                 'src/main/client/apply.c',
+                'src/main/client/apply_many.c',
                 'src/main/client/close.c',
+                'src/main/client/config.c',
                 'src/main/client/connect.c',
                 'src/main/client/exists.c',
                 'src/main/client/exists_many.c',
@@ -288,10 +290,14 @@ setup(
                 'src/main/client/info.c',
                 'src/main/client/key.c',
                 'src/main/client/put.c',
+                'src/main/client/put_many.c',
                 'src/main/client/operate.c',
+                'src/main/client/operate_many.c',
                 'src/main/client/query.c',
                 'src/main/client/remove.c',
+                'src/main/client/remove_many.c',
                 'src/main/client/scan.c',
+                'src/main/client/async.c',
                 'src/main/client/select.c',
                 'src/main/client/admin.c',
                 'src/main/client/udf.c',
@@ -313,11 +319,13 @@ setup(
                 'src/main/query/apply.c',
                 'src/main/query/foreach.c',
                 'src/main/query/results.c',
+                'src/main/query/iter.c',
                 'src/main/query/select.c',
                 'src/main/query/where.c',
                 'src/main/scan/type.c',
                 'src/main/scan/foreach.c',
                 'src/main/scan/results.c',
+                'src/main/scan/iter.c',
                 'src/main/scan/select.c',
                 'src/main/lstack/type.c',
                 'src/main/lstack/lstack_operations.c',
@@ -327,8 +335,18 @@ setup(
                 'src/main/llist/llist_operations.c',
                 'src/main/lmap/type.c',
                 'src/main/lmap/lmap_operations.c',
+                'src/main/async/type.c',
+                'src/main/async/job.c',
+                'src/main/async/operations.c',
+                'src/main/async/process.c',
+                'src/main/batch.c',
+                'src/main/batch_dispatch.c',
+                'src/main/thread_pool.c',
                 'src/main/conversions.c',
                 'src/main/policy.c',
+                'src/main/record.c',
+                'src/main/result_buffer.c',
+                'src/main/result_iterator.c',
                 'src/main/predicates.c'
             ],
 
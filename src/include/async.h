@@ -0,0 +1,207 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_policy.h>
+#include <aerospike/as_record.h>
+
+#include "batch.h"
+#include "types.h"
+
+/*******************************************************************************
+ * ASYNC JOBS
+ ******************************************************************************/
+
+typedef enum {
+	ASYNC_GET,
+	ASYNC_PUT,
+	ASYNC_OPERATE,
+	ASYNC_GET_MANY
+} AsyncJobType;
+
+/**
+ * A single non-blocking request. The inputs are converted to C structures
+ * when the job is created and the request runs on a thread of a pool without
+ * the GIL. Jobs of an AsyncClient (owner) are handed back to it and
+ * converted when the completion is processed. Jobs without an owner resolve
+ * their future as soon as they complete.
+ */
+typedef struct AsyncJob_s {
+	AsyncJobType type;
+	AerospikeClient * client;
+	AerospikeAsyncClient * owner;
+	as_error err;
+
+	// Python objects kept alive for the life of the job
+	PyObject * py_key;
+	PyObject * py_data;
+	PyObject * py_callback;
+	PyObject * py_future;
+
+	// Converted inputs
+	as_key key;
+	bool key_initialised;
+	as_record rec;
+	bool rec_initialised;
+	as_operations ops;
+	bool ops_initialised;
+	as_batch batch;
+	bool batch_initialised;
+	as_static_pool * static_pool;
+	union {
+		as_policy_read read;
+		as_policy_write write;
+		as_policy_operate operate;
+		as_policy_batch batch;
+	} policy;
+	void * policy_p;
+
+	// Results
+	as_record * result;
+	BatchReadResults batch_results;
+
+	struct AsyncJob_s * next;
+} AsyncJob;
+
+/**
+ * Allocate a job. The Python objects are referenced until the job is
+ * destroyed. owner is NULL for jobs resolving a future.
+ */
+AsyncJob * async_job_new(AerospikeClient * client, AerospikeAsyncClient * owner,
+		AsyncJobType type, PyObject * py_key, PyObject * py_data, PyObject * py_callback);
+
+/**
+ * Convert the inputs of a job, with the GIL held. The key, bins and
+ * operations are taken from the py_key and py_data of the job.
+ */
+as_status async_job_prepare_get(AsyncJob * job, as_error * err, PyObject * py_policy);
+
+as_status async_job_prepare_put(AsyncJob * job, as_error * err, PyObject * py_meta,
+		PyObject * py_policy, long serializer_option);
+
+as_status async_job_prepare_operate(AsyncJob * job, as_error * err, PyObject * py_meta,
+		PyObject * py_policy);
+
+as_status async_job_prepare_get_many(AsyncJob * job, as_error * err, PyObject * py_policy);
+
+/**
+ * Queue the job on the pool. On failure the job is destroyed and a Python
+ * exception is set.
+ */
+bool async_job_submit(AsyncJob * job, ThreadPool * pool);
+
+/**
+ * Raise err, unless a Python exception is already set, and destroy the job
+ * if there is one. Returns NULL.
+ */
+PyObject * async_job_raise(as_error * err, AsyncJob * job, PyObject * py_key);
+
+/**
+ * Convert the outcome of a completed job to a Python object. Returns NULL
+ * and sets the Python exception if the request failed.
+ */
+PyObject * async_job_result(AsyncJob * job);
+
+/**
+ * Release the job and everything it holds. Must be called with the GIL.
+ */
+void async_job_destroy(AsyncJob * job);
+
+/**
+ * Wait for the outstanding requests, stop the threads of the pool and close
+ * the completion file descriptor. The remaining completions are processed,
+ * with their callbacks invoked only if invoke_callbacks is true.
+ */
+void async_client_shutdown(AerospikeAsyncClient * self, bool invoke_callbacks);
+
+/*******************************************************************************
+ * ASYNC CLIENT TYPE
+ ******************************************************************************/
+
+PyTypeObject * AerospikeAsyncClient_Ready(void);
+
+AerospikeAsyncClient * AerospikeAsyncClient_New(AerospikeClient * client, PyObject * args, PyObject * kwds);
+
+/*******************************************************************************
+ * ASYNC CLIENT OPERATIONS
+ ******************************************************************************/
+
+/**
+ * Read a record, calling callback(record, exception) once it completes.
+ *
+ *		async_client.get((x,y,z), callback)
+ *
+ */
+PyObject * AerospikeAsyncClient_Get(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Write a record, calling callback(status, exception) once it completes.
+ *
+ *		async_client.put((x,y,z), bins, callback)
+ *
+ */
+PyObject * AerospikeAsyncClient_Put(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Perform multiple operations on a record, calling callback(result, exception)
+ * once it completes.
+ *
+ *		async_client.operate((x,y,z), [ops], callback)
+ *
+ */
+PyObject * AerospikeAsyncClient_Operate(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Read a batch of records, calling callback(records, exception) once it
+ * completes.
+ *
+ *		async_client.get_many([keys], callback)
+ *
+ */
+PyObject * AerospikeAsyncClient_Get_Many(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * File descriptor which becomes readable when requests complete.
+ *
+ *		loop.add_reader(async_client.fileno(), async_client.process)
+ *
+ */
+PyObject * AerospikeAsyncClient_Fileno(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Convert the results of the completed requests and invoke their callbacks.
+ * Returns the number of completions processed.
+ *
+ *		async_client.process()
+ *
+ */
+PyObject * AerospikeAsyncClient_Process(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Wait for the outstanding requests and stop the threads of the pool.
+ *
+ *		async_client.close()
+ *
+ */
+PyObject * AerospikeAsyncClient_Close(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds);
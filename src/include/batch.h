@@ -0,0 +1,220 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_batch.h>
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * RECORD VALUES
+ ******************************************************************************/
+
+/**
+ * Take a reference to the value of a bin, which outlives the record it came
+ * from. Values stored inline in the bin are copied, all others are reserved.
+ * Returns NULL on allocation failure.
+ */
+as_bin_value * bin_value_copy(const as_bin * bin);
+
+/*******************************************************************************
+ * BATCH KEYS
+ ******************************************************************************/
+
+/**
+ * Initialize the batch with the integer keys of an int64 array, in the
+ * namespace and set given by py_ns and py_set. The keys are read straight
+ * from the buffer of the array and their digests are computed without the
+ * GIL. The batch is only initialized on success.
+ */
+as_status batch_int64_keys_init(as_error * err, PyObject * py_ns, PyObject * py_set,
+		PyObject * py_keys, as_batch * batch);
+
+/*******************************************************************************
+ * BATCH READ OPTIONS
+ ******************************************************************************/
+
+/**
+ * Layouts of the results of a batch read.
+ */
+typedef enum {
+
+	/**
+	 * Records, in a dict or an ordered list.
+	 */
+	BATCH_READ_OUTPUT_RECORDS,
+
+	/**
+	 * A bitmap of the existing records, for exists_many().
+	 */
+	BATCH_READ_OUTPUT_BITMAP,
+
+	/**
+	 * The bitmap along with arrays of the generations and ttls of the
+	 * records, for exists_many().
+	 */
+	BATCH_READ_OUTPUT_ARRAYS,
+
+	/**
+	 * A list of values per selected bin, for select_many().
+	 */
+	BATCH_READ_OUTPUT_COLUMNS
+
+} BatchReadOutput;
+
+/**
+ * Options of get_many(), select_many() and exists_many(), read from their
+ * options dict.
+ */
+typedef struct {
+
+	/**
+	 * Return a list aligned with the keys instead of a dict keyed by the
+	 * primary key.
+	 */
+	bool ordered;
+
+	/**
+	 * Layout of the results.
+	 */
+	BatchReadOutput output;
+
+} BatchReadOptions;
+
+/**
+ * Convert the options dict of a batch read. py_options may be NULL or None,
+ * in which case the defaults are used.
+ */
+as_status pyobject_to_batch_read_options(as_error * err, PyObject * py_options, BatchReadOptions * options);
+
+/*******************************************************************************
+ * BATCH READ CHUNKING
+ ******************************************************************************/
+
+/**
+ * Default number of keys of a batch request, which matches the default
+ * batch-max-requests of the server.
+ */
+#define BATCH_MAX_KEYS 5000
+
+/**
+ * How the keys of a batch read are split into several batch requests.
+ */
+typedef struct {
+
+	/**
+	 * Maximum number of keys of a batch request, 0 for no limit.
+	 */
+	uint32_t max_keys;
+
+	/**
+	 * Maximum number of batch requests in flight.
+	 */
+	uint32_t max_concurrent;
+
+	/**
+	 * Pool running the batch requests beside the calling thread.
+	 */
+	ThreadPool * pool;
+
+} BatchReadChunking;
+
+/**
+ * Read the max_keys and max_concurrent fields of the batch policy dict of a
+ * read of n keys, defaulting to the settings of the client, and start the
+ * async pool of the client if the keys will be split. Must be called with
+ * the GIL held.
+ */
+as_status batch_read_chunking_init(as_error * err, AerospikeClient * self,
+		PyObject * py_policy, uint32_t n, BatchReadChunking * chunking);
+
+/*******************************************************************************
+ * BATCH READ RESULTS
+ ******************************************************************************/
+
+/**
+ * Raw results of a batch read, collected by batch_read_results_collect()
+ * while the GIL is released. The keys point into the caller's as_batch,
+ * which must outlive the results; the records are owned by the structure.
+ */
+typedef struct {
+	as_batch_read * results;
+	uint32_t size;
+} BatchReadResults;
+
+/**
+ * Initialize an empty set of batch read results.
+ */
+void batch_read_results_init(BatchReadResults * data);
+
+/**
+ * aerospike_batch_read_callback which copies the results into the
+ * BatchReadResults passed as udata. It never touches Python objects, so
+ * the batch call can be made without holding the GIL.
+ */
+bool batch_read_results_collect(const as_batch_read * results, uint32_t n, void * udata);
+
+/**
+ * Release the records held by the batch read results.
+ */
+void batch_read_results_destroy(BatchReadResults * data);
+
+/**
+ * The batch requests a batch read can be made with.
+ */
+typedef enum {
+	BATCH_READ_GET,
+	BATCH_READ_GET_BINS,
+	BATCH_READ_EXISTS
+} BatchReadOp;
+
+/**
+ * Read the records of the batch into results, with the bins given for
+ * BATCH_READ_GET_BINS. Batches of more than chunking->max_keys keys are
+ * deduplicated and split into several requests, which run concurrently,
+ * and their results are merged back in the order of the keys. Must be
+ * called without the GIL.
+ */
+as_status batch_read(aerospike * as, as_error * err, const as_policy_batch * policy,
+		as_batch * batch, BatchReadOp op, const char ** bins, uint32_t n_bins,
+		const BatchReadChunking * chunking, BatchReadResults * results);
+
+/**
+ * Add the results of a get_many() batch to the py_recs dict, keyed by the
+ * primary key. Must be called with the GIL held.
+ */
+bool batch_get_to_pyobject(const as_batch_read * results, uint32_t n, PyObject * py_recs);
+
+/**
+ * Convert a successful batch read result to its Python value.
+ */
+typedef as_status (* BatchReadToPyObject)(as_error * err, const as_batch_read * result, PyObject ** obj);
+
+/**
+ * Build a list aligned with the keys of the batch from its read results.
+ * Each slot holds the value produced by convert for the key, None if the
+ * record was not found, or the status code of any other failure.
+ * Must be called with the GIL held. Returns NULL on error.
+ */
+PyObject * batch_read_results_to_list(as_error * err, const BatchReadResults * data,
+		const as_batch * batch, BatchReadToPyObject convert);
@@ -0,0 +1,82 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_status.h>
+
+#include "thread_pool.h"
+
+/*******************************************************************************
+ * BATCH DISPATCH
+ *
+ * Runs the requests of the *_many() methods concurrently, one request per
+ * key, on the calling thread and the threads of a pool. Requests run without
+ * the GIL, so they must not touch Python objects.
+ ******************************************************************************/
+
+/**
+ * Runs the request of the i-th key of udata.
+ */
+typedef void (* BatchDispatchFn)(void * udata, uint32_t i);
+
+/**
+ * Run fn(udata, i) for each i in [0, n), using up to concurrency threads of
+ * the pool in addition to the calling thread, and return once all of them
+ * completed. Must be called without holding the GIL.
+ */
+void batch_dispatch(ThreadPool * pool, uint32_t concurrency, uint32_t n,
+		BatchDispatchFn fn, void * udata);
+
+/**
+ * Returns an array.array of the given typecode holding a copy of the size
+ * bytes of values.
+ */
+PyObject * batch_array_to_pyobject(const char * typecode, const void * values, size_t size);
+
+/**
+ * Returns an array.array('i') of the n status codes.
+ */
+PyObject * batch_status_to_pyobject(const as_status * status, uint32_t n);
+
+/**
+ * Converts a list or tuple of key tuples into an array of *n keys, to be
+ * freed by batch_keys_destroy(). The keys borrow the strings of *py_seq, a
+ * tuple copy of py_keys the caller holds until the keys are destroyed. On
+ * error, nothing is left to free and *py_err_key is set to the offending
+ * key.
+ */
+as_status batch_keys_init(as_error * err, PyObject * py_keys, PyObject ** py_seq,
+		as_key ** keys, uint32_t * n, PyObject ** py_err_key);
+
+/**
+ * Destroys and frees an array of n keys.
+ */
+void batch_keys_destroy(as_key * keys, uint32_t n);
+
+/**
+ * Returns an instance of the exception matching err, not raised, with its
+ * key attribute set to py_key. Used for the per-key errors of the results
+ * of the *_many() methods.
+ */
+PyObject * batch_error_to_pyobject(as_error * err, PyObject * py_key);
@@ -18,6 +18,9 @@
 
 #include <Python.h>
 #include <stdbool.h>
+
+#include <aerospike/as_operations.h>
+
 #include "types.h"
 
 #define TRACE() printf("%s:%d\n",__FILE__,__LINE__)
@@ -38,6 +41,13 @@
 
 #define LUA_FILE_BUFFER_FRAME 512
 
+/*******************************************************************************
+ * Macros for async operations.
+ ******************************************************************************/
+
+// Default number of threads of a pool serving non-blocking requests
+#define AEROSPIKE_ASYNC_THREADS 8
+
 /*******************************************************************************
  * CLIENT TYPE
  ******************************************************************************/
@@ -68,6 +78,28 @@ PyObject * AerospikeClient_Close(AerospikeClient * self, PyObject * args, PyObje
  */
 PyObject * AerospikeClient_is_connected(AerospikeClient * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Returns the effective configuration of the client.
+ *
+ *		client.config()
+ *
+ */
+PyObject * AerospikeClient_Config(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Checks the client is connected in the current process. A client connected
+ * before a fork is reconnected on its first use in the child process, with
+ * its own cluster state. Must be called with the GIL.
+ */
+bool AerospikeClient_Connected(AerospikeClient * self);
+
+/**
+ * Drops the cluster state a connected client inherited from the parent
+ * process, without touching it, and leaves the client disconnected.
+ * Returns true if the client was inherited from the parent process.
+ */
+bool AerospikeClient_Detach_Fork(AerospikeClient * self);
+
 
 /*******************************************************************************
  * KVS OPERATIONS
@@ -184,6 +216,13 @@ PyObject * AerospikeClient_Touch(AerospikeClient * self, PyObject * args, PyObje
  */
 PyObject * AerospikeClient_Operate(AerospikeClient * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Converts a list of operations, as accepted by operate(), into
+ * as_operations. py_list may also be a tuple.
+ */
+as_status pyobject_to_operations(as_error * err, PyObject * py_list, PyObject * py_meta,
+		as_operations * ops, as_static_pool * static_pool, int serializer_type);
+
 /*******************************************************************************
  * KEY OPERATIONS (DEPRECATED)
  ******************************************************************************/
@@ -204,6 +243,68 @@ PyObject * AerospikeClient_Operate(AerospikeClient * self, PyObject * args, PyOb
  */
 AerospikeKey * AerospikeClient_Key(AerospikeClient * self, PyObject * args, PyObject * kwds);
 
+/*******************************************************************************
+ * ASYNC OPERATIONS
+ ******************************************************************************/
+
+/**
+ * Create an AsyncClient, which runs requests on a pool of native threads and
+ * invokes their callbacks from process(), typically from an event loop:
+ *
+ *		async_client = client.async_client(threads=8)
+ *		loop.add_reader(async_client.fileno(), async_client.process)
+ *		async_client.get((x,y,z), callback)
+ *
+ */
+AerospikeAsyncClient * AerospikeClient_Async_Client(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Read a record on a thread of the client's pool.
+ *
+ *		future = client.get_async((x,y,z))
+ *		(key, meta, bins) = future.result()
+ *
+ */
+PyObject * AerospikeClient_Get_Async(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Write a record on a thread of the client's pool.
+ *
+ *		client.put_async((x,y,z), bins).result()
+ *
+ */
+PyObject * AerospikeClient_Put_Async(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Perform multiple operations on a record on a thread of the client's pool.
+ *
+ *		client.operate_async((x,y,z), [ops]).result()
+ *
+ */
+PyObject * AerospikeClient_Operate_Async(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Read a batch of records on a thread of the client's pool.
+ *
+ *		client.get_many_async([keys]).result()
+ *
+ */
+PyObject * AerospikeClient_Get_Many_Async(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Returns the pool of the client, serving the *_async() methods and the
+ * concurrent requests of the *_many() methods, starting it on first use.
+ * Returns NULL and populates err on failure.
+ */
+ThreadPool * AerospikeClient_Async_Pool(AerospikeClient * self, as_error * err);
+
+/**
+ * Wait for the requests of the *_async() methods and stop the threads of the
+ * client's pool, if it was started. Must be called with the GIL, which is
+ * released while waiting.
+ */
+void AerospikeClient_Async_Pool_Destroy(AerospikeClient * self);
+
 /*******************************************************************************
  * SCAN OPERATIONS
  ******************************************************************************/
@@ -418,7 +519,8 @@ AerospikeLMap * AerospikeClient_LMap(AerospikeClient * self, PyObject * args, Py
 /**
  * Get records in a batch
  *
- *		client.get_many([keys], policies)
+ *		client.get_many([keys], policies, options)
+ *		client.get_many(ns, set, int64_keys, policies, options)
  *
  */
 PyObject * AerospikeClient_Get_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
@@ -438,6 +540,38 @@ PyObject * AerospikeClient_Select_Many(AerospikeClient * self, PyObject *args, P
  *
  */
 PyObject * AerospikeClient_Exists_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Write records concurrently, returning the status of each write
+ *
+ *		client.put_many([(key, bins, meta)], policies)
+ *
+ */
+PyObject * AerospikeClient_Put_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Remove records concurrently, returning the status of each remove
+ *
+ *		client.remove_many([keys], policies)
+ *
+ */
+PyObject * AerospikeClient_Remove_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Perform the same operations on many records concurrently
+ *
+ *		client.operate_many([keys], [operations], meta, policies)
+ *
+ */
+PyObject * AerospikeClient_Operate_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Apply a record UDF to many records concurrently
+ *
+ *		client.apply_many([keys], module, function, [args], policies)
+ *
+ */
+PyObject * AerospikeClient_Apply_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
 /**
 * Perform info operation on the database.
 *
@@ -460,3 +594,11 @@ PyObject * AerospikeClient_GetNodes(AerospikeClient * self, PyObject * args, PyO
 *
 */
 PyObject * AerospikeClient_Get_Key_Digest(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
+/**
+* Compute the digests of many keys of a set into contiguous bytes.
+*
+* client.get_key_digest_many(ns, set, [keys])
+*
+*/
+PyObject * AerospikeClient_Get_Key_Digest_Many(AerospikeClient * self, PyObject * args, PyObject * kwds);
@@ -18,6 +18,7 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
 
 #include <aerospike/as_admin.h>
 #include <aerospike/as_key.h>
@@ -62,12 +63,44 @@ as_status list_to_pyobject(as_error * err, const as_list * list, PyObject ** py_
 
 as_status record_to_pyobject(as_error * err, const as_record * rec, const as_key * key, PyObject ** obj);
 
+/**
+ * Builds the (key, meta, bins) tuple of rec, stealing the reference to
+ * py_rec_key.
+ */
+as_status record_with_key_to_pyobject(as_error * err, const as_record * rec, PyObject * py_rec_key, PyObject ** obj);
+
 as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj);
 
+/**
+ * Same as key_to_pyobject(), reusing the py_ns and py_set_name strings
+ * rather than converting those of the key when they are not NULL, and
+ * returning the digest as an immutable str rather than a bytearray when
+ * digest_bytes is set.
+ */
+as_status key_to_pyobject_cached(as_error * err, const as_key * key, PyObject * py_ns, PyObject * py_set_name, bool digest_bytes, PyObject ** obj);
+
 as_status metadata_to_pyobject(as_error * err, const as_record * rec, PyObject ** obj);
 
 as_status bins_to_pyobject(as_error * err, const as_record * rec, PyObject ** obj);
 
+/**
+ * Returns a new reference to the interned Python string of a bin name,
+ * from a cache of the recently converted names. Must be called with the
+ * GIL held.
+ */
+PyObject * bin_name_to_pyobject(const char * name);
+
+/**
+ * Keeps py_uobj, a new reference, in u_objs until unicode_objects_destroy()
+ * and returns it.
+ */
+PyObject * unicode_objects_add(UnicodePyObjects * u_objs, PyObject * py_uobj);
+
+/**
+ * Releases the objects kept in u_objs and its storage.
+ */
+void unicode_objects_destroy(UnicodePyObjects * u_objs);
+
 bool error_to_pyobject(const as_error * err, PyObject ** obj);
 
 void initialize_ldt(as_error *error, as_ldt* ldt_p, char* bin_name, int type, char* module);
@@ -82,3 +115,19 @@ as_status as_role_to_pyobject( as_error * err, as_role * role, PyObject ** py_as
 as_status as_role_array_to_pyobject( as_error *err, as_role **roles, PyObject **py_as_roles, int roles_size );
 
 void pyobject_to_as_privileges(as_error *err, PyObject *py_privileges, as_privilege** privileges, int privileges_size);
+
+/**
+ * A read-only view of an int64 array supporting the buffer protocol, such
+ * as a numpy.ndarray of dtype int64 or an array.array('l') of a 64 bit
+ * platform. The values stay valid until int64_buffer_release().
+ */
+typedef struct {
+	const int64_t * values;
+	Py_ssize_t size;
+	Py_buffer view;
+	bool has_view;
+} Int64Buffer;
+
+as_status pyobject_to_int64_buffer(as_error * err, PyObject * py_obj, Int64Buffer * buffer);
+
+void int64_buffer_release(Int64Buffer * buffer);
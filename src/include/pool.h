@@ -7,24 +7,124 @@
  * 3. Pool for Strings
  * 4. Pool for Integers
  * 5. Pool for Bytes
+ *
+ * The first AS_STATIC_POOL_SIZE as_bytes are held by the pool itself, which
+ * is enough for most records. Past those, chunks of doubling size are
+ * allocated on demand. The as_bytes never move, as the records and lists
+ * point to them, so the pool grows by chunks rather than by reallocating.
+ *
+ * Strings are borrowed from the Python objects by default. A pool whose
+ * values are sent after the GIL is released, or after the call returns,
+ * sets copy_strings so that they are copied instead.
  *******************************************************************************************************
  */
-#define AS_MAX_STORE_SIZE 1024
+#pragma once
+
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+
+#define AS_STATIC_POOL_SIZE 16
+
+typedef struct bytes_static_pool_chunk {
+    struct bytes_static_pool_chunk * next;
+    u_int32_t        capacity;
+    as_bytes         bytes_pool[];
+} as_static_pool_chunk;
 
 typedef struct bytes_static_pool {
-    as_bytes         bytes_pool[AS_MAX_STORE_SIZE];
+    as_bytes         bytes_pool[AS_STATIC_POOL_SIZE];
     u_int32_t        current_bytes_id;
+    // Newest chunk first, and the number of its as_bytes handed out
+    as_static_pool_chunk * chunks;
+    u_int32_t        chunk_bytes_id;
+    // Copy str and bytearray buffers rather than borrowing them
+    bool             copy_strings;
 } as_static_pool;
 
 #define BYTES_CNT(static_pool)                                                 \
     (((as_static_pool *)static_pool)->current_bytes_id)
 
-#define BYTES_POOL(static_pool)                                                \
-    ((as_static_pool *)static_pool)->bytes_pool
+#define POOL_COPIES_STRINGS(static_pool)                                       \
+    ((static_pool) && ((as_static_pool *)static_pool)->copy_strings)
 
 #define GET_BYTES_POOL(map_bytes, static_pool, err)                            \
-    if (AS_MAX_STORE_SIZE > BYTES_CNT(static_pool)) {                          \
-        map_bytes = &(BYTES_POOL(static_pool)[BYTES_CNT(static_pool)++]);      \
-    } else {                                                                   \
+    if ((map_bytes = as_static_pool_get((as_static_pool *)static_pool)) == NULL) { \
         as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");       \
     }
+
+/**
+ * Initialise an empty pool. Only the counters are set: the as_bytes are
+ * cleared as they are handed out.
+ */
+static inline void as_static_pool_init(as_static_pool * pool)
+{
+    pool->current_bytes_id = 0;
+    pool->chunks = NULL;
+    pool->chunk_bytes_id = 0;
+    pool->copy_strings = false;
+}
+
+/**
+ * Hand out the next as_bytes of the pool, allocating a new chunk when the
+ * current one is full. Returns NULL on allocation failure.
+ */
+static inline as_bytes * as_static_pool_get(as_static_pool * pool)
+{
+    as_bytes * bytes = NULL;
+
+    if (pool->current_bytes_id < AS_STATIC_POOL_SIZE) {
+        bytes = &pool->bytes_pool[pool->current_bytes_id];
+    }
+    else {
+        as_static_pool_chunk * chunk = pool->chunks;
+        if (chunk == NULL || pool->chunk_bytes_id == chunk->capacity) {
+            u_int32_t capacity = chunk ? chunk->capacity * 2 : AS_STATIC_POOL_SIZE * 2;
+            chunk = (as_static_pool_chunk *) malloc(sizeof(as_static_pool_chunk) +
+                    sizeof(as_bytes) * capacity);
+            if (chunk == NULL) {
+                return NULL;
+            }
+            chunk->next = pool->chunks;
+            chunk->capacity = capacity;
+            pool->chunks = chunk;
+            pool->chunk_bytes_id = 0;
+        }
+        bytes = &chunk->bytes_pool[pool->chunk_bytes_id++];
+    }
+
+    pool->current_bytes_id++;
+    memset(bytes, 0, sizeof(as_bytes));
+    return bytes;
+}
+
+/**
+ * Destroy the as_bytes handed out by the pool and free its chunks, once
+ * the records and lists pointing to them are destroyed. Destroying an
+ * as_bytes already released by its container is a no-op.
+ */
+static inline void as_static_pool_destroy(as_static_pool * pool)
+{
+    u_int32_t inline_cnt = pool->current_bytes_id < AS_STATIC_POOL_SIZE ?
+        pool->current_bytes_id : AS_STATIC_POOL_SIZE;
+
+    for (u_int32_t i = 0; i < inline_cnt; i++) {
+        as_bytes_destroy(&pool->bytes_pool[i]);
+    }
+
+    u_int32_t used = pool->chunk_bytes_id;
+    as_static_pool_chunk * chunk = pool->chunks;
+    while (chunk) {
+        as_static_pool_chunk * next = chunk->next;
+        for (u_int32_t i = 0; i < used; i++) {
+            as_bytes_destroy(&chunk->bytes_pool[i]);
+        }
+        free(chunk);
+        chunk = next;
+        used = chunk ? chunk->capacity : 0;
+    }
+
+    as_static_pool_init(pool);
+}
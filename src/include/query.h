@@ -86,6 +86,17 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
  */
 PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Execute the query and return an iterator over its results. At most
+ * queue_size results are buffered: the query is throttled while the
+ * consumer is slower than the server.
+ *
+ *		for result in query.iter():
+ *			print result
+ *
+ */
+PyObject * AerospikeQuery_Iter(AerospikeQuery * self, PyObject * args, PyObject * kwds);
+
 /**
  * Store the Unicode -> UTF8 string converted PyObject into 
  * a pool of PyObjects. So that, they will be decref'ed at later stages
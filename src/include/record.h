@@ -0,0 +1,38 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeRecord_Ready(void);
+
+/**
+ * Create a record over rec, taking ownership of rec and of the reference to
+ * py_key. The bins of rec are only converted to Python objects when they
+ * are accessed. Returns NULL and sets a Python exception on failure, in
+ * which case rec and py_key are released.
+ */
+PyObject * AerospikeRecord_New(as_record * rec, PyObject * py_key);
@@ -0,0 +1,129 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+/*******************************************************************************
+ * RESULT CONVERSION
+ ******************************************************************************/
+
+/**
+ * Options of the conversion of the records of a scan or query.
+ */
+typedef struct {
+	bool nokey;
+	bool digest_bytes;
+	bool lazy_bins;
+} ResultOptions;
+
+/**
+ * Converts the results of a scan or query. The namespace and set strings
+ * of the keys are kept for the life of the scan or query and shared by all
+ * the records, rather than converted for each one.
+ */
+typedef struct {
+	ResultOptions options;
+	PyObject * py_ns;
+	PyObject * py_set;
+} ResultConverter;
+
+/**
+ * Read the 'nokey', 'digest_bytes' and 'lazy_bins' options of a scan or
+ * query from the py_options dict, leaving its other keys to the caller.
+ * None means the defaults.
+ */
+as_status pyobject_to_result_options(as_error * err, PyObject * py_options, ResultOptions * options);
+
+/**
+ * Initialize a result converter applying options.
+ */
+void result_converter_init(ResultConverter * conv, const ResultOptions * options);
+
+/**
+ * Convert a result of a scan or query. Must be called with the GIL.
+ */
+as_status result_to_pyobject(as_error * err, ResultConverter * conv, const as_val * val, PyObject ** obj);
+
+/**
+ * Release the strings cached by the converter. Must be called with the GIL.
+ */
+void result_converter_destroy(ResultConverter * conv);
+
+/*******************************************************************************
+ * RESULT BUFFER
+ ******************************************************************************/
+
+/**
+ * Results buffered by one of the threads of a scan or query.
+ */
+typedef struct ResultBufferThread_s {
+	pthread_t thread;
+	as_val ** vals;
+	uint32_t size;
+	struct ResultBufferThread_s * next;
+} ResultBufferThread;
+
+/**
+ * Delivers the results of a scan or query to a Python callback in lists of
+ * batch_size values. Each thread of the C client fills its own buffer
+ * without the GIL, which is only taken once per batch to convert the values
+ * and invoke the callback.
+ */
+typedef struct {
+	PyObject * callback;
+	ResultConverter * converter;
+	uint32_t batch_size;
+	pthread_mutex_t lock;
+	ResultBufferThread * threads;
+	bool stop;
+} ResultBuffer;
+
+/**
+ * Copy a result of a scan or query so that it outlives the callback it was
+ * passed to. Records are copied, other values are reserved.
+ */
+as_val * result_value_copy(const as_val * val);
+
+/**
+ * Initialize a result buffer delivering to py_callback the results converted
+ * by converter.
+ */
+void result_buffer_init(ResultBuffer * buffer, PyObject * py_callback, ResultConverter * converter, uint32_t batch_size);
+
+/**
+ * Buffer a value for the calling thread, delivering the buffer once it is
+ * full. Called without the GIL. Returns false once the callback asked to
+ * stop or failed, setting err in the latter case.
+ */
+bool result_buffer_add(ResultBuffer * buffer, as_error * err, const as_val * val);
+
+/**
+ * Deliver the values left in the buffers of all the threads. Must be called
+ * with the GIL, once the scan or query has returned.
+ */
+bool result_buffer_flush(ResultBuffer * buffer, as_error * err);
+
+/**
+ * Release the buffers and any value left in them.
+ */
+void result_buffer_destroy(ResultBuffer * buffer);
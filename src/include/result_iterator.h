@@ -0,0 +1,64 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include "types.h"
+
+// Default number of results buffered between the scan threads and Python
+#define RESULT_ITERATOR_QUEUE_SIZE 1024
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeResultIterator_Ready(void);
+
+/**
+ * Create an iterator over the results of a scan or query owned by owner,
+ * buffering at most queue_size results. The caller converts the policy into
+ * the policy of the iterator, sets the scan or query, then calls
+ * AerospikeResultIterator_Start().
+ */
+AerospikeResultIterator * AerospikeResultIterator_New(AerospikeClient * client, PyObject * owner,
+		uint32_t queue_size);
+
+/**
+ * Give the iterator its own copy of the scan or query of the owner, so the
+ * owner can be changed or run again while the iterator runs. The query
+ * copy takes over the arguments of the aggregation, which are used once.
+ * Returns false if the copy cannot be allocated.
+ */
+bool AerospikeResultIterator_Set_Scan(AerospikeResultIterator * self, const as_scan * scan);
+
+bool AerospikeResultIterator_Set_Query(AerospikeResultIterator * self, as_query * query);
+
+/**
+ * Run the scan or query on a background thread. The threads of the C client
+ * block while the queue is full, which throttles the stream from the
+ * server. Returns false and sets a Python exception on failure.
+ */
+bool AerospikeResultIterator_Start(AerospikeResultIterator * self);
+
+/**
+ * Cancel the scan or query of every iterator of the client whose thread
+ * runs, and wait for the threads. The iterators then end with an error.
+ * Called by close() before the cluster goes away.
+ */
+void AerospikeResultIterator_Stop_All(AerospikeClient * client);
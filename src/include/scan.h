@@ -77,3 +77,14 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
  *
  */
 PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Execute the scan and return an iterator over its results. At most
+ * queue_size results are buffered: the scan is throttled while the consumer
+ * is slower than the server.
+ *
+ *    for result in scan.iter():
+ *      print result
+ *
+ */
+PyObject * AerospikeScan_Iter(AerospikeScan * self, PyObject * args, PyObject * kwds);
@@ -0,0 +1,62 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+/*******************************************************************************
+ * THREAD POOL
+ *
+ * A fixed-size pool of native threads. Tasks run without the GIL, so they
+ * must not touch Python objects.
+ ******************************************************************************/
+
+typedef void (* ThreadPoolTaskFn)(void * udata);
+
+typedef struct ThreadPoolTask_s {
+	ThreadPoolTaskFn run;
+	void * udata;
+	struct ThreadPoolTask_s * next;
+} ThreadPoolTask;
+
+typedef struct {
+	pthread_t * threads;
+	uint32_t size;
+	pthread_mutex_t lock;
+	pthread_cond_t cond;
+	ThreadPoolTask * head;
+	ThreadPoolTask * tail;
+	bool shutdown;
+} ThreadPool;
+
+/**
+ * Create a pool of size threads. Returns NULL on failure.
+ */
+ThreadPool * thread_pool_new(uint32_t size);
+
+/**
+ * Queue a task to be run by one of the threads of the pool.
+ */
+bool thread_pool_submit(ThreadPool * pool, ThreadPoolTaskFn run, void * udata);
+
+/**
+ * Run the queued tasks to completion, stop the threads and free the pool.
+ * Must be called without holding the GIL.
+ */
+void thread_pool_destroy(ThreadPool * pool);
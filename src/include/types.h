@@ -25,23 +25,56 @@
 #include <aerospike/as_scan.h>
 #include <aerospike/as_bin.h>
 #include <aerospike/as_ldt.h>
-#include "pool.h"
+#include <aerospike/as_policy.h>
+#include <aerospike/as_record.h>
+#include <pthread.h>
 
-// Bin names can be of type Unicode in Python
-// DB supports 32767 maximum number of bins
-#define MAX_UNICODE_OBJECTS 32767
+#include "pool.h"
+#include "result_buffer.h"
+#include "thread_pool.h"
 
+// Bin names can be of type Unicode in Python, the UTF-8 strings they are
+// encoded to are kept here while the C client points to them. Most bin names
+// are str, so the storage is only allocated, and grown, on demand. All zero
+// is the empty state.
 typedef struct {
-	PyObject *ob[MAX_UNICODE_OBJECTS];
+	PyObject **ob;
 	int size;
+	int capacity;
 } UnicodePyObjects;
 
+struct AerospikeResultIterator_s;
+
 typedef struct {
 	PyObject_HEAD
 	aerospike * as;
 	int is_conn_16;
+	ThreadPool * async_pool;
+	uint32_t async_threads;
+	// Requests of the AsyncClient objects of this client which are not
+	// processed yet, close() refuses to run while there are any
+	uint32_t async_pending;
+	// Iterators whose background thread runs, close() stops them
+	struct AerospikeResultIterator_s * iterators;
+	uint32_t batch_max_keys;
+	uint32_t batch_max_concurrent;
+	PyObject * py_config;
+	uint32_t fork_generation;
 } AerospikeClient;
 
+struct AsyncJob_s;
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient * client;
+	ThreadPool * pool;
+	pthread_mutex_t lock;
+	struct AsyncJob_s * completed;
+	struct AsyncJob_s * completed_tail;
+	int fds[2];
+	uint32_t pending;
+} AerospikeAsyncClient;
+
 typedef struct {
 	PyObject_HEAD
 	AerospikeClient * client;
@@ -64,6 +97,51 @@ typedef struct {
   as_scan scan;
 } AerospikeScan;
 
+typedef struct AerospikeResultIterator_s {
+	PyObject_HEAD
+	AerospikeClient * client;
+	struct AerospikeResultIterator_s * next;
+	PyObject * owner;
+	// Point to the iterator's own copy of the scan or query of the owner,
+	// which can be changed or run again while the thread runs
+	as_scan * scan;
+	as_query * query;
+	union {
+		as_scan scan;
+		as_query query;
+	} copy;
+	union {
+		as_policy_scan scan;
+		as_policy_query query;
+	} policy;
+	void * policy_p;
+	pthread_t thread;
+	bool thread_started;
+	pthread_mutex_t lock;
+	pthread_cond_t not_empty;
+	pthread_cond_t not_full;
+	as_val ** queue;
+	uint32_t capacity;
+	uint32_t head;
+	uint32_t size;
+	bool done;
+	bool cancelled;
+	bool failed;
+	as_error err;
+	ResultConverter converter;
+} AerospikeResultIterator;
+
+typedef struct {
+	PyObject_HEAD
+	as_record * rec;
+	uint16_t gen;
+	uint32_t ttl;
+	PyObject * key;
+	PyObject * meta;
+	PyObject * bins;
+	PyObject ** values;
+} AerospikeRecord;
+
 typedef struct {
     PyObject_HEAD
     AerospikeClient * client;
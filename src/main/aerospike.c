@@ -19,10 +19,13 @@
 #include <stdint.h>
 #include <string.h>
 
+#include "async.h"
 #include "client.h"
 #include "key.h"
 #include "query.h"
 #include "scan.h"
+#include "record.h"
+#include "result_iterator.h"
 #include "predicates.h"
 #include "exceptions.h"
 #include "lstack.h"
@@ -102,6 +105,18 @@ PyMODINIT_FUNC initaerospike(void)
 	Py_INCREF(scan);
 	PyModule_AddObject(aerospike, "Scan", (PyObject *) scan);
 
+	PyTypeObject * async_client = AerospikeAsyncClient_Ready();
+	Py_INCREF(async_client);
+	PyModule_AddObject(aerospike, "AsyncClient", (PyObject *) async_client);
+
+	PyTypeObject * result_iterator = AerospikeResultIterator_Ready();
+	Py_INCREF(result_iterator);
+	PyModule_AddObject(aerospike, "ResultIterator", (PyObject *) result_iterator);
+
+	PyTypeObject * record = AerospikeRecord_Ready();
+	Py_INCREF(record);
+	PyModule_AddObject(aerospike, "Record", (PyObject *) record);
+
 	for (i = 0; i <= OPERATOR_CONSTANTS_ARR_SIZE; i++) {
 		PyModule_AddIntConstant(aerospike,
 				operator_constants[i].constant_str,
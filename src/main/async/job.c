@@ -0,0 +1,458 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "async.h"
+#include "batch.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "key.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Hand a finished job back to its owner and wake up whoever is waiting on
+ * the completion file descriptor. Called from the threads of the pool.
+ *
+ * @param job                   The finished job.
+ *******************************************************************************************************
+ */
+static void async_job_complete(AsyncJob * job)
+{
+	AerospikeAsyncClient * owner = job->owner;
+
+	job->next = NULL;
+
+	pthread_mutex_lock(&owner->lock);
+	if ( owner->completed_tail ) {
+		owner->completed_tail->next = job;
+	}
+	else {
+		owner->completed = job;
+	}
+	owner->completed_tail = job;
+	pthread_mutex_unlock(&owner->lock);
+
+	// The pipe is non-blocking: if it is full, it is readable anyway
+	char signal = 1;
+	if ( write(owner->fds[1], &signal, 1) < 0 ) {
+		// Nothing to do, the reader will find the job on its next wake up
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Resolve the future of a finished job and release the job. Called from the
+ * threads of the pool, which only take the GIL for this step.
+ *
+ * @param job                   The finished job.
+ *******************************************************************************************************
+ */
+static void async_job_resolve(AsyncJob * job)
+{
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	PyObject * py_ret = NULL;
+	PyObject * py_result = async_job_result(job);
+
+	if ( py_result ) {
+		py_ret = PyObject_CallMethod(job->py_future, "set_result", "O", py_result);
+		Py_DECREF(py_result);
+	}
+	else {
+		PyObject * py_exc_type = NULL;
+		PyObject * py_exc = NULL;
+		PyObject * py_exc_tb = NULL;
+		PyErr_Fetch(&py_exc_type, &py_exc, &py_exc_tb);
+		PyErr_NormalizeException(&py_exc_type, &py_exc, &py_exc_tb);
+		py_ret = PyObject_CallMethod(job->py_future, "set_exception", "O", py_exc);
+		Py_XDECREF(py_exc_type);
+		Py_XDECREF(py_exc);
+		Py_XDECREF(py_exc_tb);
+	}
+
+	// Done callbacks run within set_result(), their errors are only reported
+	if ( py_ret == NULL ) {
+		PyErr_WriteUnraisable(job->py_future);
+	}
+	else {
+		Py_DECREF(py_ret);
+	}
+
+	async_job_destroy(job);
+
+	PyGILState_Release(gstate);
+}
+
+/**
+ *******************************************************************************************************
+ * Execute the request of a job. Runs on a thread of the pool, without the
+ * GIL.
+ *
+ * @param udata                 The AsyncJob to execute.
+ *******************************************************************************************************
+ */
+static void async_job_run(void * udata)
+{
+	AsyncJob * job = (AsyncJob *) udata;
+	aerospike * as = job->client->as;
+
+	switch ( job->type ) {
+		case ASYNC_GET:
+			aerospike_key_get(as, &job->err, (as_policy_read *) job->policy_p,
+					&job->key, &job->result);
+			break;
+		case ASYNC_PUT:
+			aerospike_key_put(as, &job->err, (as_policy_write *) job->policy_p,
+					&job->key, &job->rec);
+			break;
+		case ASYNC_OPERATE:
+			aerospike_key_operate(as, &job->err, (as_policy_operate *) job->policy_p,
+					&job->key, &job->ops, &job->result);
+			break;
+		case ASYNC_GET_MANY:
+			aerospike_batch_get(as, &job->err, (as_policy_batch *) job->policy_p,
+					&job->batch, (aerospike_batch_read_callback) batch_read_results_collect,
+					&job->batch_results);
+			break;
+	}
+
+	if ( job->owner ) {
+		async_job_complete(job);
+	}
+	else {
+		async_job_resolve(job);
+	}
+}
+
+AsyncJob * async_job_new(AerospikeClient * client, AerospikeAsyncClient * owner,
+		AsyncJobType type, PyObject * py_key, PyObject * py_data, PyObject * py_callback)
+{
+	AsyncJob * job = (AsyncJob *) calloc(1, sizeof(AsyncJob));
+	if ( job == NULL ) {
+		PyErr_NoMemory();
+		return NULL;
+	}
+
+	job->type = type;
+	job->client = client;
+	job->owner = owner;
+	as_error_init(&job->err);
+	batch_read_results_init(&job->batch_results);
+
+	// The client is not referenced: it waits for the jobs of its pool when
+	// it is closed or deallocated, and an owner references it already.
+	Py_XINCREF(owner);
+	job->py_key = py_key;
+	Py_XINCREF(py_key);
+	job->py_data = py_data;
+	Py_XINCREF(py_data);
+	job->py_callback = py_callback;
+	Py_XINCREF(py_callback);
+
+	return job;
+}
+
+bool async_job_submit(AsyncJob * job, ThreadPool * pool)
+{
+	AerospikeAsyncClient * owner = job->owner;
+
+	if ( pool == NULL || ! thread_pool_submit(pool, async_job_run, job) ) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to queue the request");
+		async_job_raise(&err, job, NULL);
+		return false;
+	}
+
+	if ( owner ) {
+		owner->pending++;
+		job->client->async_pending++;
+	}
+	return true;
+}
+
+as_status async_job_prepare_get(AsyncJob * job, as_error * err, PyObject * py_policy)
+{
+	// Convert python key object to as_key
+	if ( pyobject_to_key(err, job->py_key, &job->key) != AEROSPIKE_OK ) {
+		return err->code;
+	}
+	job->key_initialised = true;
+
+	// Convert python policy object to as_policy_read
+	as_policy_read * read_policy_p = NULL;
+	pyobject_to_policy_read(err, py_policy, &job->policy.read, &read_policy_p,
+			&job->client->as->config.policies.read);
+	job->policy_p = read_policy_p;
+
+	return err->code;
+}
+
+as_status async_job_prepare_put(AsyncJob * job, as_error * err, PyObject * py_meta,
+		PyObject * py_policy, long serializer_option)
+{
+	job->static_pool = (as_static_pool *) calloc(1, sizeof(as_static_pool));
+	if ( job->static_pool == NULL ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+	// The request is sent after this call returns: copy the strings rather
+	// than borrowing them from bins the caller may change in the meantime
+	job->static_pool->copy_strings = true;
+
+	// Convert python key object to as_key
+	if ( pyobject_to_key(err, job->py_key, &job->key) != AEROSPIKE_OK ) {
+		return err->code;
+	}
+	job->key_initialised = true;
+
+	// Convert python bins and metadata objects to as_record
+	as_record_init(&job->rec, 0);
+	job->rec_initialised = true;
+	pyobject_to_record(err, job->py_data, py_meta, &job->rec, serializer_option,
+			job->static_pool);
+	if ( err->code != AEROSPIKE_OK ) {
+		return err->code;
+	}
+
+	// Convert python policy object to as_policy_write
+	as_policy_write * write_policy_p = NULL;
+	pyobject_to_policy_write(err, py_policy, &job->policy.write, &write_policy_p,
+			&job->client->as->config.policies.write);
+	job->policy_p = write_policy_p;
+
+	return err->code;
+}
+
+as_status async_job_prepare_operate(AsyncJob * job, as_error * err, PyObject * py_meta,
+		PyObject * py_policy)
+{
+	if ( !PyList_Check(job->py_data) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Operations should be of type list");
+	}
+
+	job->static_pool = (as_static_pool *) calloc(1, sizeof(as_static_pool));
+	if ( job->static_pool == NULL ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+	// The request is sent after this call returns: copy the strings rather
+	// than borrowing them from bins the caller may change in the meantime
+	job->static_pool->copy_strings = true;
+
+	// Convert python key object to as_key
+	if ( pyobject_to_key(err, job->py_key, &job->key) != AEROSPIKE_OK ) {
+		return err->code;
+	}
+	job->key_initialised = true;
+
+	// Convert python policy object to as_policy_operate
+	as_policy_operate * operate_policy_p = NULL;
+	pyobject_to_policy_operate(err, py_policy, &job->policy.operate, &operate_policy_p,
+			&job->client->as->config.policies.operate);
+	if ( err->code != AEROSPIKE_OK ) {
+		return err->code;
+	}
+	job->policy_p = operate_policy_p;
+
+	// Convert python operations to as_operations
+	as_operations_init(&job->ops, PyList_Size(job->py_data));
+	job->ops_initialised = true;
+	return pyobject_to_operations(err, job->py_data, py_meta, &job->ops,
+			job->static_pool, SERIALIZER_PYTHON);
+}
+
+as_status async_job_prepare_get_many(AsyncJob * job, as_error * err, PyObject * py_policy)
+{
+	// Keys can be specified in PyList or PyTuple
+	if ( !PyList_Check(job->py_data) && !PyTuple_Check(job->py_data) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Keys should be specified as a list or tuple.");
+	}
+
+	// The keys borrow the strings of the key tuples until the batch runs:
+	// the job holds a tuple copy of the keys rather than the list
+	PyObject * py_keys = PySequence_Tuple(job->py_data);
+	if ( py_keys == NULL ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+	Py_DECREF(job->py_data);
+	job->py_data = py_keys;
+
+	Py_ssize_t size = PyTuple_GET_SIZE(py_keys);
+	as_batch_init(&job->batch, size);
+	job->batch_initialised = true;
+
+	for ( int i = 0; i < size; i++ ) {
+		PyObject * py_key = PyTuple_GET_ITEM(py_keys, i);
+
+		if ( !PyTuple_Check(py_key) ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
+		}
+
+		if ( pyobject_to_key(err, py_key, as_batch_keyat(&job->batch, i)) != AEROSPIKE_OK ) {
+			return err->code;
+		}
+	}
+
+	// Convert python policy object to as_policy_batch
+	as_policy_batch * batch_policy_p = NULL;
+	pyobject_to_policy_batch(err, py_policy, &job->policy.batch, &batch_policy_p,
+			&job->client->as->config.policies.batch);
+	job->policy_p = batch_policy_p;
+
+	return err->code;
+}
+
+PyObject * async_job_raise(as_error * err, AsyncJob * job, PyObject * py_key)
+{
+	if ( job ) {
+		async_job_destroy(job);
+	}
+
+	if ( PyErr_Occurred() ) {
+		// A TypeError was raised while converting the arguments
+		return NULL;
+	}
+
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	if(PyObject_HasAttrString(exception_type, "key")) {
+		PyObject_SetAttrString(exception_type, "key", py_key ? py_key : Py_None);
+	}
+	if(PyObject_HasAttrString(exception_type, "bin")) {
+		PyObject_SetAttrString(exception_type, "bin", Py_None);
+	}
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	return NULL;
+}
+
+PyObject * async_job_result(AsyncJob * job)
+{
+	PyObject * py_result = NULL;
+	as_error * err = &job->err;
+
+	if ( err->code == AEROSPIKE_OK ) {
+		switch ( job->type ) {
+			case ASYNC_GET: {
+				as_policy_read * read_policy_p = (as_policy_read *) job->policy_p;
+				record_to_pyobject(err, job->result, &job->key, &py_result);
+				if ( read_policy_p == NULL || read_policy_p->key == AS_POLICY_KEY_DIGEST ) {
+					// Same as get(): the C client returns no primary key, so
+					// it is reported as None
+					PyObject * p_key = PyTuple_GetItem(py_result, 0);
+					Py_INCREF(Py_None);
+					PyTuple_SetItem(p_key, 2, Py_None);
+				}
+				break;
+			}
+			case ASYNC_PUT:
+				py_result = PyLong_FromLong(0);
+				break;
+			case ASYNC_OPERATE:
+				if ( job->result ) {
+					record_to_pyobject(err, job->result, &job->key, &py_result);
+				}
+				else {
+					py_result = PyLong_FromLong(0);
+				}
+				break;
+			case ASYNC_GET_MANY:
+				py_result = PyDict_New();
+				batch_get_to_pyobject(job->batch_results.results,
+						job->batch_results.size, py_result);
+				break;
+		}
+	}
+	else if ( err->code == AEROSPIKE_ERR_RECORD_NOT_FOUND && job->type == ASYNC_GET ) {
+		as_error_reset(err);
+
+		PyObject * py_rec_key = NULL;
+		key_to_pyobject(err, &job->key, &py_rec_key);
+
+		py_result = PyTuple_New(3);
+		PyTuple_SetItem(py_result, 0, py_rec_key);
+		Py_INCREF(Py_None);
+		PyTuple_SetItem(py_result, 1, Py_None);
+		Py_INCREF(Py_None);
+		PyTuple_SetItem(py_result, 2, Py_None);
+	}
+
+	if ( err->code != AEROSPIKE_OK ) {
+		if ( py_result ) {
+			Py_DECREF(py_result);
+		}
+		PyObject * py_err = NULL;
+		error_to_pyobject(err, &py_err);
+		PyObject *exception_type = raise_exception(err);
+		if(PyObject_HasAttrString(exception_type, "key")) {
+			PyObject_SetAttrString(exception_type, "key", job->py_key ? job->py_key : Py_None);
+		}
+		if(PyObject_HasAttrString(exception_type, "bin")) {
+			PyObject_SetAttrString(exception_type, "bin", Py_None);
+		}
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
+
+void async_job_destroy(AsyncJob * job)
+{
+	if ( job->rec_initialised ) {
+		as_record_destroy(&job->rec);
+	}
+	if ( job->ops_initialised ) {
+		as_operations_destroy(&job->ops);
+	}
+	if ( job->result ) {
+		as_record_destroy(job->result);
+	}
+	if ( job->static_pool ) {
+		// After the record and operations pointing into it
+		as_static_pool_destroy(job->static_pool);
+		free(job->static_pool);
+	}
+	if ( job->key_initialised ) {
+		as_key_destroy(&job->key);
+	}
+	batch_read_results_destroy(&job->batch_results);
+	if ( job->batch_initialised ) {
+		as_batch_destroy(&job->batch);
+	}
+
+	Py_XDECREF(job->py_key);
+	Py_XDECREF(job->py_data);
+	Py_XDECREF(job->py_callback);
+	Py_XDECREF(job->py_future);
+	Py_XDECREF(job->owner);
+
+	free(job);
+}
@@ -0,0 +1,281 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Validate the state of the async client and the callback of a request.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param py_callback           The callback of the request.
+ *
+ * Returns the status of the check.
+ *******************************************************************************************************
+ */
+static as_status async_client_check(AerospikeAsyncClient * self, as_error * err,
+		PyObject * py_callback)
+{
+	if ( !self || !self->client || !self->client->as ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+	}
+	if ( !AerospikeClient_Connected(self->client) ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+	}
+	if ( !self->pool ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "The async client is closed");
+	}
+	if ( !PyCallable_Check(py_callback) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Callback should be callable");
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Queues the read of a record.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None. The callback is invoked with the record from process().
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Get(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_callback = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "callback", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:get", kwlist,
+			&py_key, &py_callback, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( async_client_check(self, &err, py_callback) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self->client, self, ASYNC_GET, py_key, NULL, py_callback);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_get(job, &err, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	if ( ! async_job_submit(job, self->pool) ) {
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Queues the write of a record.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None. The callback is invoked with the status from process().
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Put(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_bins = NULL;
+	PyObject * py_callback = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "bins", "callback", "meta", "policy", "serializer_option", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OOl:put", kwlist,
+			&py_key, &py_bins, &py_callback, &py_meta, &py_policy, &serializer_option) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( async_client_check(self, &err, py_callback) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self->client, self, ASYNC_PUT, py_key, py_bins, py_callback);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_put(job, &err, py_meta, py_policy, serializer_option) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	if ( ! async_job_submit(job, self->pool) ) {
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Queues multiple operations on a single record.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None. The callback is invoked with the record, or 0 when no bins
+ * are read, from process().
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Operate(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_list = NULL;
+	PyObject * py_callback = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "list", "callback", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate", kwlist,
+			&py_key, &py_list, &py_callback, &py_meta, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( async_client_check(self, &err, py_callback) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self->client, self, ASYNC_OPERATE, py_key, py_list, py_callback);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_operate(job, &err, py_meta, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	if ( ! async_job_submit(job, self->pool) ) {
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Queues the read of a batch of records.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None. The callback is invoked with the dictionary of records, as
+ * returned by get_many(), from process().
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Get_Many(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_callback = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "callback", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:get_many", kwlist,
+			&py_keys, &py_callback, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( async_client_check(self, &err, py_callback) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, NULL);
+	}
+
+	job = async_job_new(self->client, self, ASYNC_GET_MANY, NULL, py_keys, py_callback);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_get_many(job, &err, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, NULL);
+	}
+
+	if ( ! async_job_submit(job, self->pool) ) {
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
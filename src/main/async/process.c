@@ -0,0 +1,190 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <pthread.h>
+#include <unistd.h>
+
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "thread_pool.h"
+
+/**
+ *******************************************************************************************************
+ * Convert the results of the completed jobs and invoke their callbacks as
+ * callback(result, exception). Exceptions raised by a callback are reported
+ * and do not stop the processing of the other completions.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param invoke_callbacks      Whether to invoke the callbacks.
+ *
+ * Returns the number of completions processed.
+ *******************************************************************************************************
+ */
+static long async_client_process(AerospikeAsyncClient * self, bool invoke_callbacks)
+{
+	long count = 0;
+
+	// Clear the wake up signals before taking the completions, so that a
+	// job completing afterwards makes the descriptor readable again
+	if ( self->fds[0] >= 0 ) {
+		char buf[256];
+		while ( read(self->fds[0], buf, sizeof(buf)) > 0 ) {
+		}
+	}
+
+	pthread_mutex_lock(&self->lock);
+	AsyncJob * job = self->completed;
+	self->completed = NULL;
+	self->completed_tail = NULL;
+	pthread_mutex_unlock(&self->lock);
+
+	while ( job ) {
+		AsyncJob * next = job->next;
+
+		if ( invoke_callbacks ) {
+			PyObject * py_result = async_job_result(job);
+			PyObject * py_exc_type = NULL;
+			PyObject * py_exc = NULL;
+			PyObject * py_exc_tb = NULL;
+
+			if ( py_result == NULL ) {
+				PyErr_Fetch(&py_exc_type, &py_exc, &py_exc_tb);
+				PyErr_NormalizeException(&py_exc_type, &py_exc, &py_exc_tb);
+				Py_INCREF(Py_None);
+				py_result = Py_None;
+			}
+
+			PyObject * py_ret = PyObject_CallFunctionObjArgs(job->py_callback,
+					py_result, py_exc ? py_exc : Py_None, NULL);
+			if ( py_ret == NULL ) {
+				PyErr_WriteUnraisable(job->py_callback);
+			}
+			else {
+				Py_DECREF(py_ret);
+			}
+
+			Py_DECREF(py_result);
+			Py_XDECREF(py_exc_type);
+			Py_XDECREF(py_exc);
+			Py_XDECREF(py_exc_tb);
+		}
+
+		self->pending--;
+		self->client->async_pending--;
+		async_job_destroy(job);
+		count++;
+
+		job = next;
+	}
+
+	return count;
+}
+
+void async_client_shutdown(AerospikeAsyncClient * self, bool invoke_callbacks)
+{
+	if ( self->pool ) {
+		ThreadPool * pool = self->pool;
+		self->pool = NULL;
+
+		// The threads never need the GIL, so they can be joined without it
+		Py_BEGIN_ALLOW_THREADS
+		thread_pool_destroy(pool);
+		Py_END_ALLOW_THREADS
+	}
+
+	async_client_process(self, invoke_callbacks);
+
+	for ( int i = 0; i < 2; i++ ) {
+		if ( self->fds[i] >= 0 ) {
+			close(self->fds[i]);
+			self->fds[i] = -1;
+		}
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Returns the file descriptor to watch for completions.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the file descriptor as an integer.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Fileno(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	if ( self->fds[0] < 0 ) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "The async client is closed");
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return PyInt_FromLong(self->fds[0]);
+}
+
+/**
+ *******************************************************************************************************
+ * Invokes the callbacks of the requests completed so far. Never blocks.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the number of callbacks invoked.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Process(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	return PyInt_FromLong(async_client_process(self, true));
+}
+
+/**
+ *******************************************************************************************************
+ * Waits for the outstanding requests, invokes their callbacks and stops the
+ * threads of the pool.
+ *
+ * @param self                  AerospikeAsyncClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAsyncClient_Close(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	async_client_shutdown(self, true);
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
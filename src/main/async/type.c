@@ -0,0 +1,223 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+#include <fcntl.h>
+#include <pthread.h>
+#include <unistd.h>
+
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "thread_pool.h"
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyMethodDef AerospikeAsyncClient_Type_Methods[] = {
+
+	{"get",			(PyCFunction) AerospikeAsyncClient_Get,			METH_VARARGS | METH_KEYWORDS,
+				"Read a record and pass it to the callback."},
+
+	{"put",			(PyCFunction) AerospikeAsyncClient_Put,			METH_VARARGS | METH_KEYWORDS,
+				"Write a record and pass the status to the callback."},
+
+	{"operate",		(PyCFunction) AerospikeAsyncClient_Operate,		METH_VARARGS | METH_KEYWORDS,
+				"Perform multiple operations on a record and pass the result to the callback."},
+
+	{"get_many",	(PyCFunction) AerospikeAsyncClient_Get_Many,	METH_VARARGS | METH_KEYWORDS,
+				"Read a batch of records and pass them to the callback."},
+
+	{"fileno",		(PyCFunction) AerospikeAsyncClient_Fileno,		METH_VARARGS | METH_KEYWORDS,
+				"File descriptor which becomes readable when requests complete."},
+
+	{"process",		(PyCFunction) AerospikeAsyncClient_Process,		METH_VARARGS | METH_KEYWORDS,
+				"Invoke the callbacks of the completed requests."},
+
+	{"close",		(PyCFunction) AerospikeAsyncClient_Close,		METH_VARARGS | METH_KEYWORDS,
+				"Wait for the outstanding requests and stop the worker threads."},
+	{NULL}
+};
+
+static PyMemberDef AerospikeAsyncClient_Type_Members[] = {
+
+	{"pending",		T_UINT,	offsetof(AerospikeAsyncClient, pending),	READONLY,
+				"Number of requests whose callback has not been invoked yet."},
+	{NULL}
+};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject * AerospikeAsyncClient_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+	AerospikeAsyncClient * self = NULL;
+
+	self = (AerospikeAsyncClient *) type->tp_alloc(type, 0);
+
+	if ( self == NULL ) {
+		return NULL;
+	}
+
+	self->fds[0] = -1;
+	self->fds[1] = -1;
+	pthread_mutex_init(&self->lock, NULL);
+
+	return (PyObject *) self;
+}
+
+static int AerospikeAsyncClient_Type_Init(AerospikeAsyncClient * self, PyObject * args, PyObject * kwds)
+{
+	long threads = AEROSPIKE_ASYNC_THREADS;
+
+	static char * kwlist[] = {"threads", NULL};
+
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|l:async_client", kwlist,
+		&threads) == false ) {
+		return -1;
+	}
+
+	if ( threads <= 0 ) {
+		return -1;
+	}
+
+	if ( pipe(self->fds) != 0 ) {
+		PyErr_SetFromErrno(PyExc_OSError);
+		return -1;
+	}
+
+	for ( int i = 0; i < 2; i++ ) {
+		fcntl(self->fds[i], F_SETFL, fcntl(self->fds[i], F_GETFL) | O_NONBLOCK);
+		fcntl(self->fds[i], F_SETFD, FD_CLOEXEC);
+	}
+
+	self->pool = thread_pool_new((uint32_t) threads);
+	if ( self->pool == NULL ) {
+		return -1;
+	}
+
+	return 0;
+}
+
+static void AerospikeAsyncClient_Type_Dealloc(PyObject * self)
+{
+	AerospikeAsyncClient * async_client = (AerospikeAsyncClient *) self;
+
+	// Every job holds a reference to the async client, so nothing is
+	// pending once it is deallocated.
+	async_client_shutdown(async_client, false);
+	pthread_mutex_destroy(&async_client->lock);
+
+	if ( async_client->client ) {
+		Py_DECREF(async_client->client);
+	}
+	self->ob_type->tp_free((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeAsyncClient_Type = {
+	PyObject_HEAD_INIT(NULL)
+
+    .ob_size			= 0,
+    .tp_name			= "aerospike.AsyncClient",
+    .tp_basicsize		= sizeof(AerospikeAsyncClient),
+    .tp_itemsize		= 0,
+    .tp_dealloc			= (destructor) AerospikeAsyncClient_Type_Dealloc,
+    .tp_print			= 0,
+    .tp_getattr			= 0,
+    .tp_setattr			= 0,
+    .tp_compare			= 0,
+    .tp_repr			= 0,
+    .tp_as_number		= 0,
+    .tp_as_sequence		= 0,
+    .tp_as_mapping		= 0,
+    .tp_hash			= 0,
+    .tp_call			= 0,
+    .tp_str				= 0,
+    .tp_getattro		= 0,
+    .tp_setattro		= 0,
+    .tp_as_buffer		= 0,
+    .tp_flags			= Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    .tp_doc				=
+    		"The AsyncClient class runs requests on a pool of native threads\n"
+    		"and invokes their callbacks from process(). To create a new\n"
+    		"instance of the AsyncClient class, call the async_client() method\n"
+    		"on an instance of a Client class.\n",
+    .tp_traverse		= 0,
+    .tp_clear			= 0,
+    .tp_richcompare		= 0,
+    .tp_weaklistoffset	= 0,
+    .tp_iter			= 0,
+    .tp_iternext		= 0,
+    .tp_methods			= AerospikeAsyncClient_Type_Methods,
+    .tp_members			= AerospikeAsyncClient_Type_Members,
+    .tp_getset			= 0,
+    .tp_base			= 0,
+    .tp_dict			= 0,
+    .tp_descr_get		= 0,
+    .tp_descr_set		= 0,
+    .tp_dictoffset		= 0,
+    .tp_init			= (initproc) AerospikeAsyncClient_Type_Init,
+    .tp_alloc			= 0,
+    .tp_new				= AerospikeAsyncClient_Type_New
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeAsyncClient_Ready()
+{
+	return PyType_Ready(&AerospikeAsyncClient_Type) == 0 ? &AerospikeAsyncClient_Type : NULL;
+}
+
+AerospikeAsyncClient * AerospikeAsyncClient_New(AerospikeClient * client, PyObject * args, PyObject * kwds)
+{
+	AerospikeAsyncClient * self = (AerospikeAsyncClient *) AerospikeAsyncClient_Type.tp_new(&AerospikeAsyncClient_Type, args, kwds);
+	if ( self == NULL ) {
+		return NULL;
+	}
+	self->client = client;
+	Py_INCREF(client);
+	if ( AerospikeAsyncClient_Type.tp_init((PyObject *) self, args, kwds) != -1 ) {
+		return self;
+	}
+	else {
+		Py_DECREF(self);
+		if ( PyErr_Occurred() ) {
+			return NULL;
+		}
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Parameters are incorrect");
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+}
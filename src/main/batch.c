@@ -0,0 +1,571 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_bin.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_integer.h>
+#include <aerospike/as_nil.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_string.h>
+
+#include "batch.h"
+#include "batch_dispatch.h"
+#include "client.h"
+#include "conversions.h"
+
+as_bin_value * bin_value_copy(const as_bin * bin)
+{
+	as_val * val = (as_val *) bin->valuep;
+
+	if ( val == NULL ) {
+		return (as_bin_value *) &as_nil;
+	}
+
+	if ( bin->valuep != &bin->value ) {
+		return (as_bin_value *) as_val_reserve(val);
+	}
+
+	switch( as_val_type(val) ) {
+		case AS_INTEGER:
+			return (as_bin_value *) as_integer_new(bin->value.integer.value);
+		case AS_STRING: {
+			char * str = strdup(bin->value.string.value);
+			if ( str == NULL ) {
+				return NULL;
+			}
+			return (as_bin_value *) as_string_new(str, true);
+		}
+		case AS_BYTES: {
+			const as_bytes * src = &bin->value.bytes;
+			uint8_t * value = (uint8_t *) malloc(src->size ? src->size : 1);
+			if ( value == NULL ) {
+				return NULL;
+			}
+			memcpy(value, src->value, src->size);
+			as_bytes * bytes = as_bytes_new_wrap(value, src->size, true);
+			bytes->type = src->type;
+			return (as_bin_value *) bytes;
+		}
+		default:
+			return (as_bin_value *) &as_nil;
+	}
+}
+
+as_status batch_int64_keys_init(as_error * err, PyObject * py_ns, PyObject * py_set,
+		PyObject * py_keys, as_batch * batch)
+{
+	as_error_reset(err);
+
+	if ( ! PyString_Check(py_ns) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "namespace must be a string");
+	}
+	const char * ns = PyString_AsString(py_ns);
+
+	const char * set = NULL;
+	PyObject * py_ustr = NULL;
+	if ( PyUnicode_Check(py_set) ) {
+		py_ustr = PyUnicode_AsUTF8String(py_set);
+		set = PyString_AsString(py_ustr);
+	}
+	else if ( PyString_Check(py_set) ) {
+		set = PyString_AsString(py_set);
+	}
+	else if ( py_set != Py_None ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "set must be a string");
+	}
+
+	Int64Buffer keys;
+	if ( pyobject_to_int64_buffer(err, py_keys, &keys) != AEROSPIKE_OK ) {
+		Py_XDECREF(py_ustr);
+		return err->code;
+	}
+
+	as_batch_init(batch, (uint32_t) keys.size);
+
+	// An array.array exported through the old buffer protocol can still be
+	// resized, so the GIL is only released for a locked buffer view
+	PyThreadState * _save = keys.has_view ? PyEval_SaveThread() : NULL;
+
+	for ( Py_ssize_t i = 0; i < keys.size; i++ ) {
+		as_key * key = as_batch_keyat(batch, (uint32_t) i);
+		as_key_init_int64(key, ns, set, keys.values[i]);
+		as_key_digest(key);
+	}
+
+	if ( _save ) {
+		PyEval_RestoreThread(_save);
+	}
+
+	int64_buffer_release(&keys);
+	Py_XDECREF(py_ustr);
+
+	return err->code;
+}
+
+as_status pyobject_to_batch_read_options(as_error * err, PyObject * py_options, BatchReadOptions * options)
+{
+	as_error_reset(err);
+
+	options->ordered = false;
+	options->output = BATCH_READ_OUTPUT_RECORDS;
+
+	if ( py_options == NULL || py_options == Py_None ) {
+		return err->code;
+	}
+
+	if ( !PyDict_Check(py_options) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid option(type)");
+	}
+
+	PyObject * key = NULL, * value = NULL;
+	Py_ssize_t pos = 0;
+
+	while ( PyDict_Next(py_options, &pos, &key, &value) ) {
+		if ( !PyString_Check(key) ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Option key must be string");
+		}
+
+		char * key_name = PyString_AsString(key);
+
+		if ( strcmp("ordered", key_name) == 0 ) {
+			if ( !PyBool_Check(value) ) {
+				return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value(type) for ordered");
+			}
+			options->ordered = value == Py_True;
+		}
+		else if ( strcmp("output", key_name) == 0 ) {
+			if ( !PyString_Check(value) ) {
+				return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value(type) for output");
+			}
+
+			const char * output = PyString_AsString(value);
+			if ( strcmp("records", output) == 0 ) {
+				options->output = BATCH_READ_OUTPUT_RECORDS;
+			}
+			else if ( strcmp("bitmap", output) == 0 ) {
+				options->output = BATCH_READ_OUTPUT_BITMAP;
+			}
+			else if ( strcmp("arrays", output) == 0 ) {
+				options->output = BATCH_READ_OUTPUT_ARRAYS;
+			}
+			else if ( strcmp("columns", output) == 0 ) {
+				options->output = BATCH_READ_OUTPUT_COLUMNS;
+			}
+			else {
+				return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value for output");
+			}
+		}
+		else {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value for batch options");
+		}
+	}
+
+	return err->code;
+}
+
+/**
+ * Read an optional non-negative integer field of a policy dict.
+ */
+static as_status batch_policy_uint32(as_error * err, PyObject * py_policy,
+		const char * name, uint32_t * value)
+{
+	PyObject * py_value = PyDict_GetItemString(py_policy, name);
+
+	if ( py_value ) {
+		long l = -1;
+		if ( PyInt_Check(py_value) ) {
+			l = PyInt_AsLong(py_value);
+		}
+		else if ( PyLong_Check(py_value) ) {
+			l = PyLong_AsLong(py_value);
+			if ( PyErr_Occurred() ) {
+				PyErr_Clear();
+				l = -1;
+			}
+		}
+		if ( l < 0 || (unsigned long) l > UINT32_MAX ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "%s is invalid", name);
+		}
+		*value = (uint32_t) l;
+	}
+
+	return err->code;
+}
+
+as_status batch_read_chunking_init(as_error * err, AerospikeClient * self,
+		PyObject * py_policy, uint32_t n, BatchReadChunking * chunking)
+{
+	as_error_reset(err);
+
+	chunking->max_keys = self->batch_max_keys;
+	chunking->max_concurrent = self->batch_max_concurrent;
+	chunking->pool = NULL;
+
+	if ( py_policy && PyDict_Check(py_policy) ) {
+		if ( batch_policy_uint32(err, py_policy, "max_keys", &chunking->max_keys) != AEROSPIKE_OK ||
+				batch_policy_uint32(err, py_policy, "max_concurrent", &chunking->max_concurrent) != AEROSPIKE_OK ) {
+			return err->code;
+		}
+	}
+
+	// By default, every thread of the async pool takes part
+	if ( chunking->max_concurrent == 0 ) {
+		chunking->max_concurrent = self->async_threads + 1;
+	}
+
+	if ( chunking->max_keys && n > chunking->max_keys && chunking->max_concurrent > 1 ) {
+		chunking->pool = AerospikeClient_Async_Pool(self, err);
+	}
+
+	return err->code;
+}
+
+void batch_read_results_init(BatchReadResults * data)
+{
+	data->results = NULL;
+	data->size = 0;
+}
+
+/**
+ * Copy the result of a batch read into dst, for the given key. The record
+ * of dst is initialized even if the copy fails, so it can be destroyed.
+ */
+static bool batch_read_copy(const as_batch_read * src, as_batch_read * dst, const as_key * key)
+{
+	dst->key = key;
+	dst->result = src->result;
+	as_record_init(&dst->record, src->result == AEROSPIKE_OK ? src->record.bins.size : 0);
+
+	if ( src->result != AEROSPIKE_OK ) {
+		return true;
+	}
+
+	dst->record.gen = src->record.gen;
+	dst->record.ttl = src->record.ttl;
+
+	for ( uint16_t j = 0; j < src->record.bins.size; j++ ) {
+		const as_bin * bin = &src->record.bins.entries[j];
+		as_bin_value * value = bin_value_copy(bin);
+		if ( value == NULL ) {
+			return false;
+		}
+		as_record_set(&dst->record, bin->name, value);
+	}
+
+	return true;
+}
+
+bool batch_read_results_collect(const as_batch_read * results, uint32_t n, void * udata)
+{
+	BatchReadResults * data = (BatchReadResults *) udata;
+
+	as_batch_read * collected = (as_batch_read *) realloc(data->results,
+			sizeof(as_batch_read) * (data->size + n));
+	if ( collected == NULL ) {
+		return false;
+	}
+	data->results = collected;
+
+	for ( uint32_t i = 0; i < n; i++ ) {
+		bool copied = batch_read_copy(&results[i], &data->results[data->size], results[i].key);
+		data->size++;
+
+		if ( ! copied ) {
+			return false;
+		}
+	}
+
+	return true;
+}
+
+void batch_read_results_destroy(BatchReadResults * data)
+{
+	for ( uint32_t i = 0; i < data->size; i++ ) {
+		as_record_destroy(&data->results[i].record);
+	}
+	free(data->results);
+	data->results = NULL;
+	data->size = 0;
+}
+
+/**
+ * Make a single batch request.
+ */
+static as_status batch_read_request(aerospike * as, as_error * err,
+		const as_policy_batch * policy, as_batch * batch, BatchReadOp op,
+		const char ** bins, uint32_t n_bins, BatchReadResults * results)
+{
+	aerospike_batch_read_callback callback =
+		(aerospike_batch_read_callback) batch_read_results_collect;
+
+	switch ( op ) {
+		case BATCH_READ_GET_BINS:
+			return aerospike_batch_get_bins(as, err, policy, batch, bins, n_bins,
+					callback, results);
+		case BATCH_READ_EXISTS:
+			return aerospike_batch_exists(as, err, policy, batch, callback, results);
+		default:
+			return aerospike_batch_get(as, err, policy, batch, callback, results);
+	}
+}
+
+/**
+ * The batch requests of a split batch read.
+ */
+typedef struct {
+	aerospike * as;
+	const as_policy_batch * policy;
+	BatchReadOp op;
+	const char ** bins;
+	uint32_t n_bins;
+	as_batch * chunks;
+	as_error * errors;
+	BatchReadResults * results;
+} BatchReadChunks;
+
+static void batch_read_chunk_run(void * udata, uint32_t c)
+{
+	BatchReadChunks * chunks = (BatchReadChunks *) udata;
+
+	batch_read_request(chunks->as, &chunks->errors[c], chunks->policy,
+			&chunks->chunks[c], chunks->op, chunks->bins, chunks->n_bins,
+			&chunks->results[c]);
+}
+
+/**
+ * Order keys by namespace and digest, then by position, so the first of
+ * duplicate keys comes first.
+ */
+static int batch_key_cmp(const void * a, const void * b)
+{
+	const as_key * ka = *(const as_key **) a;
+	const as_key * kb = *(const as_key **) b;
+
+	int cmp = memcmp(ka->digest.value, kb->digest.value, AS_DIGEST_VALUE_SIZE);
+	if ( cmp == 0 ) {
+		cmp = strcmp(ka->ns, kb->ns);
+	}
+	if ( cmp == 0 ) {
+		cmp = ka < kb ? -1 : ka > kb;
+	}
+	return cmp;
+}
+
+as_status batch_read(aerospike * as, as_error * err, const as_policy_batch * policy,
+		as_batch * batch, BatchReadOp op, const char ** bins, uint32_t n_bins,
+		const BatchReadChunking * chunking, BatchReadResults * results)
+{
+	as_error_reset(err);
+
+	uint32_t n = batch->keys.size;
+	uint32_t max_keys = chunking->max_keys;
+
+	if ( max_keys == 0 || n <= max_keys ) {
+		return batch_read_request(as, err, policy, batch, op, bins, n_bins, results);
+	}
+
+	as_key ** sorted = (as_key **) malloc(sizeof(as_key *) * n);
+	uint32_t * slots = (uint32_t *) malloc(sizeof(uint32_t) * n);
+	as_batch_read ** found = (as_batch_read **) calloc(n, sizeof(as_batch_read *));
+	uint32_t n_chunks = 0;
+	BatchReadChunks chunks = {
+		.as = as, .policy = policy, .op = op, .bins = bins, .n_bins = n_bins,
+		.chunks = NULL, .errors = NULL, .results = NULL
+	};
+
+	if ( sorted == NULL || slots == NULL || found == NULL ) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the batch chunks");
+		goto CLEANUP;
+	}
+
+	// Deduplicate the keys by digest, slots[i] being the unique key of the
+	// i-th key. Unique keys are sorted in place at the head of sorted.
+	for ( uint32_t i = 0; i < n; i++ ) {
+		sorted[i] = &batch->keys.entries[i];
+		if ( as_key_digest(sorted[i]) == NULL ) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to compute the digest of a key");
+			goto CLEANUP;
+		}
+	}
+
+	qsort(sorted, n, sizeof(as_key *), batch_key_cmp);
+
+	uint32_t n_unique = 0;
+	for ( uint32_t i = 0; i < n; i++ ) {
+		as_key * key = sorted[i];
+		if ( n_unique == 0 ||
+				memcmp(key->digest.value, sorted[n_unique - 1]->digest.value, AS_DIGEST_VALUE_SIZE) != 0 ||
+				strcmp(key->ns, sorted[n_unique - 1]->ns) != 0 ) {
+			sorted[n_unique++] = key;
+		}
+		slots[key - batch->keys.entries] = n_unique - 1;
+	}
+
+	// Split the unique keys into chunks of at most max_keys keys
+	n_chunks = (n_unique + max_keys - 1) / max_keys;
+	chunks.chunks = (as_batch *) malloc(sizeof(as_batch) * n_chunks);
+	chunks.errors = (as_error *) malloc(sizeof(as_error) * n_chunks);
+	chunks.results = (BatchReadResults *) malloc(sizeof(BatchReadResults) * n_chunks);
+
+	if ( chunks.chunks == NULL || chunks.errors == NULL || chunks.results == NULL ) {
+		n_chunks = 0;
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the batch chunks");
+		goto CLEANUP;
+	}
+
+	for ( uint32_t c = 0; c < n_chunks; c++ ) {
+		uint32_t offset = c * max_keys;
+		uint32_t size = n_unique - offset < max_keys ? n_unique - offset : max_keys;
+
+		as_batch_init(&chunks.chunks[c], size);
+		as_error_init(&chunks.errors[c]);
+		batch_read_results_init(&chunks.results[c]);
+
+		for ( uint32_t j = 0; j < size; j++ ) {
+			const as_key * key = sorted[offset + j];
+			as_key_init_digest(as_batch_keyat(&chunks.chunks[c], j), key->ns, key->set,
+					key->digest.value);
+		}
+	}
+
+	batch_dispatch(chunking->pool, chunking->max_concurrent - 1, n_chunks,
+			batch_read_chunk_run, &chunks);
+
+	// Merge the results back in the order of the keys
+	for ( uint32_t c = 0; c < n_chunks; c++ ) {
+		if ( chunks.errors[c].code != AEROSPIKE_OK ) {
+			as_error_copy(err, &chunks.errors[c]);
+			goto CLEANUP;
+		}
+
+		BatchReadResults * chunk_results = &chunks.results[c];
+		for ( uint32_t r = 0; r < chunk_results->size; r++ ) {
+			as_batch_read * result = &chunk_results->results[r];
+			found[c * max_keys + (result->key - chunks.chunks[c].keys.entries)] = result;
+		}
+	}
+
+	results->results = (as_batch_read *) malloc(sizeof(as_batch_read) * n);
+	if ( results->results == NULL ) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the batch results");
+		goto CLEANUP;
+	}
+
+	// The results of the chunks are already copies owned by this call, so
+	// the first key of a digest takes its record over, leaving an empty
+	// record behind, and found then points to the moved result. Only
+	// duplicate keys need a copy.
+	for ( uint32_t i = 0; i < n; i++ ) {
+		as_batch_read * result = found[slots[i]];
+		if ( result == NULL ) {
+			continue;
+		}
+
+		as_batch_read * dst = &results->results[results->size];
+		bool moved = result >= results->results && result < dst;
+
+		if ( ! moved ) {
+			*dst = *result;
+			dst->key = &batch->keys.entries[i];
+			as_record_init(&result->record, 0);
+			found[slots[i]] = dst;
+			results->size++;
+			continue;
+		}
+
+		bool copied = batch_read_copy(result, dst, &batch->keys.entries[i]);
+		results->size++;
+
+		if ( ! copied ) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to copy the batch results");
+			goto CLEANUP;
+		}
+	}
+
+CLEANUP:
+
+	for ( uint32_t c = 0; c < n_chunks; c++ ) {
+		batch_read_results_destroy(&chunks.results[c]);
+		as_batch_destroy(&chunks.chunks[c]);
+	}
+	free(chunks.results);
+	free(chunks.errors);
+	free(chunks.chunks);
+	free(found);
+	free(slots);
+	free(sorted);
+
+	return err->code;
+}
+
+PyObject * batch_read_results_to_list(as_error * err, const BatchReadResults * data,
+		const as_batch * batch, BatchReadToPyObject convert)
+{
+	uint32_t n = batch->keys.size;
+
+	PyObject * py_list = PyList_New(n);
+	if ( py_list == NULL ) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		return NULL;
+	}
+
+	// Keys which got no result at all are left as None
+	for ( uint32_t i = 0; i < n; i++ ) {
+		Py_INCREF(Py_None);
+		PyList_SET_ITEM(py_list, i, Py_None);
+	}
+
+	for ( uint32_t i = 0; i < data->size; i++ ) {
+		const as_batch_read * result = &data->results[i];
+
+		// The keys of the results point into the batch, which gives their
+		// position no matter the order the nodes answered in
+		uint32_t pos = (uint32_t) (result->key - batch->keys.entries);
+		if ( pos >= n ) {
+			continue;
+		}
+
+		PyObject * py_val = NULL;
+
+		if ( result->result == AEROSPIKE_OK ) {
+			if ( convert(err, result, &py_val) != AEROSPIKE_OK ) {
+				Py_XDECREF(py_val);
+				Py_DECREF(py_list);
+				return NULL;
+			}
+		}
+		else if ( result->result == AEROSPIKE_ERR_RECORD_NOT_FOUND ) {
+			continue;
+		}
+		else {
+			py_val = PyInt_FromLong((long) result->result);
+		}
+
+		PyObject * py_old = PyList_GET_ITEM(py_list, pos);
+		PyList_SET_ITEM(py_list, pos, py_val);
+		Py_DECREF(py_old);
+	}
+
+	return py_list;
+}
@@ -0,0 +1,247 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include "batch_dispatch.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+typedef struct {
+	BatchDispatchFn run;
+	void * udata;
+	uint32_t n;
+	uint32_t next;
+	uint32_t done;
+	uint32_t refs;
+	pthread_mutex_t lock;
+	pthread_cond_t cond;
+} BatchDispatch;
+
+static void batch_dispatch_release(BatchDispatch * dispatch)
+{
+	pthread_mutex_lock(&dispatch->lock);
+	bool last = --dispatch->refs == 0;
+	pthread_mutex_unlock(&dispatch->lock);
+
+	if ( last ) {
+		pthread_mutex_destroy(&dispatch->lock);
+		pthread_cond_destroy(&dispatch->cond);
+		free(dispatch);
+	}
+}
+
+/**
+ * Run the requests not yet taken by another thread.
+ */
+static void batch_dispatch_work(BatchDispatch * dispatch)
+{
+	uint32_t count = 0;
+	uint32_t i;
+
+	while ( (i = __sync_fetch_and_add(&dispatch->next, 1)) < dispatch->n ) {
+		dispatch->run(dispatch->udata, i);
+		count++;
+	}
+
+	pthread_mutex_lock(&dispatch->lock);
+	dispatch->done += count;
+	if ( dispatch->done == dispatch->n ) {
+		pthread_cond_broadcast(&dispatch->cond);
+	}
+	pthread_mutex_unlock(&dispatch->lock);
+}
+
+/**
+ * Task of the pool. A task queued behind busy threads may only start once
+ * the caller returned, so it holds its own reference to the dispatch.
+ */
+static void batch_dispatch_task(void * udata)
+{
+	BatchDispatch * dispatch = (BatchDispatch *) udata;
+	batch_dispatch_work(dispatch);
+	batch_dispatch_release(dispatch);
+}
+
+void batch_dispatch(ThreadPool * pool, uint32_t concurrency, uint32_t n,
+		BatchDispatchFn fn, void * udata)
+{
+	if ( n == 0 ) {
+		return;
+	}
+
+	BatchDispatch * dispatch = (BatchDispatch *) calloc(1, sizeof(BatchDispatch));
+	if ( dispatch == NULL ) {
+		// Run everything on the calling thread
+		for ( uint32_t i = 0; i < n; i++ ) {
+			fn(udata, i);
+		}
+		return;
+	}
+
+	dispatch->run = fn;
+	dispatch->udata = udata;
+	dispatch->n = n;
+	dispatch->refs = 1;
+	pthread_mutex_init(&dispatch->lock, NULL);
+	pthread_cond_init(&dispatch->cond, NULL);
+
+	if ( pool ) {
+		if ( concurrency > n - 1 ) {
+			concurrency = n - 1;
+		}
+		for ( uint32_t t = 0; t < concurrency; t++ ) {
+			pthread_mutex_lock(&dispatch->lock);
+			dispatch->refs++;
+			pthread_mutex_unlock(&dispatch->lock);
+
+			if ( ! thread_pool_submit(pool, batch_dispatch_task, dispatch) ) {
+				batch_dispatch_release(dispatch);
+				break;
+			}
+		}
+	}
+
+	batch_dispatch_work(dispatch);
+
+	pthread_mutex_lock(&dispatch->lock);
+	while ( dispatch->done < dispatch->n ) {
+		pthread_cond_wait(&dispatch->cond, &dispatch->lock);
+	}
+	pthread_mutex_unlock(&dispatch->lock);
+
+	batch_dispatch_release(dispatch);
+}
+
+PyObject * batch_array_to_pyobject(const char * typecode, const void * values, size_t size)
+{
+	static PyObject * py_array_type = NULL;
+
+	if ( py_array_type == NULL ) {
+		PyObject * py_module = PyImport_ImportModule("array");
+		if ( py_module == NULL ) {
+			return NULL;
+		}
+		py_array_type = PyObject_GetAttrString(py_module, "array");
+		Py_DECREF(py_module);
+		if ( py_array_type == NULL ) {
+			return NULL;
+		}
+	}
+
+	PyObject * py_bytes = PyString_FromStringAndSize((const char *) values, size);
+	if ( py_bytes == NULL ) {
+		return NULL;
+	}
+
+	PyObject * py_array = PyObject_CallFunction(py_array_type, "sO", typecode, py_bytes);
+	Py_DECREF(py_bytes);
+	return py_array;
+}
+
+PyObject * batch_status_to_pyobject(const as_status * status, uint32_t n)
+{
+	// as_status is an int enum, matching the 'i' typecode
+	return batch_array_to_pyobject("i", status, sizeof(as_status) * n);
+}
+
+as_status batch_keys_init(as_error * err, PyObject * py_keys, PyObject ** py_seq,
+		as_key ** keys, uint32_t * n, PyObject ** py_err_key)
+{
+	*py_seq = NULL;
+	*keys = NULL;
+	*n = 0;
+
+	if ( py_keys == NULL || ( !PyList_Check(py_keys) && !PyTuple_Check(py_keys) ) ) {
+		*py_err_key = py_keys ? py_keys : Py_None;
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Keys should be specified as a list or tuple.");
+	}
+
+	// The keys borrow the strings of the key tuples, which a copy of the
+	// sequence holds while the GIL is released
+	PyObject * py_tuple = PySequence_Tuple(py_keys);
+	uint32_t size = py_tuple ? (uint32_t) PyTuple_GET_SIZE(py_tuple) : 0;
+	as_key * converted = py_tuple ? (as_key *) calloc(size ? size : 1, sizeof(as_key)) : NULL;
+	if ( converted == NULL ) {
+		PyErr_Clear();
+		Py_XDECREF(py_tuple);
+		*py_err_key = Py_None;
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the keys");
+	}
+
+	for ( uint32_t i = 0; i < size; i++ ) {
+		PyObject * py_key = PyTuple_GET_ITEM(py_tuple, i);
+
+		if ( !PyTuple_Check(py_key) ) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
+		}
+		else {
+			pyobject_to_key(err, py_key, &converted[i]);
+		}
+
+		if ( err->code != AEROSPIKE_OK ) {
+			// The sequence of the caller still holds the key
+			*py_err_key = py_key;
+			batch_keys_destroy(converted, i);
+			Py_DECREF(py_tuple);
+			return err->code;
+		}
+	}
+
+	*py_seq = py_tuple;
+	*keys = converted;
+	*n = size;
+	return AEROSPIKE_OK;
+}
+
+void batch_keys_destroy(as_key * keys, uint32_t n)
+{
+	if ( keys ) {
+		for ( uint32_t i = 0; i < n; i++ ) {
+			as_key_destroy(&keys[i]);
+		}
+		free(keys);
+	}
+}
+
+PyObject * batch_error_to_pyobject(as_error * err, PyObject * py_key)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject * exception_type = raise_exception(err);
+
+	PyObject * py_exception = PyObject_CallObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	if ( py_exception == NULL ) {
+		return NULL;
+	}
+
+	// The attributes of the exception classes are overwritten by each error,
+	// each instance keeps its own
+	PyObject * py_attr = PyLong_FromLongLong(err->code);
+	PyObject_SetAttrString(py_exception, "code", py_attr);
+	Py_DECREF(py_attr);
+	py_attr = PyString_FromString(err->message);
+	PyObject_SetAttrString(py_exception, "msg", py_attr);
+	Py_DECREF(py_attr);
+	PyObject_SetAttrString(py_exception, "key", py_key);
+
+	return py_exception;
+}
@@ -24,6 +24,7 @@
 #include <aerospike/as_policy.h>
 
 #include "admin.h"
+#include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
@@ -75,7 +76,7 @@ PyObject * AerospikeClient_Admin_Create_User(AerospikeClient * self, PyObject *a
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -182,7 +183,7 @@ PyObject * AerospikeClient_Admin_Drop_User( AerospikeClient *self, PyObject *arg
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -267,7 +268,7 @@ PyObject * AerospikeClient_Admin_Set_Password( AerospikeClient *self, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -359,7 +360,7 @@ PyObject * AerospikeClient_Admin_Change_Password( AerospikeClient *self, PyObjec
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -456,7 +457,7 @@ PyObject * AerospikeClient_Admin_Grant_Roles( AerospikeClient *self, PyObject *a
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -562,7 +563,7 @@ PyObject * AerospikeClient_Admin_Revoke_Roles( AerospikeClient *self, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -672,7 +673,7 @@ PyObject * AerospikeClient_Admin_Query_User( AerospikeClient * self, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -767,7 +768,7 @@ PyObject * AerospikeClient_Admin_Query_Users( AerospikeClient * self, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -852,7 +853,7 @@ PyObject * AerospikeClient_Admin_Create_Role(AerospikeClient * self, PyObject *a
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -944,7 +945,7 @@ PyObject * AerospikeClient_Admin_Drop_Role(AerospikeClient * self, PyObject *arg
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -1024,7 +1025,7 @@ PyObject * AerospikeClient_Admin_Grant_Privileges(AerospikeClient * self, PyObje
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -1122,7 +1123,7 @@ PyObject * AerospikeClient_Admin_Revoke_Privileges(AerospikeClient * self, PyObj
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -1218,7 +1219,7 @@ PyObject * AerospikeClient_Admin_Query_Role(AerospikeClient * self, PyObject *ar
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -1305,7 +1306,7 @@ PyObject * AerospikeClient_Admin_Query_Roles(AerospikeClient * self, PyObject *a
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
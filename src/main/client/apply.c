@@ -79,7 +79,7 @@ PyObject * AerospikeClient_Apply_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -129,8 +129,10 @@ PyObject * AerospikeClient_Apply_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_apply(self->as, &err, apply_policy_p, &key, module, function, arglist, &result);
+	PyEval_RestoreThread(_save);
 
 	if ( err.code == AEROSPIKE_OK ) {
 		val_to_pyobject(&err, result, &py_result);
@@ -0,0 +1,271 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_list.h>
+
+#include "batch_dispatch.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+typedef struct {
+	aerospike * as;
+	as_policy_apply * policy_p;
+	const char * module;
+	const char * function;
+	as_list * arglist;
+	as_key * keys;
+	as_val ** results;
+	as_error ** errors;
+} ApplyMany;
+
+/**
+ * Applies the UDF to the record of the i-th key, without the GIL. The
+ * arguments are only read, so all the keys share them.
+ */
+static void apply_many_run(void * udata, uint32_t i)
+{
+	ApplyMany * apply_many = (ApplyMany *) udata;
+
+	as_error err;
+	as_error_init(&err);
+
+	aerospike_key_apply(apply_many->as, &err, apply_many->policy_p, &apply_many->keys[i],
+			apply_many->module, apply_many->function, apply_many->arglist,
+			&apply_many->results[i]);
+
+	if ( err.code != AEROSPIKE_OK ) {
+		apply_many->errors[i] = (as_error *) malloc(sizeof(as_error));
+		if ( apply_many->errors[i] ) {
+			as_error_copy(apply_many->errors[i], &err);
+		}
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Applies a registered record UDF to the records of many keys. The arguments
+ * are converted once, then the UDF is applied concurrently to the keys on
+ * the pool of the client and the calling thread, with the GIL released.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list with the result of the UDF for each key, in the order of
+ * the keys, or the exception, not raised, of the keys which failed.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Apply_Many(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_module = NULL;
+	PyObject * py_function = NULL;
+	PyObject * py_arglist = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "module", "function", "args", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OOOO|O:apply_many", kwlist,
+			&py_keys, &py_module, &py_function, &py_arglist, &py_policy) == false ) {
+		return NULL;
+	}
+
+	if( !PyList_Check(py_arglist) ){
+		PyErr_SetString(PyExc_TypeError, "expected UDF method arguments in a 'list'");
+		return NULL;
+	}
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_apply apply_policy;
+	ApplyMany apply_many = {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL};
+	PyObject * py_umodule = NULL;
+	PyObject * py_ufunction = NULL;
+	PyObject * py_seq = NULL;
+	PyObject * py_err_key = Py_None;
+	PyObject * py_result = NULL;
+	uint32_t n = 0;
+
+	// The arguments are used with the GIL released: their strings are
+	// copied rather than borrowed from a list other threads can change
+	as_static_pool static_pool;
+	as_static_pool_init(&static_pool);
+	static_pool.copy_strings = true;
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if ( PyUnicode_Check(py_module) ){
+		py_umodule = PyUnicode_AsUTF8String(py_module);
+		apply_many.module = PyString_AsString(py_umodule);
+	}
+	else if ( PyString_Check(py_module) ) {
+		apply_many.module = PyString_AsString(py_module);
+	}
+	else {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "udf module argument must be a string or unicode string");
+		goto CLEANUP;
+	}
+
+	if ( PyUnicode_Check(py_function) ){
+		py_ufunction = PyUnicode_AsUTF8String(py_function);
+		apply_many.function = PyString_AsString(py_ufunction);
+	}
+	else if ( PyString_Check(py_function) ) {
+		apply_many.function = PyString_AsString(py_function);
+	}
+	else {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "function name must be a string or unicode string");
+		goto CLEANUP;
+	}
+
+	// Convert the arguments once for all the keys
+	pyobject_to_list(&err, py_arglist, &apply_many.arglist, &static_pool, -1);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	if ( batch_keys_init(&err, py_keys, &py_seq, &apply_many.keys, &n, &py_err_key) != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_apply
+	pyobject_to_policy_apply(&err, py_policy, &apply_policy, &apply_many.policy_p,
+			&self->as->config.policies.apply);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	apply_many.as = self->as;
+	apply_many.results = (as_val **) calloc(n ? n : 1, sizeof(as_val *));
+	apply_many.errors = (as_error **) calloc(n ? n : 1, sizeof(as_error *));
+	if ( !apply_many.results || !apply_many.errors ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		goto CLEANUP;
+	}
+
+	ThreadPool * pool = AerospikeClient_Async_Pool(self, &err);
+	if ( pool == NULL ) {
+		goto CLEANUP;
+	}
+
+	// Invoke operation, releasing the GIL for the network round trips
+	Py_BEGIN_ALLOW_THREADS
+	batch_dispatch(pool, self->async_threads, n, apply_many_run, &apply_many);
+	Py_END_ALLOW_THREADS
+
+	// Build the results in the order of the keys
+	py_result = PyList_New(n);
+
+	for ( uint32_t i = 0; py_result && i < n; i++ ) {
+		PyObject * py_item = NULL;
+
+		if ( apply_many.errors[i] ) {
+			PyObject * py_key = NULL;
+			key_to_pyobject(&err, &apply_many.keys[i], &py_key);
+			if ( py_key ) {
+				py_item = batch_error_to_pyobject(apply_many.errors[i], py_key);
+				Py_DECREF(py_key);
+			}
+		}
+		else {
+			val_to_pyobject(&err, apply_many.results[i], &py_item);
+		}
+
+		if ( py_item == NULL ) {
+			Py_CLEAR(py_result);
+			if ( err.code == AEROSPIKE_OK && !PyErr_Occurred() ) {
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to convert the results");
+			}
+			break;
+		}
+		PyList_SET_ITEM(py_result, i, py_item);
+	}
+
+CLEANUP:
+
+	for ( uint32_t i = 0; i < n; i++ ) {
+		if ( apply_many.results ) {
+			as_val_destroy(apply_many.results[i]);
+		}
+		if ( apply_many.errors ) {
+			free(apply_many.errors[i]);
+		}
+	}
+	free(apply_many.results);
+	free(apply_many.errors);
+	batch_keys_destroy(apply_many.keys, n);
+	Py_XDECREF(py_seq);
+	as_list_destroy(apply_many.arglist);
+	as_static_pool_destroy(&static_pool);
+	Py_XDECREF(py_umodule);
+	Py_XDECREF(py_ufunction);
+
+	if ( PyErr_Occurred() ) {
+		Py_XDECREF(py_result);
+		return NULL;
+	}
+
+	// If an error occurred, tell Python.
+	if ( err.code != AEROSPIKE_OK ) {
+		Py_XDECREF(py_result);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		if(PyObject_HasAttrString(exception_type, "key")) {
+			PyObject_SetAttrString(exception_type, "key", py_err_key);
+		}
+		if(PyObject_HasAttrString(exception_type, "bin")) {
+			PyObject_SetAttrString(exception_type, "bin", Py_None);
+		}
+		if(PyObject_HasAttrString(exception_type, "module")) {
+			PyObject_SetAttrString(exception_type, "module", py_module);
+		}
+		if(PyObject_HasAttrString(exception_type, "func")) {
+			PyObject_SetAttrString(exception_type, "func", py_function);
+		}
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
@@ -0,0 +1,354 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "policy.h"
+#include "thread_pool.h"
+
+/**
+ *******************************************************************************************************
+ * This function creates an AsyncClient bound to the client.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the AsyncClient on success.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+AerospikeAsyncClient * AerospikeClient_Async_Client(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	return AerospikeAsyncClient_New(self, args, kwds);
+}
+
+/**
+ *******************************************************************************************************
+ * Validate the state of the client before queueing a request.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ *
+ * Returns the status of the check.
+ *******************************************************************************************************
+ */
+static as_status AerospikeClient_Async_Check(AerospikeClient * self, as_error * err)
+{
+	if ( !self || !self->as ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+	}
+	if ( !AerospikeClient_Connected(self) ) {
+		return as_error_update(err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Queue a prepared job on the pool of the client, starting the pool on first
+ * use, and return the future it will resolve.
+ *
+ * @param self                  AerospikeClient object
+ * @param job                   The job, destroyed on failure.
+ *
+ * Returns a concurrent.futures.Future.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+static PyObject * AerospikeClient_Async_Submit(AerospikeClient * self, AsyncJob * job)
+{
+	static PyObject * py_future_type = NULL;
+
+	if ( py_future_type == NULL ) {
+		PyObject * py_module = PyImport_ImportModule("concurrent.futures");
+		if ( py_module == NULL ) {
+			async_job_destroy(job);
+			return NULL;
+		}
+		py_future_type = PyObject_GetAttrString(py_module, "Future");
+		Py_DECREF(py_module);
+		if ( py_future_type == NULL ) {
+			async_job_destroy(job);
+			return NULL;
+		}
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if ( AerospikeClient_Async_Pool(self, &err) == NULL ) {
+		return async_job_raise(&err, job, NULL);
+	}
+
+	PyObject * py_future = PyObject_CallObject(py_future_type, NULL);
+	if ( py_future == NULL ) {
+		async_job_destroy(job);
+		return NULL;
+	}
+
+	// The request cannot be cancelled once it is queued
+	PyObject * py_running = PyObject_CallMethod(py_future, "set_running_or_notify_cancel", NULL);
+	if ( py_running == NULL ) {
+		Py_DECREF(py_future);
+		async_job_destroy(job);
+		return NULL;
+	}
+	Py_DECREF(py_running);
+
+	Py_INCREF(py_future);
+	job->py_future = py_future;
+
+	if ( ! async_job_submit(job, self->async_pool) ) {
+		Py_DECREF(py_future);
+		return NULL;
+	}
+
+	return py_future;
+}
+
+ThreadPool * AerospikeClient_Async_Pool(AerospikeClient * self, as_error * err)
+{
+	if ( self->async_pool == NULL ) {
+		self->async_pool = thread_pool_new(self->async_threads);
+		if ( self->async_pool == NULL ) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to start the async threads");
+		}
+	}
+	return self->async_pool;
+}
+
+void AerospikeClient_Async_Pool_Destroy(AerospikeClient * self)
+{
+	if ( self->async_pool ) {
+		ThreadPool * pool = self->async_pool;
+		self->async_pool = NULL;
+
+		// The threads take the GIL to resolve the futures
+		Py_BEGIN_ALLOW_THREADS
+		thread_pool_destroy(pool);
+		Py_END_ALLOW_THREADS
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Reads a record without blocking.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a concurrent.futures.Future of the record.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Get_Async(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_async", kwlist,
+			&py_key, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( AerospikeClient_Async_Check(self, &err) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self, NULL, ASYNC_GET, py_key, NULL, NULL);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_get(job, &err, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	return AerospikeClient_Async_Submit(self, job);
+}
+
+/**
+ *******************************************************************************************************
+ * Writes a record without blocking.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a concurrent.futures.Future of the status.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Put_Async(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_bins = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "bins", "meta", "policy", "serializer_option", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|OOl:put_async", kwlist,
+			&py_key, &py_bins, &py_meta, &py_policy, &serializer_option) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( AerospikeClient_Async_Check(self, &err) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self, NULL, ASYNC_PUT, py_key, py_bins, NULL);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_put(job, &err, py_meta, py_policy, serializer_option) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	return AerospikeClient_Async_Submit(self, job);
+}
+
+/**
+ *******************************************************************************************************
+ * Performs multiple operations on a record without blocking.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a concurrent.futures.Future of the record, or 0 when no bins are
+ * read.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Operate_Async(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_list = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate_async", kwlist,
+			&py_key, &py_list, &py_meta, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( AerospikeClient_Async_Check(self, &err) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, py_key);
+	}
+
+	job = async_job_new(self, NULL, ASYNC_OPERATE, py_key, py_list, NULL);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_operate(job, &err, py_meta, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, py_key);
+	}
+
+	return AerospikeClient_Async_Submit(self, job);
+}
+
+/**
+ *******************************************************************************************************
+ * Reads a batch of records without blocking.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a concurrent.futures.Future of the dictionary of records.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Get_Many_Async(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_policy = NULL;
+
+	as_error err;
+	AsyncJob * job = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_many_async", kwlist,
+			&py_keys, &py_policy) == false ) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+
+	if ( AerospikeClient_Async_Check(self, &err) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, NULL, NULL);
+	}
+
+	job = async_job_new(self, NULL, ASYNC_GET_MANY, NULL, py_keys, NULL);
+	if ( job == NULL ) {
+		return NULL;
+	}
+
+	if ( async_job_prepare_get_many(job, &err, py_policy) != AEROSPIKE_OK ) {
+		return async_job_raise(&err, job, NULL);
+	}
+
+	return AerospikeClient_Async_Submit(self, job);
+}
@@ -22,6 +22,7 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "result_iterator.h"
 
 /**
  *******************************************************************************************************
@@ -48,11 +49,32 @@ PyObject * AerospikeClient_Close(AerospikeClient * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
+	// A client inherited from the parent process only releases its own state
+	if (AerospikeClient_Detach_Fork(self)) {
+		aerospike_destroy(self->as);
+		self->as = NULL;
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
 	if (!self->is_conn_16) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
 
+	// The requests of an AsyncClient run on its own pool, which the client
+	// cannot drain: they must be processed before the cluster goes away
+	if (self->async_pending > 0) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Requests of an AsyncClient are pending");
+		goto CLEANUP;
+	}
+
+	// The scans and queries of the iterators use the cluster too
+	AerospikeResultIterator_Stop_All(self);
+
+	// Wait for the requests of the *_async() methods, they use the cluster
+	AerospikeClient_Async_Pool_Destroy(self);
+
 	aerospike_close(self->as, &err);
 
 	if ( err.code != AEROSPIKE_OK ) {
@@ -0,0 +1,128 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike.h>
+#include <aerospike/as_config.h>
+#include <aerospike/as_error.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+/**
+ * Sets an entry of a dict, stealing the reference to the value.
+ */
+static void config_set_item(PyObject * py_dict, const char * name, PyObject * py_value)
+{
+	if ( py_value ) {
+		PyDict_SetItemString(py_dict, name, py_value);
+		Py_DECREF(py_value);
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Returns the configuration the client actually uses, including the defaults
+ * of the C client for the entries absent from the config of aerospike.client().
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a dict of the configuration.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Config(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_config = NULL;
+
+	static char * kwlist[] = {NULL};
+
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, ":config", kwlist) == false ) {
+		return NULL;
+	}
+
+	if ( !self || !self->as ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	as_config * config = &self->as->config;
+
+	py_config = PyDict_New();
+
+	PyObject * py_hosts = PyList_New(0);
+	for ( int i = 0; i < AS_CONFIG_HOSTS_SIZE && config->hosts[i].addr; i++ ) {
+		PyObject * py_host = Py_BuildValue("(sH)", config->hosts[i].addr, config->hosts[i].port);
+		PyList_Append(py_hosts, py_host);
+		Py_DECREF(py_host);
+	}
+	config_set_item(py_config, "hosts", py_hosts);
+
+	PyObject * py_lua = PyDict_New();
+	config_set_item(py_lua, "system_path", PyString_FromString(config->lua.system_path));
+	config_set_item(py_lua, "user_path", PyString_FromString(config->lua.user_path));
+	config_set_item(py_config, "lua", py_lua);
+
+	PyObject * py_policies = PyDict_New();
+	config_set_item(py_policies, "timeout", PyInt_FromLong(config->policies.timeout));
+	config_set_item(py_policies, "retry", PyInt_FromLong(config->policies.retry));
+	config_set_item(py_policies, "key", PyInt_FromLong(config->policies.key));
+	config_set_item(py_policies, "exists", PyInt_FromLong(config->policies.exists));
+	config_set_item(py_policies, "replica", PyInt_FromLong(config->policies.replica));
+	config_set_item(py_policies, "consistency_level", PyInt_FromLong(config->policies.consistency_level));
+	config_set_item(py_policies, "commit_level", PyInt_FromLong(config->policies.commit_level));
+	config_set_item(py_config, "policies", py_policies);
+
+	config_set_item(py_config, "connect_timeout", PyInt_FromLong(config->conn_timeout_ms));
+	config_set_item(py_config, "max_conns_per_node", PyInt_FromLong(config->max_conns_per_node));
+	config_set_item(py_config, "tend_interval", PyInt_FromLong(config->tender_interval));
+	config_set_item(py_config, "thread_pool_size", PyInt_FromLong(config->thread_pool_size));
+	config_set_item(py_config, "async_threads", PyInt_FromLong(self->async_threads));
+	config_set_item(py_config, "batch_max_keys", PyInt_FromLong(self->batch_max_keys));
+	config_set_item(py_config, "batch_max_concurrent", PyInt_FromLong(self->batch_max_concurrent));
+
+	if ( config->use_shm ) {
+		PyObject * py_shm = PyDict_New();
+		config_set_item(py_shm, "shm_max_nodes", PyInt_FromLong(config->shm_max_nodes));
+		config_set_item(py_shm, "shm_max_namespaces", PyInt_FromLong(config->shm_max_namespaces));
+		config_set_item(py_shm, "shm_takeover_threshold_sec", PyInt_FromLong(config->shm_takeover_threshold_sec));
+		config_set_item(py_shm, "shm_key", PyLong_FromUnsignedLong((unsigned int) config->shm_key));
+		config_set_item(py_config, "shm", py_shm);
+	}
+
+CLEANUP:
+
+	if ( err.code != AEROSPIKE_OK ) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_config;
+}
@@ -15,14 +15,87 @@
  ******************************************************************************/
 
 #include <Python.h>
+#include <pthread.h>
+#include <string.h>
 
 #include <aerospike/aerospike.h>
+#include <aerospike/as_config.h>
 #include <aerospike/as_error.h>
 
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 
+/*******************************************************************************
+ * FORK DETECTION
+ ******************************************************************************/
+
+// Incremented in the child process by each fork()
+static uint32_t fork_generation = 0;
+
+static pthread_once_t fork_handler_once = PTHREAD_ONCE_INIT;
+
+static void fork_handler_child(void)
+{
+	fork_generation++;
+}
+
+static void fork_handler_register(void)
+{
+	pthread_atfork(NULL, NULL, fork_handler_child);
+}
+
+/**
+ * Replaces the cluster state inherited from the parent process by a new
+ * aerospike instance with the same configuration, not yet connected.
+ *
+ * The tend thread and the threads of the async pool of the parent do not
+ * exist in the child, and the sockets of the cluster are shared with the
+ * parent: the inherited state is left untouched rather than closed.
+ */
+static void AerospikeClient_Forget_Parent(AerospikeClient * self)
+{
+	as_config config;
+	memcpy(&config, &self->as->config, sizeof(as_config));
+
+	self->as = aerospike_new(&config);
+	self->async_pool = NULL;
+	self->is_conn_16 = false;
+	self->fork_generation = fork_generation;
+}
+
+bool AerospikeClient_Detach_Fork(AerospikeClient * self)
+{
+	if ( !self->is_conn_16 || self->fork_generation == fork_generation ) {
+		return false;
+	}
+
+	AerospikeClient_Forget_Parent(self);
+	return true;
+}
+
+bool AerospikeClient_Connected(AerospikeClient * self)
+{
+	if ( !self->is_conn_16 ) {
+		return false;
+	}
+
+	if ( self->fork_generation == fork_generation ) {
+		return true;
+	}
+
+	// First use in a child process, build the cluster state of this process
+	as_error err;
+	as_error_init(&err);
+
+	AerospikeClient_Forget_Parent(self);
+
+	aerospike_connect(self->as, &err);
+
+	self->is_conn_16 = err.code == AEROSPIKE_OK;
+	return self->is_conn_16;
+}
+
 /**
  *******************************************************************************************************
  * Establishes a connection to the Aerospike DB instance.
@@ -49,6 +122,10 @@ PyObject * AerospikeClient_Connect(AerospikeClient * self, PyObject * args, PyOb
 		return NULL;
 	}
 
+	// Never reuse the cluster state of the parent process
+	AerospikeClient_Detach_Fork(self);
+	pthread_once(&fork_handler_once, fork_handler_register);
+
 	if ( py_username && PyString_Check(py_username) && py_password && PyString_Check(py_password) ) {
 		char * username = PyString_AsString(py_username);
 		char * password = PyString_AsString(py_password);
@@ -66,6 +143,7 @@ PyObject * AerospikeClient_Connect(AerospikeClient * self, PyObject * args, PyOb
 		return NULL;
 	}
 	self->is_conn_16 = true;
+	self->fork_generation = fork_generation;
 	Py_INCREF(self);
 	return (PyObject *) self;
 }
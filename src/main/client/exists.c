@@ -64,7 +64,7 @@ extern PyObject * AerospikeClient_Exists_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -84,8 +84,10 @@ extern PyObject * AerospikeClient_Exists_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_exists(self->as, &err, read_policy_p, &key, &rec);
+	PyEval_RestoreThread(_save);
 
 	if ( err.code == AEROSPIKE_OK ) {
 
@@ -16,6 +16,8 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/aerospike_batch.h>
@@ -24,6 +26,8 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "batch.h"
+#include "batch_dispatch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
@@ -32,21 +36,20 @@
 
 /**
  *******************************************************************************************************
- * This callback will be called with the results with aerospike_batch_exists().
+ * This function converts the results collected from aerospike_batch_exists()
+ * once the GIL has been reacquired.
  *
  * @param results               An array of n as_batch_read entries
  * @param n                     The number of results from the batch request
- * @param udata                 The return value to be filled with result of
+ * @param py_recs               The return value to be filled with result of
  *                              exists_many()
  *
  * Returns boolean value(true or false).
  *******************************************************************************************************
  */
 static
-bool batch_exists_cb(const as_batch_read* results, uint32_t n, void* udata)
+bool batch_exists_to_pyobject(const as_batch_read* results, uint32_t n, PyObject * py_recs)
 {
-	// Typecast udata back to PyObject
-	PyObject * py_recs = (PyObject *) udata;
 
 	// Loop over results array
 	for ( uint32_t i =0; i < n; i++ ){
@@ -93,6 +96,95 @@ bool batch_exists_cb(const as_batch_read* results, uint32_t n, void* udata)
 	return true;
 }
 
+/**
+ *******************************************************************************************************
+ * Converts the results of exists_many() to a bitmap of the existing records,
+ * bit i (i % 8 of byte i / 8) being set if the i-th key exists. For
+ * BATCH_READ_OUTPUT_ARRAYS, the bitmap comes in a tuple along with
+ * array.array('H') of the generations and array.array('I') of the ttls of
+ * the records, which are 0 for the keys which do not exist.
+ *
+ * @param err                   The as_error to be populated on failure
+ * @param data                  The results of the batch
+ * @param batch                 The batch of keys the results point into
+ * @param output                BATCH_READ_OUTPUT_BITMAP or BATCH_READ_OUTPUT_ARRAYS
+ *
+ * Returns the bitmap or the tuple, NULL on error.
+ *******************************************************************************************************
+ */
+static
+PyObject * batch_exists_to_bitmap(as_error * err, const BatchReadResults * data,
+		const as_batch * batch, BatchReadOutput output)
+{
+	uint32_t n = batch->keys.size;
+	bool arrays = output == BATCH_READ_OUTPUT_ARRAYS;
+
+	PyObject * py_result = NULL;
+	PyObject * py_gens = NULL;
+	PyObject * py_ttls = NULL;
+
+	uint8_t * bitmap = (uint8_t *) calloc((n + 7) / 8 + 1, 1);
+	uint16_t * gens = arrays ? (uint16_t *) calloc(n + 1, sizeof(uint16_t)) : NULL;
+	uint32_t * ttls = arrays ? (uint32_t *) calloc(n + 1, sizeof(uint32_t)) : NULL;
+
+	if ( bitmap == NULL || ( arrays && ( gens == NULL || ttls == NULL ) ) ) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		goto CLEANUP;
+	}
+
+	for ( uint32_t i = 0; i < data->size; i++ ) {
+		const as_batch_read * result = &data->results[i];
+		uint32_t pos = (uint32_t) (result->key - batch->keys.entries);
+
+		if ( pos >= n || result->result != AEROSPIKE_OK ) {
+			continue;
+		}
+
+		bitmap[pos / 8] |= (uint8_t) (1 << (pos % 8));
+		if ( arrays ) {
+			gens[pos] = result->record.gen;
+			ttls[pos] = result->record.ttl;
+		}
+	}
+
+	py_result = PyString_FromStringAndSize((const char *) bitmap, (n + 7) / 8);
+
+	if ( py_result && arrays ) {
+		py_gens = batch_array_to_pyobject("H", gens, sizeof(uint16_t) * n);
+		py_ttls = batch_array_to_pyobject("I", ttls, sizeof(uint32_t) * n);
+
+		PyObject * py_bitmap = py_result;
+		py_result = py_gens && py_ttls ? PyTuple_Pack(3, py_bitmap, py_gens, py_ttls) : NULL;
+		Py_DECREF(py_bitmap);
+	}
+
+	if ( py_result == NULL ) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build the results");
+	}
+
+CLEANUP:
+
+	Py_XDECREF(py_gens);
+	Py_XDECREF(py_ttls);
+	free(bitmap);
+	free(gens);
+	free(ttls);
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Converts a found record of an ordered exists_many() to the metadata dict.
+ *******************************************************************************************************
+ */
+static
+as_status batch_exists_result_to_pyobject(as_error * err, const as_batch_read * result, PyObject ** obj)
+{
+	return metadata_to_pyobject(err, &result->record, obj);
+}
+
 /**
  *******************************************************************************************************
  * This function checks if a batch of records are present in DB or not.
@@ -100,6 +192,7 @@ bool batch_exists_cb(const as_batch_read* results, uint32_t n, void* udata)
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param py_policy             The dictionary of policies
+ * @param py_options            The dictionary of options
  *
  * Returns the metadata of a record if key exists otherwise NULL.
  *******************************************************************************************************
@@ -107,20 +200,26 @@ bool batch_exists_cb(const as_batch_read* results, uint32_t n, void* udata)
 static
 PyObject * AerospikeClient_Exists_Many_Invoke(
 	AerospikeClient * self,
-	PyObject * py_keys, PyObject * py_policy)
+	PyObject * py_keys, PyObject * py_policy, PyObject * py_options)
 {
 	// Python Return Value
-	PyObject * py_recs = PyDict_New();
+	PyObject * py_recs = NULL;
+	PyObject * py_seq = NULL;
 
 	// Aerospike Client Arguments
 	as_error err;
 	as_batch batch;
 	as_policy_batch policy;
 	as_policy_batch * batch_policy_p = NULL;
+	BatchReadOptions options;
+	BatchReadChunking chunking;
+	BatchReadResults batch_results;
 
 	// Initialisation flags
 	bool batch_initialised = false;
 
+	batch_read_results_init(&batch_results);
+
 	// Initialize error
 	as_error_init(&err);
 
@@ -129,7 +228,7 @@ PyObject * AerospikeClient_Exists_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -137,7 +236,15 @@ PyObject * AerospikeClient_Exists_Many_Invoke(
 	// Convert python keys list to as_key ** and set it in batch.keys
 	// keys can be specified in PyList and PyTuple
 	if ( py_keys != NULL && PyList_Check(py_keys) ) {
-		Py_ssize_t size = PyList_Size(py_keys);
+		// The keys borrow the strings of the key tuples while the GIL is
+		// released, so they are converted from a copy of the list
+		py_seq = PySequence_Tuple(py_keys);
+		if ( py_seq == NULL ) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the keys");
+			goto CLEANUP;
+		}
+		Py_ssize_t size = PyTuple_GET_SIZE(py_seq);
 
 		as_batch_init(&batch, size);
 		// batch is initialised
@@ -145,7 +252,7 @@ PyObject * AerospikeClient_Exists_Many_Invoke(
 
 		for ( int i = 0; i < size; i++ ) {
 
-			PyObject * py_key = PyList_GetItem(py_keys, i);
+			PyObject * py_key = PyTuple_GET_ITEM(py_seq, i);
 
 			if ( !PyTuple_Check(py_key) ){
 				as_error_update(&err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
@@ -193,22 +300,55 @@ PyObject * AerospikeClient_Exists_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke C-client API
-	aerospike_batch_exists(self->as, &err, batch_policy_p,
-		&batch, (aerospike_batch_read_callback) batch_exists_cb,
-		py_recs);
+	pyobject_to_batch_read_options(&err, py_options, &options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+	if ( options.output == BATCH_READ_OUTPUT_COLUMNS ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid value for output");
+		goto CLEANUP;
+	}
+
+	batch_read_chunking_init(&err, self, py_policy, batch.keys.size, &chunking);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Invoke C-client API, collecting the raw results without the GIL.
+	// Large batches are split into several concurrent requests.
+	PyThreadState * _save = PyEval_SaveThread();
+	batch_read(self->as, &err, batch_policy_p, &batch, BATCH_READ_EXISTS,
+		NULL, 0, &chunking, &batch_results);
+	PyEval_RestoreThread(_save);
 	if ( err.code != AEROSPIKE_OK ) {
 		as_error_update(&err, err.code, NULL);
 	}
+	else {
+		// Build the Python results in one pass
+		if ( options.output != BATCH_READ_OUTPUT_RECORDS ) {
+			py_recs = batch_exists_to_bitmap(&err, &batch_results, &batch, options.output);
+		}
+		else if ( options.ordered ) {
+			py_recs = batch_read_results_to_list(&err, &batch_results, &batch,
+					batch_exists_result_to_pyobject);
+		}
+		else {
+			py_recs = PyDict_New();
+			batch_exists_to_pyobject(batch_results.results, batch_results.size, py_recs);
+		}
+	}
 
 CLEANUP:
 
+	batch_read_results_destroy(&batch_results);
+
 	if (batch_initialised == true){
 		// We should destroy batch object as we are using 'as_batch_init' for initialisation
 		// Also, pyobject_to_key is soing strdup() in case of Unicode. So, object destruction
 		// is necessary.
 		as_batch_destroy(&batch);
 	}
+	Py_XDECREF(py_seq);
 
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
@@ -222,6 +362,7 @@ CLEANUP:
 		}
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(py_recs);
 		return NULL;
 	}
 
@@ -238,7 +379,8 @@ CLEANUP:
  * @param kwds                  Dictionary of keywords
  *
  * Returns a dictionary of record with key to be primary key and value
- * to be meatadata of a record.
+ * to be meatadata of a record, or a list of metadata aligned with the keys
+ * if options['ordered'].
  * In case of error,appropriate exceptions will be raised.
  *******************************************************************************************************
  */
@@ -247,16 +389,17 @@ PyObject * AerospikeClient_Exists_Many(AerospikeClient * self, PyObject * args,
 	// Python Function Arguments
 	PyObject * py_keys = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"keys", "policy", NULL};
+	static char * kwlist[] = {"keys", "policy", "options", NULL};
 
 	// Python Function Argument Parsing
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:exists_many", kwlist,
-			&py_keys, &py_policy) == false ) {
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:exists_many", kwlist,
+			&py_keys, &py_policy, &py_options) == false ) {
 		return NULL;
 	}
 
 	// Invoke Operation
-	return AerospikeClient_Exists_Many_Invoke(self, py_keys, py_policy);
+	return AerospikeClient_Exists_Many_Invoke(self, py_keys, py_policy, py_options);
 }
@@ -67,7 +67,7 @@ PyObject * AerospikeClient_Get_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -92,8 +92,10 @@ PyObject * AerospikeClient_Get_Invoke(
 	// Record initialised successfully.
 	record_initialised = true;
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_get(self->as, &err, read_policy_p, &key, &rec);
+	PyEval_RestoreThread(_save);
 	if ( err.code == AEROSPIKE_OK ) {
 		record_to_pyobject(&err, rec, &key, &py_rec);
 		if ( read_policy_p == NULL || 
@@ -16,6 +16,9 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/as_key.h>
@@ -65,7 +68,7 @@ PyObject * AerospikeClient_Get_Key_Digest_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -137,3 +140,200 @@ PyObject * AerospikeClient_Get_Key_Digest(AerospikeClient * self, PyObject * arg
 	// Invoke Operation
 	return AerospikeClient_Get_Key_Digest_Invoke(self, py_ns, py_set, py_key);
 }
+
+/**
+ * Hashes the n keys into the n contiguous 20 bytes digests of digests.
+ * Must be called without the GIL.
+ */
+static void get_key_digest_many_hash(as_key * keys, uint32_t n, uint8_t * digests)
+{
+	for ( uint32_t i = 0; i < n; i++ ) {
+		as_digest * digest = as_key_digest(&keys[i]);
+		memcpy(digests + (size_t) i * AS_DIGEST_VALUE_SIZE, digest->value, AS_DIGEST_VALUE_SIZE);
+	}
+}
+
+PyObject * AerospikeClient_Get_Key_Digest_Many_Invoke(
+	AerospikeClient * self,
+	PyObject * py_ns, PyObject * py_set, PyObject * py_keys)
+{
+	// Python Return Value
+	PyObject * py_digests = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_key * keys = NULL;
+	uint32_t n = 0;
+	Int64Buffer int64_keys;
+
+	PyObject * py_seq = NULL;
+	PyObject * py_encoded = NULL;
+	PyObject * py_uset = NULL;
+	const char * ns = NULL;
+	const char * set = NULL;
+
+	int64_keys.has_view = false;
+
+	if ( !PyString_Check(py_ns) ) {
+		PyErr_SetString(PyExc_TypeError, "Namespace should be a string");
+		return NULL;
+	}
+	if ( !PyString_Check(py_set)  && !PyUnicode_Check(py_set) ) {
+		PyErr_SetString(PyExc_TypeError, "Set should be a string or unicode");
+		return NULL;
+	}
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	ns = PyString_AsString(py_ns);
+	if ( PyUnicode_Check(py_set) ) {
+		py_uset = PyUnicode_AsUTF8String(py_set);
+		set = PyString_AsString(py_uset);
+	}
+	else {
+		set = PyString_AsString(py_set);
+	}
+
+	if ( PyList_Check(py_keys) || PyTuple_Check(py_keys) ) {
+		// The keys point into the strings of a tuple copy of the sequence,
+		// which another thread cannot change while hashing, and of the UTF-8
+		// encodings of its unicode keys, held by py_encoded
+		py_seq = PySequence_Tuple(py_keys);
+		py_encoded = PyList_New(0);
+		if ( py_seq == NULL || py_encoded == NULL ) {
+			goto CLEANUP;
+		}
+
+		n = (uint32_t) PyTuple_GET_SIZE(py_seq);
+		keys = (as_key *) malloc(sizeof(as_key) * (n ? n : 1));
+		if ( keys == NULL ) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the keys");
+			goto CLEANUP;
+		}
+
+		for ( uint32_t i = 0; i < n; i++ ) {
+			PyObject * py_key = PyTuple_GET_ITEM(py_seq, i);
+
+			if ( PyString_Check(py_key) ) {
+				as_key_init_strp(&keys[i], ns, set, PyString_AsString(py_key), false);
+			}
+			else if ( PyUnicode_Check(py_key) ) {
+				PyObject * py_ustr = PyUnicode_AsUTF8String(py_key);
+				if ( py_ustr == NULL || PyList_Append(py_encoded, py_ustr) != 0 ) {
+					Py_XDECREF(py_ustr);
+					goto CLEANUP;
+				}
+				as_key_init_strp(&keys[i], ns, set, PyString_AsString(py_ustr), false);
+				Py_DECREF(py_ustr);
+			}
+			else if ( PyInt_Check(py_key) ) {
+				as_key_init_int64(&keys[i], ns, set, (int64_t) PyInt_AsLong(py_key));
+			}
+			else if ( PyLong_Check(py_key) ) {
+				int64_t l = (int64_t) PyLong_AsLongLong(py_key);
+				if ( PyErr_Occurred() ) {
+					goto CLEANUP;
+				}
+				as_key_init_int64(&keys[i], ns, set, l);
+			}
+			else {
+				PyErr_SetString(PyExc_TypeError, "Key is invalid");
+				goto CLEANUP;
+			}
+		}
+
+		py_digests = PyString_FromStringAndSize(NULL, (Py_ssize_t) n * AS_DIGEST_VALUE_SIZE);
+		if ( py_digests == NULL ) {
+			goto CLEANUP;
+		}
+		uint8_t * digests = (uint8_t *) PyString_AS_STRING(py_digests);
+
+		Py_BEGIN_ALLOW_THREADS
+		get_key_digest_many_hash(keys, n, digests);
+		Py_END_ALLOW_THREADS
+	}
+	else {
+		if ( pyobject_to_int64_buffer(&err, py_keys, &int64_keys) != AEROSPIKE_OK ) {
+			goto CLEANUP;
+		}
+
+		n = (uint32_t) int64_keys.size;
+		py_digests = PyString_FromStringAndSize(NULL, (Py_ssize_t) n * AS_DIGEST_VALUE_SIZE);
+		if ( py_digests == NULL ) {
+			goto CLEANUP;
+		}
+		uint8_t * digests = (uint8_t *) PyString_AS_STRING(py_digests);
+
+		// An array.array exported through the old buffer protocol can still
+		// be resized, so the GIL is only released for a locked buffer view
+		PyThreadState * _save = int64_keys.has_view ? PyEval_SaveThread() : NULL;
+
+		as_key key;
+		for ( uint32_t i = 0; i < n; i++ ) {
+			as_key_init_int64(&key, ns, set, int64_keys.values[i]);
+			memcpy(digests + (size_t) i * AS_DIGEST_VALUE_SIZE, as_key_digest(&key)->value,
+					AS_DIGEST_VALUE_SIZE);
+		}
+
+		if ( _save ) {
+			PyEval_RestoreThread(_save);
+		}
+	}
+
+CLEANUP:
+
+	// The keys do not own their values
+	free(keys);
+	int64_buffer_release(&int64_keys);
+	Py_XDECREF(py_seq);
+	Py_XDECREF(py_encoded);
+	Py_XDECREF(py_uset);
+
+	if ( err.code != AEROSPIKE_OK ) {
+		Py_XDECREF(py_digests);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	if ( PyErr_Occurred() ) {
+		Py_XDECREF(py_digests);
+		return NULL;
+	}
+
+	return py_digests;
+}
+
+PyObject * AerospikeClient_Get_Key_Digest_Many(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_ns = NULL;
+	PyObject * py_set = NULL;
+	PyObject * py_keys = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"ns", "set", "keys", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OOO:get_key_digest_many", kwlist,
+			&py_ns, &py_set, &py_keys) == false ) {
+		return NULL;
+	}
+
+	// Invoke Operation
+	return AerospikeClient_Get_Key_Digest_Many_Invoke(self, py_ns, py_set, py_keys);
+}
@@ -24,6 +24,7 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "batch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
@@ -32,20 +33,19 @@
 
 /**
  *******************************************************************************************************
- * This callback will be called with the results with aerospike_batch_get().
+ * This function converts the results collected from aerospike_batch_get()
+ * once the GIL has been reacquired.
  *
  * @param results               An array of n as_batch_read entries
  * @param n                     The number of results from the batch request
- * @param udata                 The return value to be filled with result of
+ * @param py_recs               The return value to be filled with result of
  *                              get_many()
  *
  * Returns boolean value(true or false).
  *******************************************************************************************************
  */
-static bool batch_get_cb(const as_batch_read* results, uint32_t n, void* udata)
+bool batch_get_to_pyobject(const as_batch_read* results, uint32_t n, PyObject * py_recs)
 {
-	// Typecast udata back to PyObject
-	PyObject * py_recs = (PyObject *) udata;
 
 	// Initialize error object
 	as_error err;
@@ -96,34 +96,54 @@ static bool batch_get_cb(const as_batch_read* results, uint32_t n, void* udata)
 	return true;
 }
 
+/**
+ *******************************************************************************************************
+ * Converts a found record of an ordered get_many() to the record tuple.
+ *******************************************************************************************************
+ */
+static
+as_status batch_get_result_to_pyobject(as_error * err, const as_batch_read * result, PyObject ** obj)
+{
+	return record_to_pyobject(err, &result->record, result->key, obj);
+}
+
 /**
  *******************************************************************************************************
  * This function will get a batch of records from the Aeropike DB.
  *
  * @param self                  AerospikeClient object
- * @param py_keys               The list of keys
+ * @param py_ns                 The namespace of an int64 array of keys, or NULL
+ * @param py_set                The set of an int64 array of keys
+ * @param py_keys               The list of keys, or the int64 array of keys
  * @param py_policy             The dictionary of policies
+ * @param py_options            The dictionary of options
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
  */
 static
 PyObject * AerospikeClient_Get_Many_Invoke(
-	AerospikeClient * self,
-	PyObject * py_keys, PyObject * py_policy)
+	AerospikeClient * self, PyObject * py_ns, PyObject * py_set,
+	PyObject * py_keys, PyObject * py_policy, PyObject * py_options)
 {
 	// Python Return Value
-	PyObject * py_recs = PyDict_New();
+	PyObject * py_recs = NULL;
+	PyObject * py_seq = NULL;
 
 	// Aerospike Client Arguments
 	as_error err;
 	as_batch batch;
 	as_policy_batch policy;
 	as_policy_batch * batch_policy_p = NULL;
+	BatchReadOptions options;
+	BatchReadChunking chunking;
+	BatchReadResults batch_results;
 
 	// Initialisation flags
 	bool batch_initialised = false;
 
+	batch_read_results_init(&batch_results);
+
 	// Initialize error
 	as_error_init(&err);
 
@@ -132,15 +152,30 @@ PyObject * AerospikeClient_Get_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
 
 	// Convert python keys list to as_key ** and add it to as_batch.keys
-	// keys can be specified in PyList or PyTuple
-	if ( py_keys != NULL && PyList_Check(py_keys) ) {
-		Py_ssize_t size = PyList_Size(py_keys);
+	// keys can be specified in PyList or PyTuple, or as an int64 array
+	// of integer keys of a namespace and set
+	if ( py_ns != NULL ) {
+		if ( batch_int64_keys_init(&err, py_ns, py_set, py_keys, &batch) != AEROSPIKE_OK ) {
+			goto CLEANUP;
+		}
+		batch_initialised = true;
+	}
+	else if ( py_keys != NULL && PyList_Check(py_keys) ) {
+		// The keys borrow the strings of the key tuples while the GIL is
+		// released, so they are converted from a copy of the list
+		py_seq = PySequence_Tuple(py_keys);
+		if ( py_seq == NULL ) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the keys");
+			goto CLEANUP;
+		}
+		Py_ssize_t size = PyTuple_GET_SIZE(py_seq);
 
 		as_batch_init(&batch, size);
 		// Batch object initialised
@@ -148,7 +183,7 @@ PyObject * AerospikeClient_Get_Many_Invoke(
 
 		for ( int i = 0; i < size; i++ ) {
 
-			PyObject * py_key = PyList_GetItem(py_keys, i);
+			PyObject * py_key = PyTuple_GET_ITEM(py_seq, i);
 
 			if ( !PyTuple_Check(py_key) ){
 				as_error_update(&err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
@@ -196,19 +231,52 @@ PyObject * AerospikeClient_Get_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke C-client API
-	aerospike_batch_get(self->as, &err, batch_policy_p,
-		&batch, (aerospike_batch_read_callback) batch_get_cb,
-		py_recs);
+	pyobject_to_batch_read_options(&err, py_options, &options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+	if ( options.output != BATCH_READ_OUTPUT_RECORDS ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid value for output");
+		goto CLEANUP;
+	}
+
+	batch_read_chunking_init(&err, self, py_policy, batch.keys.size, &chunking);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Invoke C-client API, collecting the raw results without the GIL.
+	// Large batches are split into several concurrent requests.
+	PyThreadState * _save = PyEval_SaveThread();
+	batch_read(self->as, &err, batch_policy_p, &batch, BATCH_READ_GET,
+		NULL, 0, &chunking, &batch_results);
+	PyEval_RestoreThread(_save);
+
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Build the Python results in one pass
+	if ( options.ordered ) {
+		py_recs = batch_read_results_to_list(&err, &batch_results, &batch,
+				batch_get_result_to_pyobject);
+	}
+	else {
+		py_recs = PyDict_New();
+		batch_get_to_pyobject(batch_results.results, batch_results.size, py_recs);
+	}
 
 CLEANUP:
 
+	batch_read_results_destroy(&batch_results);
+
 	if (batch_initialised == true){
 		// We should destroy batch object as we are using 'as_batch_init' for initialisation
 		// Also, pyobject_to_key is soing strdup() in case of Unicode. So, object destruction
 		// is necessary.
 		as_batch_destroy(&batch);
 	}
+	Py_XDECREF(py_seq);
 
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
@@ -222,6 +290,7 @@ CLEANUP:
 		}
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(py_recs);
 		return NULL;
 	}
 
@@ -238,7 +307,7 @@ CLEANUP:
  * @param kwds                  Dictionary of keywords
  *
  * Returns a dictionary of record with key to be primary key and value to be a
- * record.
+ * record, or a list of records aligned with the keys if options['ordered'].
  * In case of error,appropriate exceptions will be raised.
  *******************************************************************************************************
  */
@@ -246,17 +315,33 @@ PyObject * AerospikeClient_Get_Many(AerospikeClient * self, PyObject * args, PyO
 {
 	// Python Function Arguments
 	PyObject * py_keys = NULL;
+	PyObject * py_ns = NULL;
+	PyObject * py_set = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"keys", "policy", NULL};
+	static char * kwlist[] = {"keys", "policy", "options", NULL};
+	static char * kwlist_int64[] = {"ns", "set", "keys", "policy", "options", NULL};
+
+	// get_many(ns, set, keys) takes the integer keys of a set as an int64
+	// array, instead of a list of key tuples
+	bool int64_keys = (PyTuple_Size(args) > 0 && PyString_Check(PyTuple_GET_ITEM(args, 0))) ||
+		(kwds && PyDict_GetItemString(kwds, "ns"));
 
 	// Python Function Argument Parsing
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_many", kwlist,
-			&py_keys, &py_policy) == false ) {
+	if ( int64_keys ) {
+		if ( PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:get_many", kwlist_int64,
+				&py_ns, &py_set, &py_keys, &py_policy, &py_options) == false ) {
+			return NULL;
+		}
+	}
+	else if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:get_many", kwlist,
+			&py_keys, &py_policy, &py_options) == false ) {
 		return NULL;
 	}
 
 	// Invoke Operation
-	return AerospikeClient_Get_Many_Invoke(self, py_keys, py_policy);
+	return AerospikeClient_Get_Many_Invoke(self, py_ns, py_set, py_keys, py_policy,
+			py_options);
 }
@@ -149,22 +149,24 @@ void AerospikeClient_CheckForMeta(PyObject * py_meta, as_operations * ops, as_er
 
 /**
  *******************************************************************************************************
- * This function invokes csdk's API's.
+ * This function converts a list of operations into as_operations.
  *
- * @param self                  AerospikeClient object
  * @param err                   The as_error to be populated by the function
  *                              with the encountered error if any.
- * @param key                   The C client's as_key that identifies the record.
  * @param py_list               The list containing op, bin and value.
  * @param py_meta               The metadata for the operation.
- * @param operate_policy_p      The value for operate policy.
+ * @param ops                   The initialised as_operations to be populated.
+ * @param static_pool           The pool for as_bytes values, which must
+ *                              outlive the operations.
+ * @param serializer_type       The serializer to use for written values.
+ *
+ * Values of type str are referenced, not copied, so py_list must outlive ops.
+ * If a value has the wrong type for its operation a TypeError is set, and
+ * AEROSPIKE_ERR_PARAM is returned without updating err.
  *******************************************************************************************************
  */
-static
-PyObject *  AerospikeClient_Operate_Invoke(
-	AerospikeClient * self, as_error *err,
-	as_key * key, PyObject * py_list, PyObject * py_meta,
-	as_policy_operate * operate_policy_p)
+as_status pyobject_to_operations(as_error * err, PyObject * py_list, PyObject * py_meta,
+	as_operations * ops, as_static_pool * static_pool, int serializer_type)
 {
 	as_val* put_val = NULL;
 	char* bin = NULL;
@@ -173,44 +175,33 @@ PyObject *  AerospikeClient_Operate_Invoke(
 	long ttl;
 	long operation;
 	int i;
-	PyObject * py_rec = NULL;
 	PyObject * py_ustr = NULL;
-	PyObject * py_ustr1 = NULL;
 	PyObject * py_bin = NULL;
-	as_record * rec = NULL;
-
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
-	as_operations ops;
-	Py_ssize_t size = PyList_Size(py_list);
-	as_operations_inita(&ops, size);
 
-	if (!self || !self->as) {
-		as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
-		goto CLEANUP;
-	}
+	// A list, or the tuple copy of one
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_list);
 
 	if(py_meta) {
-		AerospikeClient_CheckForMeta(py_meta, &ops, err);
+		AerospikeClient_CheckForMeta(py_meta, ops, err);
 	}
 
 	if (err->code != AEROSPIKE_OK) {
-		goto CLEANUP;
+		return err->code;
 	}
 
 	for ( i = 0; i < size; i++) {
-		PyObject * py_val = PyList_GetItem(py_list, i);
+		PyObject * py_val = PySequence_Fast_GET_ITEM(py_list, i);
 		operation = -1;
 		offset = 0;
+		py_bin = NULL;
+		bin = NULL;
 		if ( PyDict_Check(py_val) ) {
 			PyObject *key_op = NULL, *value = NULL;
 			PyObject * py_value = NULL;
 			Py_ssize_t pos = 0;
 			while (PyDict_Next(py_val, &pos, &key_op, &value)) {
 				if ( ! PyString_Check(key_op) ) {
-					as_error_update(err, AEROSPIKE_ERR_CLIENT, "A operation key must be a string.");
-					goto CLEANUP;
+					return as_error_update(err, AEROSPIKE_ERR_CLIENT, "A operation key must be a string.");
 				} else {
 					char * name = PyString_AsString(key_op);
 					if(!strcmp(name,"op") && (PyInt_Check(value) || PyLong_Check(value))) {
@@ -220,8 +211,7 @@ PyObject *  AerospikeClient_Operate_Invoke(
 					} else if(!strcmp(name, "val")) {
 						py_value = value;
 					} else {
-						as_error_update(err, AEROSPIKE_ERR_PARAM, "operation can contain only op, bin and val keys");
-						goto CLEANUP;
+						return as_error_update(err, AEROSPIKE_ERR_PARAM, "operation can contain only op, bin and val keys");
 					}
 				}
 			}
@@ -233,16 +223,14 @@ PyObject *  AerospikeClient_Operate_Invoke(
 				} else if (PyString_Check(py_bin)) {
 					bin = PyString_AsString(py_bin);
 				} else {
-					as_error_update(err, AEROSPIKE_ERR_PARAM, "Bin name should be of type string");
-					goto CLEANUP;
+					return as_error_update(err, AEROSPIKE_ERR_PARAM, "Bin name should be of type string");
 				}
 			} else if (!py_bin && operation != AS_OPERATOR_TOUCH) {
-				as_error_update(err, AEROSPIKE_ERR_PARAM, "Bin is not given");
-				goto CLEANUP;
+				return as_error_update(err, AEROSPIKE_ERR_PARAM, "Bin is not given");
 			}
 			if (py_value) {
 				if (check_type(py_value, operation)) {
-					return NULL;
+					goto CLEANUP;
 				}
 			} else if ((!py_value) && (operation != AS_OPERATOR_READ)) {
 				as_error_update(err, AEROSPIKE_ERR_PARAM, "Value should be given");
@@ -252,52 +240,126 @@ PyObject *  AerospikeClient_Operate_Invoke(
 			switch(operation) {
 				case AS_OPERATOR_APPEND:
 					if (PyUnicode_Check(py_value)) {
-						py_ustr1 = PyUnicode_AsUTF8String(py_value);
-						val = PyString_AsString(py_ustr1);
+						PyObject * py_uval = PyUnicode_AsUTF8String(py_value);
+						as_operations_add_append_strp(ops, bin, strdup(PyString_AsString(py_uval)), true);
+						Py_DECREF(py_uval);
 					} else {
 						val = PyString_AsString(py_value);
+						if ( POOL_COPIES_STRINGS(static_pool) ) {
+							as_operations_add_append_strp(ops, bin, strdup(val), true);
+						}
+						else {
+							as_operations_add_append_str(ops, bin, val);
+						}
 					}
-					as_operations_add_append_str(&ops, bin, val);
 					break;
 				case AS_OPERATOR_PREPEND:
 					if (PyUnicode_Check(py_value)) {
-						py_ustr1 = PyUnicode_AsUTF8String(py_value);
-						val = PyString_AsString(py_ustr1);
+						PyObject * py_uval = PyUnicode_AsUTF8String(py_value);
+						as_operations_add_prepend_strp(ops, bin, strdup(PyString_AsString(py_uval)), true);
+						Py_DECREF(py_uval);
 					} else {
 						val = PyString_AsString(py_value);
+						if ( POOL_COPIES_STRINGS(static_pool) ) {
+							as_operations_add_prepend_strp(ops, bin, strdup(val), true);
+						}
+						else {
+							as_operations_add_prepend_str(ops, bin, val);
+						}
 					}
-					as_operations_add_prepend_str(&ops, bin, val);
 					break;
 				case AS_OPERATOR_INCR:
 					offset = PyInt_AsLong(py_value);
-					as_operations_add_incr(&ops, bin, offset);
+					as_operations_add_incr(ops, bin, offset);
 					break;
 				case AS_OPERATOR_TOUCH:
 					ttl = PyInt_AsLong(py_value);
-					ops.ttl = ttl;
-					as_operations_add_touch(&ops);
+					ops->ttl = ttl;
+					as_operations_add_touch(ops);
 					break;
 				case AS_OPERATOR_READ:
-					as_operations_add_read(&ops, bin);
+					as_operations_add_read(ops, bin);
 					break;
 				case AS_OPERATOR_WRITE:
-					pyobject_to_astype_write(err, bin, py_value, &put_val, &ops,
-							&static_pool, SERIALIZER_PYTHON);
+					put_val = NULL;
+					pyobject_to_astype_write(err, bin, py_value, &put_val, ops,
+							static_pool, serializer_type);
 					if (err->code != AEROSPIKE_OK) {
 						goto CLEANUP;
 					}
-					as_operations_add_write(&ops, bin, (as_bin_value *) put_val);
+					as_operations_add_write(ops, bin, (as_bin_value *) put_val);
 					break;
 				default:
 					as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid operation given");
 			}
+
+			// Bin names are copied into the operations
+			if (py_ustr) {
+				Py_DECREF(py_ustr);
+				py_ustr = NULL;
+			}
 		}
 	}
 
+	return err->code;
+
+CLEANUP:
+	if (py_ustr) {
+		Py_DECREF(py_ustr);
+	}
+	if (err->code == AEROSPIKE_OK) {
+		// check_type() raised a TypeError
+		return AEROSPIKE_ERR_PARAM;
+	}
+	return err->code;
+}
+
+/**
+ *******************************************************************************************************
+ * This function invokes csdk's API's.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param key                   The C client's as_key that identifies the record.
+ * @param py_list               The list containing op, bin and value.
+ * @param py_meta               The metadata for the operation.
+ * @param operate_policy_p      The value for operate policy.
+ *******************************************************************************************************
+ */
+static
+PyObject *  AerospikeClient_Operate_Invoke(
+	AerospikeClient * self, as_error *err,
+	as_key * key, PyObject * py_list, PyObject * py_meta,
+	as_policy_operate * operate_policy_p)
+{
+	PyObject * py_rec = NULL;
+	as_record * rec = NULL;
+
+	as_static_pool static_pool;
+	as_static_pool_init(&static_pool);
+
+	as_operations ops;
+	Py_ssize_t size = PyList_Size(py_list);
+	as_operations_inita(&ops, size);
+
+	if (!self || !self->as) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_operations(err, py_list, py_meta, &ops, &static_pool,
+				SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	// Initialize record
 	as_record_init(rec, 0);
 
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_operate(self->as, err, operate_policy_p, key, &ops, &rec);
+	PyEval_RestoreThread(_save);
 	if (err->code != AEROSPIKE_OK) {
 		as_error_update(err, err->code, NULL);
 		goto CLEANUP;
@@ -307,20 +369,18 @@ PyObject *  AerospikeClient_Operate_Invoke(
 	}
 
 CLEANUP:
-	if (py_ustr) {
-		Py_DECREF(py_ustr);
-	}
-	if (py_ustr1) {
-		Py_DECREF(py_ustr1);
-	}
 	if (rec) {
 		as_record_destroy(rec);
 	}
 	if (key->valuep) {
 		as_key_destroy(key);
 	}
-	if (put_val) {
-		as_val_destroy(put_val);
+	as_operations_destroy(&ops);
+	as_static_pool_destroy(&static_pool);
+
+	if ( PyErr_Occurred() ) {
+		// A TypeError was raised while converting the operations
+		return NULL;
 	}
 
 	if ( err->code != AEROSPIKE_OK ) {
@@ -427,7 +487,7 @@ PyObject * AerospikeClient_Append(AerospikeClient * self, PyObject * args, PyObj
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -520,7 +580,7 @@ PyObject * AerospikeClient_Prepend(AerospikeClient * self, PyObject * args, PyOb
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -616,7 +676,7 @@ PyObject * AerospikeClient_Increment(AerospikeClient * self, PyObject * args, Py
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -709,7 +769,7 @@ PyObject * AerospikeClient_Touch(AerospikeClient * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -798,7 +858,7 @@ PyObject * AerospikeClient_Operate(AerospikeClient * self, PyObject * args, PyOb
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
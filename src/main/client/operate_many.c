@@ -0,0 +1,251 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
+
+#include "batch_dispatch.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+typedef struct {
+	aerospike * as;
+	as_policy_operate * policy_p;
+	as_operations * ops;
+	as_key * keys;
+	as_record ** recs;
+	as_error ** errors;
+} OperateMany;
+
+/**
+ * Operates on the record of the i-th key, without the GIL. The operations are
+ * only read, so all the keys share them.
+ */
+static void operate_many_run(void * udata, uint32_t i)
+{
+	OperateMany * operate_many = (OperateMany *) udata;
+
+	as_error err;
+	as_error_init(&err);
+
+	aerospike_key_operate(operate_many->as, &err, operate_many->policy_p,
+			&operate_many->keys[i], operate_many->ops, &operate_many->recs[i]);
+
+	if ( err.code != AEROSPIKE_OK ) {
+		operate_many->errors[i] = (as_error *) malloc(sizeof(as_error));
+		if ( operate_many->errors[i] ) {
+			as_error_copy(operate_many->errors[i], &err);
+		}
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Performs the same list of operations on the records of many keys. The
+ * operations are converted once, then applied concurrently to the keys on
+ * the pool of the client and the calling thread, with the GIL released.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list with the result of operate() for each key, in the order of
+ * the keys, or the exception, not raised, of the keys which failed.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Operate_Many(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_list = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate_many", kwlist,
+			&py_keys, &py_list, &py_meta, &py_policy) == false ) {
+		return NULL;
+	}
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_operate operate_policy;
+	as_operations ops;
+	OperateMany operate_many = {NULL, NULL, &ops, NULL, NULL, NULL};
+	bool ops_initialised = false;
+	PyObject * py_ops = NULL;
+	PyObject * py_seq = NULL;
+	PyObject * py_err_key = Py_None;
+	PyObject * py_result = NULL;
+	uint32_t n = 0;
+
+	// The operations are used with the GIL released: their strings are
+	// copied rather than borrowed from dicts other threads can change
+	as_static_pool static_pool;
+	as_static_pool_init(&static_pool);
+	static_pool.copy_strings = true;
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if ( !PyList_Check(py_list) ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	// Convert the operations once for all the keys, from a copy of the list
+	py_ops = PySequence_Tuple(py_list);
+	if ( py_ops == NULL ) {
+		goto CLEANUP;
+	}
+	as_operations_init(&ops, (uint16_t) PyTuple_GET_SIZE(py_ops));
+	ops_initialised = true;
+
+	if ( pyobject_to_operations(&err, py_ops, py_meta, &ops, &static_pool,
+				SERIALIZER_PYTHON) != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	if ( batch_keys_init(&err, py_keys, &py_seq, &operate_many.keys, &n, &py_err_key) != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_operate
+	pyobject_to_policy_operate(&err, py_policy, &operate_policy, &operate_many.policy_p,
+			&self->as->config.policies.operate);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	operate_many.as = self->as;
+	operate_many.recs = (as_record **) calloc(n ? n : 1, sizeof(as_record *));
+	operate_many.errors = (as_error **) calloc(n ? n : 1, sizeof(as_error *));
+	if ( !operate_many.recs || !operate_many.errors ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		goto CLEANUP;
+	}
+
+	ThreadPool * pool = AerospikeClient_Async_Pool(self, &err);
+	if ( pool == NULL ) {
+		goto CLEANUP;
+	}
+
+	// Invoke operation, releasing the GIL for the network round trips
+	Py_BEGIN_ALLOW_THREADS
+	batch_dispatch(pool, self->async_threads, n, operate_many_run, &operate_many);
+	Py_END_ALLOW_THREADS
+
+	// Build the results in the order of the keys
+	py_result = PyList_New(n);
+
+	for ( uint32_t i = 0; py_result && i < n; i++ ) {
+		PyObject * py_item = NULL;
+
+		if ( operate_many.errors[i] ) {
+			PyObject * py_key = NULL;
+			key_to_pyobject(&err, &operate_many.keys[i], &py_key);
+			if ( py_key ) {
+				py_item = batch_error_to_pyobject(operate_many.errors[i], py_key);
+				Py_DECREF(py_key);
+			}
+		}
+		else if ( operate_many.recs[i] ) {
+			record_to_pyobject(&err, operate_many.recs[i], &operate_many.keys[i], &py_item);
+		}
+		else {
+			py_item = PyLong_FromLong(0);
+		}
+
+		if ( py_item == NULL ) {
+			Py_CLEAR(py_result);
+			if ( err.code == AEROSPIKE_OK && !PyErr_Occurred() ) {
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to convert the results");
+			}
+			break;
+		}
+		PyList_SET_ITEM(py_result, i, py_item);
+	}
+
+CLEANUP:
+
+	for ( uint32_t i = 0; i < n; i++ ) {
+		if ( operate_many.recs && operate_many.recs[i] ) {
+			as_record_destroy(operate_many.recs[i]);
+		}
+		if ( operate_many.errors ) {
+			free(operate_many.errors[i]);
+		}
+	}
+	free(operate_many.recs);
+	free(operate_many.errors);
+	batch_keys_destroy(operate_many.keys, n);
+	Py_XDECREF(py_seq);
+	if ( ops_initialised ) {
+		as_operations_destroy(&ops);
+	}
+	as_static_pool_destroy(&static_pool);
+	Py_XDECREF(py_ops);
+
+	if ( PyErr_Occurred() ) {
+		// A TypeError was raised while converting the operations
+		Py_XDECREF(py_result);
+		return NULL;
+	}
+
+	// If an error occurred, tell Python.
+	if ( err.code != AEROSPIKE_OK ) {
+		Py_XDECREF(py_result);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		if(PyObject_HasAttrString(exception_type, "key")) {
+			PyObject_SetAttrString(exception_type, "key", py_err_key);
+		}
+		if(PyObject_HasAttrString(exception_type, "bin")) {
+			PyObject_SetAttrString(exception_type, "bin", Py_None);
+		}
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
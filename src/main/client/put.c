@@ -58,14 +58,13 @@ PyObject * AerospikeClient_Put_Invoke(
 	// Initialisation flags
 	bool key_initialised = false;
 	bool record_initialised = false;
-	int iter=0;
 
 	// Initialize record
 	as_record_init(&rec, 0);
 	record_initialised = true;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	// Initialize error
 	as_error_init(&err);
@@ -75,7 +74,7 @@ PyObject * AerospikeClient_Put_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -100,16 +99,15 @@ PyObject * AerospikeClient_Put_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_put(self->as, &err, write_policy_p, &key, &rec);
+	PyEval_RestoreThread(_save);
 	if ( err.code != AEROSPIKE_OK ) {
 		as_error_update(&err, err.code, NULL);
 	}
 
 CLEANUP:
-    for (iter = 0; iter < static_pool.current_bytes_id; iter++) {
-        as_bytes_destroy(&static_pool.bytes_pool[iter]);
-    }
 	if (key_initialised == true){
 		// Destroy the key if it is initialised.
 		as_key_destroy(&key);
@@ -118,6 +116,8 @@ CLEANUP:
 		// Destroy the record if it is initialised.
 		as_record_destroy(&rec);
 	}
+	// The bins of the record point into the pool
+	as_static_pool_destroy(&static_pool);
 
 	// If an error occurred, tell Python.
 	if ( err.code != AEROSPIKE_OK ) {
@@ -0,0 +1,220 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "batch_dispatch.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "key.h"
+#include "policy.h"
+
+typedef struct {
+	aerospike * as;
+	as_policy_write * policy_p;
+	as_key * keys;
+	as_record * recs;
+	as_status * status;
+} PutMany;
+
+/**
+ * Writes the i-th record, without the GIL.
+ */
+static void put_many_run(void * udata, uint32_t i)
+{
+	PutMany * put_many = (PutMany *) udata;
+
+	as_error err;
+	as_error_init(&err);
+
+	put_many->status[i] = aerospike_key_put(put_many->as, &err, put_many->policy_p,
+			&put_many->keys[i], &put_many->recs[i]);
+}
+
+/**
+ *******************************************************************************************************
+ * Writes a list of records to the Aerospike DB. All the records are converted
+ * first, then written concurrently on the pool of the client and the calling
+ * thread, with the GIL released.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an array.array('i') of the status of each write, in the order of
+ * the records. 0(Zero) is success value.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Put_Many(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_records = NULL;
+	PyObject * py_policy = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"records", "policy", "serializer_option", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|Ol:put_many", kwlist,
+			&py_records, &py_policy, &serializer_option) == false ) {
+		return NULL;
+	}
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_write write_policy;
+	PutMany put_many = {NULL, NULL, NULL, NULL, NULL};
+	as_static_pool static_pool;
+	as_static_pool_init(&static_pool);
+	PyObject * py_seq = NULL;
+	PyObject * py_err_key = Py_None;
+	PyObject * py_result = NULL;
+	uint32_t n = 0;
+	uint32_t n_keys = 0;
+	uint32_t n_recs = 0;
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if ( !PyList_Check(py_records) && !PyTuple_Check(py_records) ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Records should be specified as a list or tuple.");
+		goto CLEANUP;
+	}
+
+	// Hold the records while the GIL is released: the keys borrow the
+	// buffers of their strings. The bins dicts can still be changed by
+	// other threads, so the pool copies the string values
+	static_pool.copy_strings = true;
+	py_seq = PySequence_Tuple(py_records);
+	if ( py_seq == NULL ) {
+		goto CLEANUP;
+	}
+	n = (uint32_t) PyTuple_GET_SIZE(py_seq);
+
+	put_many.as = self->as;
+	put_many.keys = (as_key *) calloc(n ? n : 1, sizeof(as_key));
+	put_many.recs = (as_record *) calloc(n ? n : 1, sizeof(as_record));
+	put_many.status = (as_status *) calloc(n ? n : 1, sizeof(as_status));
+	if ( !put_many.keys || !put_many.recs || !put_many.status ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the records");
+		goto CLEANUP;
+	}
+
+	// Convert all the records in one pass
+	for ( uint32_t i = 0; i < n; i++ ) {
+		PyObject * py_record = PyTuple_GET_ITEM(py_seq, i);
+		Py_ssize_t size = PyTuple_Check(py_record) ? PyTuple_GET_SIZE(py_record) : 0;
+
+		if ( size != 2 && size != 3 ) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Record should be a (key, bins[, meta]) tuple.");
+			py_err_key = py_record;
+			goto CLEANUP;
+		}
+
+		PyObject * py_key = PyTuple_GET_ITEM(py_record, 0);
+		PyObject * py_bins = PyTuple_GET_ITEM(py_record, 1);
+		PyObject * py_meta = size == 3 ? PyTuple_GET_ITEM(py_record, 2) : NULL;
+		py_err_key = py_key;
+
+		pyobject_to_key(&err, py_key, &put_many.keys[i]);
+		if ( err.code != AEROSPIKE_OK ) {
+			goto CLEANUP;
+		}
+		n_keys++;
+
+		// The pool grows on demand, so all the records share it
+		as_record_init(&put_many.recs[i], 0);
+		n_recs++;
+		pyobject_to_record(&err, py_bins, py_meta, &put_many.recs[i], serializer_option, &static_pool);
+		if ( err.code != AEROSPIKE_OK ) {
+			goto CLEANUP;
+		}
+	}
+	py_err_key = Py_None;
+
+	// Convert python policy object to as_policy_write
+	pyobject_to_policy_write(&err, py_policy, &write_policy, &put_many.policy_p,
+			&self->as->config.policies.write);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	ThreadPool * pool = AerospikeClient_Async_Pool(self, &err);
+	if ( pool == NULL ) {
+		goto CLEANUP;
+	}
+
+	// Invoke operation, releasing the GIL for the network round trips
+	Py_BEGIN_ALLOW_THREADS
+	batch_dispatch(pool, self->async_threads, n, put_many_run, &put_many);
+	Py_END_ALLOW_THREADS
+
+	py_result = batch_status_to_pyobject(put_many.status, n);
+
+CLEANUP:
+
+	for ( uint32_t i = 0; i < n_keys; i++ ) {
+		as_key_destroy(&put_many.keys[i]);
+	}
+	for ( uint32_t i = 0; i < n_recs; i++ ) {
+		as_record_destroy(&put_many.recs[i]);
+	}
+	as_static_pool_destroy(&static_pool);
+	free(put_many.keys);
+	free(put_many.recs);
+	free(put_many.status);
+	Py_XDECREF(py_seq);
+
+	// If an error occurred, tell Python.
+	if ( err.code != AEROSPIKE_OK ) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		if(PyObject_HasAttrString(exception_type, "key")) {
+			PyObject_SetAttrString(exception_type, "key", py_err_key);
+		}
+		if(PyObject_HasAttrString(exception_type, "bin")) {
+			PyObject_SetAttrString(exception_type, "bin", Py_None);
+		}
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
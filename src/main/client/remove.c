@@ -63,7 +63,7 @@ PyObject * AerospikeClient_Remove_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -99,8 +99,10 @@ PyObject * AerospikeClient_Remove_Invoke(
 		}
 	}
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_remove(self->as, &err, remove_policy_p, &key);
+	PyEval_RestoreThread(_save);
 	if(err.code != AEROSPIKE_OK) {
 		as_error_update(&err, err.code, NULL);
 	}
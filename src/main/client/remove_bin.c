@@ -132,7 +132,12 @@ PyObject * AerospikeClient_RemoveBin_Invoke(
 		}
 	}
 
-	if (AEROSPIKE_OK != aerospike_key_put(self->as, err, write_policy_p, &key, &rec))
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
+	aerospike_key_put(self->as, err, write_policy_p, &key, &rec);
+	PyEval_RestoreThread(_save);
+
+	if (err->code != AEROSPIKE_OK)
 	{
 		as_error_update(err, err->code, NULL);
 		goto CLEANUP;
@@ -199,7 +204,7 @@ PyObject * AerospikeClient_RemoveBin(AerospikeClient * self, PyObject * args, Py
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
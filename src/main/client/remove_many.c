@@ -0,0 +1,160 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+
+#include "batch_dispatch.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+typedef struct {
+	aerospike * as;
+	as_policy_remove * policy_p;
+	as_key * keys;
+	as_status * status;
+} RemoveMany;
+
+/**
+ * Removes the record of the i-th key, without the GIL.
+ */
+static void remove_many_run(void * udata, uint32_t i)
+{
+	RemoveMany * remove_many = (RemoveMany *) udata;
+
+	as_error err;
+	as_error_init(&err);
+
+	remove_many->status[i] = aerospike_key_remove(remove_many->as, &err,
+			remove_many->policy_p, &remove_many->keys[i]);
+}
+
+/**
+ *******************************************************************************************************
+ * Removes the records of a list of keys from the Aerospike DB. The keys are
+ * converted first, then removed concurrently on the pool of the client and
+ * the calling thread, with the GIL released.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an array.array('i') of the status of each remove, in the order of
+ * the keys. 0(Zero) is success value, 2 means the record was not found.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Remove_Many(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:remove_many", kwlist,
+			&py_keys, &py_policy) == false ) {
+		return NULL;
+	}
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_remove remove_policy;
+	RemoveMany remove_many = {NULL, NULL, NULL, NULL};
+	PyObject * py_seq = NULL;
+	PyObject * py_err_key = Py_None;
+	PyObject * py_result = NULL;
+	uint32_t n = 0;
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	// Convert all the keys in one pass
+	if ( batch_keys_init(&err, py_keys, &py_seq, &remove_many.keys, &n, &py_err_key) != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_remove
+	pyobject_to_policy_remove(&err, py_policy, &remove_policy, &remove_many.policy_p,
+			&self->as->config.policies.remove);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	remove_many.as = self->as;
+	remove_many.status = (as_status *) calloc(n ? n : 1, sizeof(as_status));
+	if ( remove_many.status == NULL ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		goto CLEANUP;
+	}
+
+	ThreadPool * pool = AerospikeClient_Async_Pool(self, &err);
+	if ( pool == NULL ) {
+		goto CLEANUP;
+	}
+
+	// Invoke operation, releasing the GIL for the network round trips
+	Py_BEGIN_ALLOW_THREADS
+	batch_dispatch(pool, self->async_threads, n, remove_many_run, &remove_many);
+	Py_END_ALLOW_THREADS
+
+	py_result = batch_status_to_pyobject(remove_many.status, n);
+
+CLEANUP:
+
+	batch_keys_destroy(remove_many.keys, n);
+	Py_XDECREF(py_seq);
+	free(remove_many.status);
+
+	// If an error occurred, tell Python.
+	if ( err.code != AEROSPIKE_OK ) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		if(PyObject_HasAttrString(exception_type, "key")) {
+			PyObject_SetAttrString(exception_type, "key", py_err_key);
+		}
+		if(PyObject_HasAttrString(exception_type, "bin")) {
+			PyObject_SetAttrString(exception_type, "bin", Py_None);
+		}
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
@@ -83,7 +83,7 @@ PyObject * AerospikeClient_ScanApply_Invoke(
 	PyObject *py_ustr3 = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	// Initialize error
 	as_error_init(&err);
@@ -93,7 +93,7 @@ PyObject * AerospikeClient_ScanApply_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -213,6 +213,8 @@ CLEANUP:
 		as_scan_destroy(&scan);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
@@ -304,7 +306,7 @@ PyObject * AerospikeClient_ScanInfo(AerospikeClient * self, PyObject * args, PyO
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
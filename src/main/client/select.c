@@ -67,7 +67,7 @@ PyObject * AerospikeClient_Select_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -129,8 +129,10 @@ PyObject * AerospikeClient_Select_Invoke(
 	// Initialize record
 	as_record_init(rec, 0);
 
-	// Invoke operation
+	// Invoke operation, releasing the GIL for the network round trip
+	PyThreadState * _save = PyEval_SaveThread();
 	aerospike_key_select(self->as, &err, read_policy_p, &key, (const char **) bins, &rec);
+	PyEval_RestoreThread(_save);
 
 	if ( err.code == AEROSPIKE_OK ) {
 		record_to_pyobject(&err, rec, &key, &py_rec);
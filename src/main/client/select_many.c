@@ -16,6 +16,8 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/aerospike_batch.h>
@@ -24,6 +26,7 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "batch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
@@ -41,23 +44,19 @@
  *************************************************************************
  **/
 PyObject * store_unicode_bins(UnicodePyObjects *u_obj, PyObject * py_uobj){
-	if (u_obj->size < MAX_UNICODE_OBJECTS){
-		u_obj->ob[u_obj->size++] = py_uobj;
-	}
-	return py_uobj;
+	return unicode_objects_add(u_obj, py_uobj);
 }
 
 /**
  ***********************************************************************
  *
- * Callback method, invoked by aerospike_batch_get_bins
+ * Converts the results collected from aerospike_batch_get_bins, once
+ * the GIL has been reacquired.
  *
  * *********************************************************************
  **/
-static bool batch_select_cb(const as_batch_read* results, uint32_t n, void* udata)
+static bool batch_select_to_pyobject(const as_batch_read* results, uint32_t n, PyObject * py_recs)
 {
-	// Typecast udata back to PyObject
-	PyObject * py_recs = (PyObject *) udata;
 
 	// Initialize error object
 	as_error err;
@@ -110,6 +109,104 @@ static bool batch_select_cb(const as_batch_read* results, uint32_t n, void* udat
 	return true;
 }
 
+/**
+ *******************************************************************************************************
+ * Converts a found record of an ordered select_many() to the record tuple.
+ *******************************************************************************************************
+ */
+static
+as_status batch_select_result_to_pyobject(as_error * err, const as_batch_read * result, PyObject ** obj)
+{
+	return record_to_pyobject(err, &result->record, result->key, obj);
+}
+
+/**
+ *********************************************************************
+ * Converts the results of select_many() to columns: a dict of a list
+ * per selected bin, aligned with the keys. A value is None if its
+ * record or bin does not exist.
+ *
+ * @param err                     The as_error to be populated on failure
+ * @param data                    The results of the batch
+ * @param batch                   The batch of keys the results point into
+ * @param bins                    The selected bins
+ * @param n_bins                  The number of selected bins
+ *
+ * Returns the dict of columns, NULL on error.
+ *********************************************************************
+ **/
+static
+PyObject * batch_select_to_columns(as_error * err, const BatchReadResults * data,
+		const as_batch * batch, const char ** bins, uint32_t n_bins)
+{
+	uint32_t n = batch->keys.size;
+
+	PyObject * py_columns = PyDict_New();
+	PyObject ** columns = (PyObject **) calloc(n_bins + 1, sizeof(PyObject *));
+
+	if ( py_columns == NULL || columns == NULL ) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+		goto CLEANUP;
+	}
+
+	for ( uint32_t j = 0; j < n_bins; j++ ) {
+		columns[j] = PyList_New(n);
+		if ( columns[j] == NULL ) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the results");
+			goto CLEANUP;
+		}
+		for ( uint32_t i = 0; i < n; i++ ) {
+			Py_INCREF(Py_None);
+			PyList_SET_ITEM(columns[j], i, Py_None);
+		}
+		PyDict_SetItemString(py_columns, bins[j], columns[j]);
+	}
+
+	for ( uint32_t i = 0; i < data->size; i++ ) {
+		const as_batch_read * result = &data->results[i];
+		uint32_t pos = (uint32_t) (result->key - batch->keys.entries);
+
+		if ( pos >= n || result->result != AEROSPIKE_OK ) {
+			continue;
+		}
+
+		const as_bins * rec_bins = &result->record.bins;
+		for ( uint16_t k = 0; k < rec_bins->size; k++ ) {
+			const as_bin * bin = &rec_bins->entries[k];
+
+			for ( uint32_t j = 0; j < n_bins; j++ ) {
+				if ( strcmp(bin->name, bins[j]) != 0 ) {
+					continue;
+				}
+
+				PyObject * py_val = NULL;
+				if ( val_to_pyobject(err, (as_val *) bin->valuep, &py_val) != AEROSPIKE_OK ) {
+					goto CLEANUP;
+				}
+				PyObject * py_old = PyList_GET_ITEM(columns[j], pos);
+				PyList_SET_ITEM(columns[j], pos, py_val);
+				Py_DECREF(py_old);
+			}
+		}
+	}
+
+CLEANUP:
+
+	if ( columns != NULL ) {
+		for ( uint32_t j = 0; j < n_bins; j++ ) {
+			Py_XDECREF(columns[j]);
+		}
+		free(columns);
+	}
+
+	if ( err->code != AEROSPIKE_OK ) {
+		Py_XDECREF(py_columns);
+		return NULL;
+	}
+
+	return py_columns;
+}
+
 /**
  *********************************************************************
  * This function will invoke aerospike_batch_get_bins to get filtered
@@ -119,16 +216,20 @@ static bool batch_select_cb(const as_batch_read* results, uint32_t n, void* udat
  * @param py_keys                 List of keys passed on by user
  * @param py_bins                 List of filter bins passed on by user
  * @param py_policy               User specified Policy dictionary
+ * @param py_options              User specified options dictionary
  *
  *********************************************************************
  **/
 	static
 PyObject * AerospikeClient_Select_Many_Invoke(
 		AerospikeClient * self,
-		PyObject * py_keys, PyObject * py_bins, PyObject * py_policy)
+		PyObject * py_keys, PyObject * py_bins, PyObject * py_policy,
+		PyObject * py_options)
 {
 	// Python Return Value
-	PyObject * py_recs = PyDict_New();
+	PyObject * py_recs = NULL;
+	PyObject * py_seq = NULL;
+	PyObject * py_bins_seq = NULL;
 
 	// Aerospike Client Arguments
 	as_error err;
@@ -137,15 +238,19 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 	as_policy_batch * batch_policy_p = NULL;
 	Py_ssize_t bins_size = 0;
 	char **filter_bins = NULL;
+	BatchReadOptions options;
+	BatchReadChunking chunking;
+	BatchReadResults batch_results;
 
 	// Unicode object's pool
-	UnicodePyObjects u_objs;
-	u_objs.size = 0;
+	UnicodePyObjects u_objs = { .ob = NULL, .size = 0, .capacity = 0 };
 	int i = 0;
 
 	// Initialisation flags
 	bool batch_initialised = false;
 
+	batch_read_results_init(&batch_results);
+
 	// Initialize error
 	as_error_init(&err);
 
@@ -154,7 +259,7 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	if (!self->is_conn_16) {
+	if (!AerospikeClient_Connected(self)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -162,7 +267,15 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 	// Convert python keys list to as_key ** and add it to as_batch.keys
 	// keys can be specified in PyList or PyTuple
 	if ( py_keys != NULL && PyList_Check(py_keys) ) {
-		Py_ssize_t size = PyList_Size(py_keys);
+		// The keys borrow the strings of the key tuples while the GIL is
+		// released, so they are converted from a copy of the list
+		py_seq = PySequence_Tuple(py_keys);
+		if ( py_seq == NULL ) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the keys");
+			goto CLEANUP;
+		}
+		Py_ssize_t size = PyTuple_GET_SIZE(py_seq);
 
 		as_batch_init(&batch, size);
 		// Batch object initialised
@@ -170,7 +283,7 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 
 		for ( i = 0; i < size; i++ ) {
 
-			PyObject * py_key = PyList_GetItem(py_keys, i);
+			PyObject * py_key = PyTuple_GET_ITEM(py_seq, i);
 
 			if ( !PyTuple_Check(py_key) ){
 				as_error_update(&err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
@@ -212,12 +325,16 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 	}
 
 	// Check the type of bins and get it's size
-	// i.e. number of bins provided
-	if (py_bins != NULL && PyList_Check(py_bins)){
-		bins_size    = PyList_Size(py_bins);
-	}
-	else if (py_bins != NULL && PyTuple_Check(py_bins)){
-		bins_size    = PyTuple_Size(py_bins);
+	// i.e. number of bins provided. The bin names are borrowed while the
+	// GIL is released, from a copy of the list.
+	if (py_bins != NULL && (PyList_Check(py_bins) || PyTuple_Check(py_bins))){
+		py_bins_seq = PySequence_Tuple(py_bins);
+		if (py_bins_seq == NULL) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the bins");
+			goto CLEANUP;
+		}
+		bins_size    = PyTuple_GET_SIZE(py_bins_seq);
 	}
 	else {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Filter bins should be specified as a list or tuple.");
@@ -227,13 +344,7 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 	filter_bins = (char **)malloc(sizeof(long int) * bins_size);
 
 	for (i = 0; i < bins_size; i++){
-		PyObject *py_bin = NULL;
-		if(PyList_Check(py_bins)){
-			py_bin = PyList_GetItem(py_bins, i);
-		}
-		if(PyTuple_Check(py_bins)){
-			py_bin = PyTuple_GetItem(py_bins, i);
-		}
+		PyObject *py_bin = PyTuple_GET_ITEM(py_bins_seq, i);
 		if (PyUnicode_Check(py_bin)){
 			// Store the unicode object into a pool
 			// It is DECREFed at later stages
@@ -257,22 +368,55 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	// Invoke C-client API
-	aerospike_batch_get_bins(self->as, &err, batch_policy_p,
-		&batch, (const char **) filter_bins, bins_size,
-		(aerospike_batch_read_callback) batch_select_cb,
-		py_recs);
+	pyobject_to_batch_read_options(&err, py_options, &options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+	if ( options.output != BATCH_READ_OUTPUT_RECORDS && options.output != BATCH_READ_OUTPUT_COLUMNS ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid value for output");
+		goto CLEANUP;
+	}
+
+	batch_read_chunking_init(&err, self, py_policy, batch.keys.size, &chunking);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Invoke C-client API, collecting the raw results without the GIL.
+	// Large batches are split into several concurrent requests.
+	PyThreadState * _save = PyEval_SaveThread();
+	batch_read(self->as, &err, batch_policy_p, &batch, BATCH_READ_GET_BINS,
+		(const char **) filter_bins, bins_size, &chunking, &batch_results);
+	PyEval_RestoreThread(_save);
+
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
+	// Build the Python results in one pass
+	if ( options.output == BATCH_READ_OUTPUT_COLUMNS ) {
+		py_recs = batch_select_to_columns(&err, &batch_results, &batch,
+				(const char **) filter_bins, bins_size);
+	}
+	else if ( options.ordered ) {
+		py_recs = batch_read_results_to_list(&err, &batch_results, &batch,
+				batch_select_result_to_pyobject);
+	}
+	else {
+		py_recs = PyDict_New();
+		batch_select_to_pyobject(batch_results.results, batch_results.size, py_recs);
+	}
 
 CLEANUP:
 
+	batch_read_results_destroy(&batch_results);
+
 	if (filter_bins != NULL){
 		free(filter_bins);
 	}
 
 	// DECREFed all the unicode objects stored in Pool
-	for ( i = 0; i< u_objs.size; i++){
-		Py_DECREF(u_objs.ob[i]);
-	}
+	unicode_objects_destroy(&u_objs);
 
 	if (batch_initialised == true){
 		// We should destroy batch object as we are using 'as_batch_init' for initialisation
@@ -280,6 +424,8 @@ CLEANUP:
 		// is necessary.
 		as_batch_destroy(&batch);
 	}
+	Py_XDECREF(py_seq);
+	Py_XDECREF(py_bins_seq);
 
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
@@ -293,6 +439,7 @@ CLEANUP:
 		}
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(py_recs);
 		return NULL;
 	}
 	return py_recs;
@@ -304,16 +451,18 @@ PyObject * AerospikeClient_Select_Many(AerospikeClient * self, PyObject * args,
 	PyObject * py_keys = NULL;
 	PyObject * py_bins = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"keys", "bins", "policy", NULL};
+	static char * kwlist[] = {"keys", "bins", "policy", "options", NULL};
 
 	// Python Function Argument Parsing
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:select_many", kwlist, 
-				&py_keys, &py_bins, &py_policy) == false ) {
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:select_many", kwlist, 
+				&py_keys, &py_bins, &py_policy, &py_options) == false ) {
 		return NULL;
 	}
 
 	// Invoke Operation
-	return AerospikeClient_Select_Many_Invoke(self, py_keys, py_bins, py_policy);
+	return AerospikeClient_Select_Many_Invoke(self, py_keys, py_bins, py_policy,
+			py_options);
 }
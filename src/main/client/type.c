@@ -24,11 +24,36 @@
 #include <aerospike/as_policy.h>
 
 #include "admin.h"
+#include "batch.h"
 #include "client.h"
 #include "policy.h"
 #include "conversions.h"
 #include "exceptions.h"
 
+/*******************************************************************************
+ * PICKLING
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Pickles the client as its configuration. The unpickled client is an
+ * equivalent client, not yet connected, which can be sent to the workers of
+ * a multiprocessing pool.
+ *
+ * @param self                  AerospikeClient object
+ *
+ * Returns a tuple (aerospike.Client, (config,)).
+ *******************************************************************************************************
+ */
+static PyObject * AerospikeClient_Reduce(AerospikeClient * self)
+{
+	PyObject * py_config = PyDict_Copy(self->py_config);
+	if ( ! py_config ) {
+		return NULL;
+	}
+	return Py_BuildValue("(O(N))", (PyObject *) Py_TYPE(self), py_config);
+}
+
 /*******************************************************************************
  * PYTHON TYPE METHODS
  ******************************************************************************/
@@ -46,6 +71,12 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	{"is_connected",
 		(PyCFunction) AerospikeClient_is_connected, METH_VARARGS | METH_KEYWORDS,
 		"Checks current connection state."},
+	{"config",
+		(PyCFunction) AerospikeClient_Config, METH_VARARGS | METH_KEYWORDS,
+		"Returns the effective configuration of the client."},
+	{"__reduce__",
+		(PyCFunction) AerospikeClient_Reduce, METH_NOARGS,
+		"Pickles the client as its configuration."},
 
 	// ADMIN OPERATIONS
 
@@ -141,6 +172,25 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 		(PyCFunction) AerospikeClient_Query, METH_VARARGS | METH_KEYWORDS,
 		"Create a new Query object for peforming queries."},
 
+	// ASYNC OPERATIONS
+
+	{"get_async",
+		(PyCFunction) AerospikeClient_Get_Async, METH_VARARGS | METH_KEYWORDS,
+		"Read a record, returning a concurrent.futures.Future."},
+	{"put_async",
+		(PyCFunction) AerospikeClient_Put_Async, METH_VARARGS | METH_KEYWORDS,
+		"Write a record, returning a concurrent.futures.Future."},
+	{"operate_async",
+		(PyCFunction) AerospikeClient_Operate_Async, METH_VARARGS | METH_KEYWORDS,
+		"Perform multiple operations on a record, returning a concurrent.futures.Future."},
+	{"get_many_async",
+		(PyCFunction) AerospikeClient_Get_Many_Async, METH_VARARGS | METH_KEYWORDS,
+		"Read a batch of records, returning a concurrent.futures.Future."},
+
+	{"async_client",
+		(PyCFunction) AerospikeClient_Async_Client, METH_VARARGS | METH_KEYWORDS,
+		"Create a new AsyncClient object for performing requests with callbacks."},
+
 	// SCAN OPERATIONS
 
 	{"scan",
@@ -235,9 +285,24 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	{"exists_many",
 		(PyCFunction)AerospikeClient_Exists_Many, METH_VARARGS | METH_KEYWORDS,
 		"Check existence of  many records at a time."},
+	{"put_many",
+		(PyCFunction)AerospikeClient_Put_Many, METH_VARARGS | METH_KEYWORDS,
+		"Write many records at a time."},
+	{"remove_many",
+		(PyCFunction)AerospikeClient_Remove_Many, METH_VARARGS | METH_KEYWORDS,
+		"Remove many records at a time."},
+	{"operate_many",
+		(PyCFunction)AerospikeClient_Operate_Many, METH_VARARGS | METH_KEYWORDS,
+		"Perform the same operations on many records at a time."},
+	{"apply_many",
+		(PyCFunction)AerospikeClient_Apply_Many, METH_VARARGS | METH_KEYWORDS,
+		"Apply a UDF on many records at a time."},
 	{"get_key_digest",
 		(PyCFunction)AerospikeClient_Get_Key_Digest, METH_VARARGS | METH_KEYWORDS,
 		"Get key digest"},
+	{"get_key_digest_many",
+		(PyCFunction)AerospikeClient_Get_Key_Digest_Many, METH_VARARGS | METH_KEYWORDS,
+		"Get the digests of many keys as contiguous bytes"},
 	{NULL}
 };
 
@@ -272,6 +337,28 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 		return -1;
 	}
 
+	// Keep a private copy of the config, the client can be rebuilt from it
+	// after a fork or by unpickling, and the addresses of the hosts point to
+	// the strings of its list of hosts.
+	py_config = PyDict_Copy(py_config);
+	if ( ! py_config ) {
+		return -1;
+	}
+
+	PyObject * py_hosts_list = PyDict_GetItemString(py_config, "hosts");
+	if ( py_hosts_list && PyList_Check(py_hosts_list) ) {
+		PyObject * py_hosts_copy = PyList_GetSlice(py_hosts_list, 0, PyList_Size(py_hosts_list));
+		if ( ! py_hosts_copy ) {
+			Py_DECREF(py_config);
+			return -1;
+		}
+		PyDict_SetItemString(py_config, "hosts", py_hosts_copy);
+		Py_DECREF(py_hosts_copy);
+	}
+
+	Py_XDECREF(self->py_config);
+	self->py_config = py_config;
+
 	as_config config;
 	as_config_init(&config);
 
@@ -408,6 +495,79 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 		config.conn_timeout_ms = PyInt_AsLong(py_connect_timeout);
 	}
 
+	// Connection pool and threads of the C client
+	PyObject * py_max_conns = PyDict_GetItemString(py_config, "max_conns_per_node");
+	if ( py_max_conns && PyInt_Check(py_max_conns) && PyInt_AsLong(py_max_conns) > 0 ) {
+		config.max_conns_per_node = (uint32_t) PyInt_AsLong(py_max_conns);
+	}
+
+	PyObject * py_tend_interval = PyDict_GetItemString(py_config, "tend_interval");
+	if ( py_tend_interval && PyInt_Check(py_tend_interval) && PyInt_AsLong(py_tend_interval) > 0 ) {
+		config.tender_interval = (uint32_t) PyInt_AsLong(py_tend_interval);
+	}
+
+	PyObject * py_thread_pool_size = PyDict_GetItemString(py_config, "thread_pool_size");
+	if ( py_thread_pool_size && PyInt_Check(py_thread_pool_size) && PyInt_AsLong(py_thread_pool_size) > 0 ) {
+		config.thread_pool_size = (uint32_t) PyInt_AsLong(py_thread_pool_size);
+	}
+
+	// Shared memory cluster tending: one process of the host tends the
+	// cluster and shares the partition map with the other processes
+	PyObject * py_shm = PyDict_GetItemString(py_config, "shm");
+	if ( py_shm && PyDict_Check(py_shm) ) {
+
+		config.use_shm = true;
+
+		PyObject * py_shm_max_nodes = PyDict_GetItemString(py_shm, "shm_max_nodes");
+		if ( py_shm_max_nodes && PyInt_Check(py_shm_max_nodes) ) {
+			config.shm_max_nodes = (uint32_t) PyInt_AsLong(py_shm_max_nodes);
+		}
+
+		PyObject * py_shm_max_namespaces = PyDict_GetItemString(py_shm, "shm_max_namespaces");
+		if ( py_shm_max_namespaces && PyInt_Check(py_shm_max_namespaces) ) {
+			config.shm_max_namespaces = (uint32_t) PyInt_AsLong(py_shm_max_namespaces);
+		}
+
+		PyObject * py_shm_takeover_threshold_sec = PyDict_GetItemString(py_shm, "shm_takeover_threshold_sec");
+		if ( py_shm_takeover_threshold_sec && PyInt_Check(py_shm_takeover_threshold_sec) ) {
+			config.shm_takeover_threshold_sec = (uint32_t) PyInt_AsLong(py_shm_takeover_threshold_sec);
+		}
+
+		PyObject * py_shm_key = PyDict_GetItemString(py_shm, "shm_key");
+		if ( py_shm_key && PyInt_Check(py_shm_key) ) {
+			config.shm_key = (int) PyInt_AsLong(py_shm_key);
+		}
+		else if ( py_shm_key && PyLong_Check(py_shm_key) ) {
+			config.shm_key = (int) PyLong_AsUnsignedLong(py_shm_key);
+		}
+	}
+
+	// Threads serving the *_async() methods
+	PyObject * py_async_threads = PyDict_GetItemString(py_config, "async_threads");
+	if ( py_async_threads && PyInt_Check(py_async_threads) && PyInt_AsLong(py_async_threads) > 0 ) {
+		self->async_threads = (uint32_t) PyInt_AsLong(py_async_threads);
+	}
+	else {
+		self->async_threads = AEROSPIKE_ASYNC_THREADS;
+	}
+
+	// Splitting of the batch reads, 0 disables it
+	PyObject * py_batch_max_keys = PyDict_GetItemString(py_config, "batch_max_keys");
+	if ( py_batch_max_keys && PyInt_Check(py_batch_max_keys) && PyInt_AsLong(py_batch_max_keys) >= 0 ) {
+		self->batch_max_keys = (uint32_t) PyInt_AsLong(py_batch_max_keys);
+	}
+	else {
+		self->batch_max_keys = BATCH_MAX_KEYS;
+	}
+
+	PyObject * py_batch_max_concurrent = PyDict_GetItemString(py_config, "batch_max_concurrent");
+	if ( py_batch_max_concurrent && PyInt_Check(py_batch_max_concurrent) && PyInt_AsLong(py_batch_max_concurrent) > 0 ) {
+		self->batch_max_concurrent = (uint32_t) PyInt_AsLong(py_batch_max_concurrent);
+	}
+	else {
+		self->batch_max_concurrent = 0;
+	}
+
 	self->as = aerospike_new(&config);
 
 	return 0;
@@ -415,6 +575,10 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 
 static void AerospikeClient_Type_Dealloc(PyObject * self)
 {
+	// The async pool of the parent process has no threads in a child
+	AerospikeClient_Detach_Fork((AerospikeClient *) self);
+	AerospikeClient_Async_Pool_Destroy((AerospikeClient *) self);
+	Py_CLEAR(((AerospikeClient *) self)->py_config);
 	self->ob_type->tp_free((PyObject *) self);
 }
 
@@ -16,6 +16,8 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
 
 #include <aerospike/as_admin.h>
 #include <aerospike/as_error.h>
@@ -369,7 +371,12 @@ as_status pyobject_to_val(as_error * err, PyObject * py_obj, as_val ** val, as_s
 	}
 	else if ( PyString_Check(py_obj) ) {
 		char * s = PyString_AsString(py_obj);
-		*val = (as_val *) as_string_new(s, false);
+		if ( POOL_COPIES_STRINGS(static_pool) ) {
+			*val = (as_val *) as_string_new(strdup(s), true);
+		}
+		else {
+			*val = (as_val *) as_string_new(s, false);
+		}
 	}
 	else if ( PyUnicode_Check(py_obj) ) {
 		PyObject * py_ustr = PyUnicode_AsUTF8String(py_obj);
@@ -476,7 +483,12 @@ as_status pyobject_to_record(as_error * err, PyObject * py_rec,
 			}
 			else if ( PyString_Check(value) ) {
 				char * val = PyString_AsString(value);
-				ret_val = as_record_set_strp(rec, name, val, false);
+				if ( POOL_COPIES_STRINGS(static_pool) ) {
+					ret_val = as_record_set_strp(rec, name, strdup(val), true);
+				}
+				else {
+					ret_val = as_record_set_strp(rec, name, val, false);
+				}
 			}
 			else if ( PyByteArray_Check(value) ) {
 				as_bytes *bytes;
@@ -582,7 +594,12 @@ as_status pyobject_to_astype_write(as_error * err, char *bin_name,  PyObject * p
 	}
 	else if ( PyString_Check(py_value) ) {
 		char * s = PyString_AsString(py_value);
-		*val = (as_val *) as_string_new(s, false);
+		if ( POOL_COPIES_STRINGS(static_pool) ) {
+			*val = (as_val *) as_string_new(strdup(s), true);
+		}
+		else {
+			*val = (as_val *) as_string_new(s, false);
+		}
 	}
 	else if ( PyUnicode_Check(py_value) ) {
 		PyObject * py_ustr = PyUnicode_AsUTF8String(py_value);
@@ -593,7 +610,17 @@ as_status pyobject_to_astype_write(as_error * err, char *bin_name,  PyObject * p
 	else if ( PyByteArray_Check(py_value) ) {
 		uint8_t * b = (uint8_t *) PyByteArray_AsString(py_value);
 		uint32_t z = (uint32_t) PyByteArray_Size(py_value);
-		*val = (as_val *) as_bytes_new_wrap(b, z, false);
+		if ( POOL_COPIES_STRINGS(static_pool) ) {
+			uint8_t * copy = (uint8_t *) malloc(z);
+			if ( copy == NULL ) {
+				return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+			}
+			memcpy(copy, b, z);
+			*val = (as_val *) as_bytes_new_wrap(copy, z, true);
+		}
+		else {
+			*val = (as_val *) as_bytes_new_wrap(b, z, false);
+		}
 	}
 	else if ( PyList_Check(py_value) ) {
 		as_list * list = NULL;
@@ -947,20 +974,27 @@ as_status record_to_pyobject(as_error * err, const as_record * rec, const as_key
 		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "record is null");
 	}
 
-	PyObject * py_rec = NULL;
 	PyObject * py_rec_key = NULL;
-	PyObject * py_rec_meta = NULL;
-	PyObject * py_rec_bins = NULL;
 
 	key_to_pyobject(err, key ? key : &rec->key, &py_rec_key);
-	metadata_to_pyobject(err, rec, &py_rec_meta);
-	bins_to_pyobject(err, rec, &py_rec_bins);
 
 	if ( py_rec_key == NULL ) {
 		Py_INCREF(Py_None);
 		py_rec_key = Py_None;
 	}
 
+	return record_with_key_to_pyobject(err, rec, py_rec_key, obj);
+}
+
+as_status record_with_key_to_pyobject(as_error * err, const as_record * rec, PyObject * py_rec_key, PyObject ** obj)
+{
+	PyObject * py_rec = NULL;
+	PyObject * py_rec_meta = NULL;
+	PyObject * py_rec_bins = NULL;
+
+	metadata_to_pyobject(err, rec, &py_rec_meta);
+	bins_to_pyobject(err, rec, &py_rec_bins);
+
 	if ( py_rec_meta == NULL ) {
 		Py_INCREF(Py_None);
 		py_rec_meta = Py_None;
@@ -981,6 +1015,11 @@ as_status record_to_pyobject(as_error * err, const as_record * rec, const as_key
 }
 
 as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
+{
+	return key_to_pyobject_cached(err, key, NULL, NULL, false, obj);
+}
+
+as_status key_to_pyobject_cached(as_error * err, const as_key * key, PyObject * py_ns, PyObject * py_set_name, bool digest_bytes, PyObject ** obj)
 {
 	as_error_reset(err);
 
@@ -995,11 +1034,19 @@ as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
 	PyObject * py_key = NULL;
 	PyObject * py_digest = NULL;
 
-	if ( key->ns && strlen(key->ns) > 0 ) {
+	if ( py_ns ) {
+		Py_INCREF(py_ns);
+		py_namespace = py_ns;
+	}
+	else if ( key->ns && strlen(key->ns) > 0 ) {
 		py_namespace = PyString_FromString(key->ns);
 	}
 
-	if ( key->set && strlen(key->set) > 0 ) {
+	if ( py_set_name ) {
+		Py_INCREF(py_set_name);
+		py_set = py_set_name;
+	}
+	else if ( key->set && strlen(key->set) > 0 ) {
 		py_set = PyString_FromString(key->set);
 	}
 
@@ -1038,7 +1085,10 @@ as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
 		}
 	}
 
-	if ( key->digest.init ) {
+	if ( key->digest.init && digest_bytes ) {
+		py_digest = PyString_FromStringAndSize((char *) key->digest.value, AS_DIGEST_VALUE_SIZE);
+	}
+	else if ( key->digest.init ) {
 		py_digest = PyByteArray_FromStringAndSize((char *) key->digest.value, AS_DIGEST_VALUE_SIZE);
 	}
 
@@ -1074,6 +1124,45 @@ as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
 	return err->code;
 }
 
+/**
+ * Bin names are converted for every bin of every record, so the Python
+ * strings of the most recently seen names are interned and kept in a
+ * direct mapped cache, which relies on the GIL for its consistency.
+ */
+#define BIN_NAME_CACHE_SIZE 1024
+
+static PyObject * bin_name_cache[BIN_NAME_CACHE_SIZE];
+
+PyObject * bin_name_to_pyobject(const char * name)
+{
+	// FNV-1a hash of the name, which is at most AS_BIN_NAME_MAX_LEN long
+	uint32_t hash = 2166136261u;
+	size_t len = 0;
+	for ( const char * c = name; *c; c++, len++ ) {
+		hash = (hash ^ (uint8_t) *c) * 16777619u;
+	}
+
+	PyObject ** slot = &bin_name_cache[hash % BIN_NAME_CACHE_SIZE];
+	PyObject * py_name = *slot;
+
+	if ( py_name && (size_t) PyString_GET_SIZE(py_name) == len &&
+			memcmp(PyString_AS_STRING(py_name), name, len) == 0 ) {
+		Py_INCREF(py_name);
+		return py_name;
+	}
+
+	py_name = PyString_InternFromString(name);
+	if ( py_name == NULL ) {
+		return NULL;
+	}
+
+	Py_XDECREF(*slot);
+	Py_INCREF(py_name);
+	*slot = py_name;
+
+	return py_name;
+}
+
 static bool bins_to_pyobject_each(const char * name, const as_val * val, void * udata)
 {
 	if ( name == NULL || val == NULL ) {
@@ -1091,8 +1180,17 @@ static bool bins_to_pyobject_each(const char * name, const as_val * val, void *
 		return false;
 	}
 
-	PyDict_SetItemString(py_bins, name, py_val);
+	PyObject * py_name = bin_name_to_pyobject(name);
+	if ( py_name == NULL ) {
+		PyErr_Clear();
+		Py_DECREF(py_val);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to convert the bin name");
+		return false;
+	}
+
+	PyDict_SetItem(py_bins, py_name, py_val);
 
+	Py_DECREF(py_name);
 	Py_DECREF(py_val);
 
 	convd->count++;
@@ -1108,7 +1206,8 @@ as_status bins_to_pyobject(as_error * err, const as_record * rec, PyObject ** py
 		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "record is null");
 	}
 
-	*py_bins = PyDict_New();
+	// Sized up front, so the dict is not resized while the bins are added
+	*py_bins = _PyDict_NewPresized(rec->bins.size);
 
 	conversion_data convd = {
 		.err = err,
@@ -1149,6 +1248,38 @@ as_status metadata_to_pyobject(as_error * err, const as_record * rec, PyObject *
 	return err->code;
 }
 
+PyObject * unicode_objects_add(UnicodePyObjects * u_objs, PyObject * py_uobj)
+{
+	if ( py_uobj == NULL ) {
+		return NULL;
+	}
+
+	if ( u_objs->size == u_objs->capacity ) {
+		int capacity = u_objs->capacity ? u_objs->capacity * 2 : 8;
+		PyObject ** ob = (PyObject **) PyMem_Realloc(u_objs->ob, sizeof(PyObject *) * capacity);
+		if ( ob == NULL ) {
+			// The string must outlive its use by the caller, so it is leaked
+			return py_uobj;
+		}
+		u_objs->ob = ob;
+		u_objs->capacity = capacity;
+	}
+
+	u_objs->ob[u_objs->size++] = py_uobj;
+	return py_uobj;
+}
+
+void unicode_objects_destroy(UnicodePyObjects * u_objs)
+{
+	for ( int i = 0; i < u_objs->size; i++ ) {
+		Py_DECREF(u_objs->ob[i]);
+	}
+	PyMem_Free(u_objs->ob);
+	u_objs->ob = NULL;
+	u_objs->size = 0;
+	u_objs->capacity = 0;
+}
+
 bool error_to_pyobject(const as_error * err, PyObject ** obj)
 {
 	PyObject * py_file = NULL;
@@ -1202,3 +1333,68 @@ void initialize_ldt(as_error *error, as_ldt* ldt_p, char* bin_name,
 		as_error_update(error, AEROSPIKE_ERR_PARAM, "Unable to initialize LDT");
     }
 }
+
+as_status pyobject_to_int64_buffer(as_error * err, PyObject * py_obj, Int64Buffer * buffer)
+{
+	as_error_reset(err);
+
+	buffer->values = NULL;
+	buffer->size = 0;
+	buffer->has_view = false;
+
+	if ( PyObject_CheckBuffer(py_obj) ) {
+		if ( PyObject_GetBuffer(py_obj, &buffer->view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0 ) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "keys must be a contiguous array of int64");
+		}
+		buffer->has_view = true;
+
+		// Native or little endian signed 64 bit integers only
+		const char * format = buffer->view.format ? buffer->view.format : "B";
+		char type = format[strlen(format) - 1];
+		if ( buffer->view.itemsize != sizeof(int64_t) || (type != 'q' && type != 'l') ||
+				format[0] == '>' || format[0] == '!' ) {
+			int64_buffer_release(buffer);
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "keys must be an array of int64");
+		}
+
+		buffer->values = (const int64_t *) buffer->view.buf;
+		buffer->size = buffer->view.len / sizeof(int64_t);
+	}
+	else if ( PyObject_HasAttrString(py_obj, "typecode") && PyObject_HasAttrString(py_obj, "itemsize") ) {
+		// array.array only supports the old buffer protocol
+		PyObject * py_typecode = PyObject_GetAttrString(py_obj, "typecode");
+		PyObject * py_itemsize = PyObject_GetAttrString(py_obj, "itemsize");
+		bool int64 = py_typecode && PyString_Check(py_typecode) &&
+			strcmp(PyString_AsString(py_typecode), "l") == 0 &&
+			py_itemsize && PyInt_Check(py_itemsize) &&
+			PyInt_AsLong(py_itemsize) == sizeof(int64_t);
+		Py_XDECREF(py_typecode);
+		Py_XDECREF(py_itemsize);
+
+		const void * values = NULL;
+		Py_ssize_t len = 0;
+		if ( ! int64 || PyObject_AsReadBuffer(py_obj, &values, &len) != 0 ) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "keys must be an array of int64");
+		}
+
+		buffer->values = (const int64_t *) values;
+		buffer->size = len / sizeof(int64_t);
+	}
+	else {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "keys must be an array of int64");
+	}
+
+	return err->code;
+}
+
+void int64_buffer_release(Int64Buffer * buffer)
+{
+	if ( buffer->has_view ) {
+		PyBuffer_Release(&buffer->view);
+		buffer->has_view = false;
+	}
+	buffer->values = NULL;
+	buffer->size = 0;
+}
@@ -49,7 +49,7 @@ PyObject * AerospikeLList_Add(AerospikeLList * self, PyObject * args, PyObject *
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -67,7 +67,7 @@ PyObject * AerospikeLList_Add(AerospikeLList * self, PyObject * args, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -96,6 +96,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -139,7 +141,7 @@ PyObject * AerospikeLList_Add_Many(AerospikeLList * self, PyObject * args, PyObj
 	as_list* arglist = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -157,7 +159,7 @@ PyObject * AerospikeLList_Add_Many(AerospikeLList * self, PyObject * args, PyObj
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -194,6 +196,8 @@ CLEANUP:
 		as_list_destroy(arglist);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -239,7 +243,7 @@ PyObject * AerospikeLList_Get(AerospikeLList * self, PyObject * args, PyObject *
 	as_list* list_p = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -257,7 +261,7 @@ PyObject * AerospikeLList_Get(AerospikeLList * self, PyObject * args, PyObject *
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -295,6 +299,8 @@ CLEANUP:
 		as_list_destroy(list_p);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -340,7 +346,7 @@ PyObject * AerospikeLList_Filter(AerospikeLList * self, PyObject * args, PyObjec
 	as_list* elements_list = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -358,7 +364,7 @@ PyObject * AerospikeLList_Filter(AerospikeLList * self, PyObject * args, PyObjec
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -405,6 +411,8 @@ CLEANUP:
 		as_list_destroy(arg_list);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -461,7 +469,7 @@ PyObject * AerospikeLList_Destroy(AerospikeLList * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -523,7 +531,7 @@ PyObject * AerospikeLList_Remove(AerospikeLList * self, PyObject * args, PyObjec
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -541,7 +549,7 @@ PyObject * AerospikeLList_Remove(AerospikeLList * self, PyObject * args, PyObjec
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -568,6 +576,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -625,7 +635,7 @@ PyObject * AerospikeLList_Size(AerospikeLList * self, PyObject * args, PyObject
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
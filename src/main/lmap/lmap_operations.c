@@ -51,7 +51,7 @@ PyObject * AerospikeLMap_Put(AerospikeLMap * self, PyObject * args, PyObject * k
 	as_val * map_value = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -69,7 +69,7 @@ PyObject * AerospikeLMap_Put(AerospikeLMap * self, PyObject * args, PyObject * k
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -107,6 +107,8 @@ CLEANUP:
 		as_val_destroy(map_value);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -150,7 +152,7 @@ PyObject * AerospikeLMap_Put_Many(AerospikeLMap * self, PyObject * args, PyObjec
 	as_map* map_values = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -168,7 +170,7 @@ PyObject * AerospikeLMap_Put_Many(AerospikeLMap * self, PyObject * args, PyObjec
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -205,6 +207,8 @@ CLEANUP:
 		as_map_destroy(map_values);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -250,7 +254,7 @@ PyObject * AerospikeLMap_Get(AerospikeLMap * self, PyObject * args, PyObject * k
 	as_val* map_key_value = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -267,7 +271,7 @@ PyObject * AerospikeLMap_Get(AerospikeLMap * self, PyObject * args, PyObject * k
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -305,6 +309,8 @@ CLEANUP:
 		as_val_destroy(map_key_value);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -350,7 +356,7 @@ PyObject * AerospikeLMap_Filter(AerospikeLMap * self, PyObject * args, PyObject
 	as_map* elements = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -367,7 +373,7 @@ PyObject * AerospikeLMap_Filter(AerospikeLMap * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -414,6 +420,8 @@ CLEANUP:
 		as_list_destroy(arg_list);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -469,7 +477,7 @@ PyObject * AerospikeLMap_Destroy(AerospikeLMap * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -531,7 +539,7 @@ PyObject * AerospikeLMap_Remove(AerospikeLMap * self, PyObject * args, PyObject
 	as_val * map_key = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -548,7 +556,7 @@ PyObject * AerospikeLMap_Remove(AerospikeLMap * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -577,6 +585,8 @@ CLEANUP:
 		as_val_destroy(map_key);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -633,7 +643,7 @@ PyObject * AerospikeLMap_Size(AerospikeLMap * self, PyObject * args, PyObject *
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -49,7 +49,7 @@ PyObject * AerospikeLSet_Add(AerospikeLSet * self, PyObject * args, PyObject * k
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -66,7 +66,7 @@ PyObject * AerospikeLSet_Add(AerospikeLSet * self, PyObject * args, PyObject * k
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -95,6 +95,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -138,7 +140,7 @@ PyObject * AerospikeLSet_Add_Many(AerospikeLSet * self, PyObject * args, PyObjec
 	as_list* arglist = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -155,7 +157,7 @@ PyObject * AerospikeLSet_Add_Many(AerospikeLSet * self, PyObject * args, PyObjec
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -192,6 +194,8 @@ CLEANUP:
 		as_list_destroy(arglist);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -237,7 +241,7 @@ PyObject * AerospikeLSet_Get(AerospikeLSet * self, PyObject * args, PyObject * k
 	as_val* return_val_p = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -254,7 +258,7 @@ PyObject * AerospikeLSet_Get(AerospikeLSet * self, PyObject * args, PyObject * k
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -292,6 +296,8 @@ CLEANUP:
 		as_val_destroy(return_val_p);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -337,7 +343,7 @@ PyObject * AerospikeLSet_Filter(AerospikeLSet * self, PyObject * args, PyObject
 	as_list* elements_list = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -354,7 +360,7 @@ PyObject * AerospikeLSet_Filter(AerospikeLSet * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -401,6 +407,8 @@ CLEANUP:
 		as_list_destroy(arg_list);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -456,7 +464,7 @@ PyObject * AerospikeLSet_Destroy(AerospikeLSet * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -520,7 +528,7 @@ PyObject * AerospikeLSet_Exists(AerospikeLSet * self, PyObject * args, PyObject
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -537,7 +545,7 @@ PyObject * AerospikeLSet_Exists(AerospikeLSet * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -568,6 +576,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -615,7 +625,7 @@ PyObject * AerospikeLSet_Remove(AerospikeLSet * self, PyObject * args, PyObject
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -632,7 +642,7 @@ PyObject * AerospikeLSet_Remove(AerospikeLSet * self, PyObject * args, PyObject
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -661,6 +671,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -717,7 +729,7 @@ PyObject * AerospikeLSet_Size(AerospikeLSet * self, PyObject * args, PyObject *
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -51,7 +51,7 @@ PyObject * AerospikeLStack_Push(AerospikeLStack * self, PyObject * args, PyObjec
 	as_val * val = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	//Error Initialization
 	as_error err;
@@ -69,7 +69,7 @@ PyObject * AerospikeLStack_Push(AerospikeLStack * self, PyObject * args, PyObjec
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -98,6 +98,8 @@ CLEANUP:
 		as_val_destroy(val);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -145,7 +147,7 @@ PyObject * AerospikeLStack_Push_Many(AerospikeLStack * self, PyObject * args, Py
 	as_list* arglist = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	static char * kwlist[] = {"values", "policy", NULL};
 
@@ -159,7 +161,7 @@ PyObject * AerospikeLStack_Push_Many(AerospikeLStack * self, PyObject * args, Py
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -196,6 +198,8 @@ CLEANUP:
 		as_list_destroy(arglist);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -254,7 +258,7 @@ PyObject * AerospikeLStack_Peek(AerospikeLStack * self, PyObject * args, PyObjec
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -332,7 +336,7 @@ PyObject * AerospikeLStack_Filter(AerospikeLStack * self, PyObject * args, PyObj
 	as_list* elements_list = NULL;
 
 	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	as_static_pool_init(&static_pool);
 
 	as_error err;
 	as_error_init(&err);
@@ -349,7 +353,7 @@ PyObject * AerospikeLStack_Filter(AerospikeLStack * self, PyObject * args, PyObj
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -396,6 +400,8 @@ CLEANUP:
 		as_list_destroy(arg_list);
 	}
 
+	as_static_pool_destroy(&static_pool);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL, *py_key = NULL;
 		PyObject *exception_type = raise_exception(&err);
@@ -451,7 +457,7 @@ PyObject * AerospikeLStack_Destroy(AerospikeLStack * self, PyObject * args, PyOb
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -525,7 +531,7 @@ PyObject * AerospikeLStack_Get_Capacity(AerospikeLStack * self, PyObject * args,
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -600,7 +606,7 @@ PyObject * AerospikeLStack_Set_Capacity(AerospikeLStack * self, PyObject * args,
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -677,7 +683,7 @@ PyObject * AerospikeLStack_Size(AerospikeLStack * self, PyObject * args, PyObjec
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
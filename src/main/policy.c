@@ -180,6 +180,10 @@ void set_scan_options(as_error *err, as_scan* scan_p, PyObject * py_options)
 					as_error_update(err, AEROSPIKE_ERR_PARAM, "Unable to set scan nobins");
 					break;
 				}
+			} else if (strcmp("nokey", key_name) == 0 || strcmp("digest_bytes", key_name) == 0
+					|| strcmp("lazy_bins", key_name) == 0) {
+				// Options of the conversion of the records, see pyobject_to_result_options()
+				continue;
 			} else {
 				as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value for scan options");
 				break;
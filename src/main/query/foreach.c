@@ -28,11 +28,14 @@
 #include "exceptions.h"
 #include "query.h"
 #include "policy.h"
+#include "result_buffer.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
 	as_error error;
 	PyObject * callback;
+	ResultConverter converter;
+	ResultBuffer * buffer;
 } LocalData;
 
 
@@ -46,6 +49,12 @@ static bool each_result(const as_val * val, void * udata)
 
 	// Extract callback user-data
 	LocalData * data = (LocalData *) udata;
+
+	// Deliver the records in batches, without taking the GIL for each one
+	if ( data->buffer ) {
+		return result_buffer_add(data->buffer, &data->error, val);
+	}
+
 	as_error * err = &data->error;
 	PyObject * py_callback = data->callback;
 
@@ -59,7 +68,7 @@ static bool each_result(const as_val * val, void * udata)
 	gstate = PyGILState_Ensure();
 
 	// Convert as_val to a Python Object
-	val_to_pyobject(err, val, &py_result);
+	result_to_pyobject(err, &data->converter, val, &py_result);
 
 	// Build Python Function Arguments
 	py_arglist = PyTuple_New(1);
@@ -102,12 +111,14 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 	// Python Function Arguments
 	PyObject * py_callback = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+	long batch_size = 0;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"callback", "policy", NULL};
+	static char * kwlist[] = {"callback", "policy", "options", "batch_size", NULL};
 
 	// Python Function Argument Parsing
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:foreach", kwlist, &py_callback, &py_policy) == false ) {
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|OOl:foreach", kwlist, &py_callback, &py_policy, &py_options, &batch_size) == false ) {
 		as_query_destroy(&self->query);
 		return NULL;
 	}
@@ -115,7 +126,11 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 	// Initialize callback user data
 	LocalData data;
 	data.callback = py_callback;
+	data.buffer = NULL;
 	as_error_init(&data.error);
+	ResultOptions result_options = { .nokey = false, .digest_bytes = false };
+	result_converter_init(&data.converter, &result_options);
+	ResultBuffer buffer;
 
 	// Aerospike Client Arguments
 	as_error err;
@@ -130,11 +145,20 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
 
+	if ( batch_size < 0 ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "batch_size should be a positive integer");
+		goto CLEANUP;
+	}
+	if ( batch_size > 0 ) {
+		result_buffer_init(&buffer, py_callback, &data.converter, (uint32_t) batch_size);
+		data.buffer = &buffer;
+	}
+
 	// Convert python policy object to as_policy_exists
 	pyobject_to_policy_query(&err, py_policy, &query_policy, &query_policy_p,
 			&self->client->as->config.policies.query);
@@ -142,6 +166,11 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
+	pyobject_to_result_options(&err, py_options, &data.converter.options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
 	// We are spawning multiple threads
 	PyThreadState * _save = PyEval_SaveThread();
 
@@ -150,12 +179,21 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 
 	// We are done using multiple threads
 	PyEval_RestoreThread(_save);
+
+	// Deliver the records left in partially filled batches
+	if ( data.buffer && err.code == AEROSPIKE_OK ) {
+		result_buffer_flush(data.buffer, &data.error);
+	}
 	if (data.error.code != AEROSPIKE_OK) {
 		as_error_update(&data.error, data.error.code, NULL);
 		goto CLEANUP;
 	}
 
 CLEANUP:
+	if ( data.buffer ) {
+		result_buffer_destroy(data.buffer);
+	}
+	result_converter_destroy(&data.converter);
 	if ( self->query.apply.arglist ){
 		as_arraylist_destroy( (as_arraylist *) self->query.apply.arglist );
 	}
@@ -0,0 +1,111 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_query.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "query.h"
+#include "policy.h"
+#include "result_iterator.h"
+
+PyObject * AerospikeQuery_Iter(AerospikeQuery * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+	long queue_size = RESULT_ITERATOR_QUEUE_SIZE;
+
+	AerospikeResultIterator * iterator = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"policy", "options", "queue_size", NULL};
+
+	// Python Function Argument Parsing
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|OOl:iter", kwlist, &py_policy, &py_options, &queue_size) == false ) {
+		return NULL;
+	}
+
+	// Aerospike Client Arguments
+	as_error err;
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!AerospikeClient_Connected(self->client)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if ( queue_size <= 0 ) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "queue_size should be a positive integer");
+		goto CLEANUP;
+	}
+
+	iterator = AerospikeResultIterator_New(self->client, (PyObject *) self, (uint32_t) queue_size);
+	if ( iterator == NULL ) {
+		return NULL;
+	}
+
+	// Convert python policy object to as_policy_query
+	as_policy_query * query_policy_p = NULL;
+	pyobject_to_policy_query(&err, py_policy, &iterator->policy.query, &query_policy_p,
+			&self->client->as->config.policies.query);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+	iterator->policy_p = query_policy_p;
+
+	pyobject_to_result_options(&err, py_options, &iterator->converter.options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+	if ( ! AerospikeResultIterator_Set_Query(iterator, &self->query) ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+		goto CLEANUP;
+	}
+
+	if ( ! AerospikeResultIterator_Start(iterator) ) {
+		Py_DECREF(iterator);
+		return NULL;
+	}
+
+CLEANUP:
+
+	if ( err.code != AEROSPIKE_OK ) {
+		if ( iterator ) {
+			Py_DECREF(iterator);
+		}
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return (PyObject *) iterator;
+}
@@ -28,18 +28,25 @@
 #include "exceptions.h"
 #include "query.h"
 #include "policy.h"
+#include "result_buffer.h"
 
 #undef TRACE
 #define TRACE()
 
+// Struct for the Results and their Converter
+typedef struct {
+	PyObject * results;
+	ResultConverter converter;
+} LocalData;
+
 static bool each_result(const as_val * val, void * udata)
 {
 	if ( !val ) {
 		return false;
 	}
 
-	PyObject * py_results = NULL;
-	py_results = (PyObject *) udata;
+	LocalData * data = (LocalData *) udata;
+	PyObject * py_results = data->results;
 	PyObject * py_result = NULL;
 
 	as_error err;
@@ -51,7 +58,7 @@ static bool each_result(const as_val * val, void * udata)
 
 	TRACE();
 
-	val_to_pyobject(&err, val, &py_result);
+	result_to_pyobject(&err, &data->converter, val, &py_result);
 
 	TRACE();
 
@@ -75,16 +82,22 @@ static bool each_result(const as_val * val, void * udata)
 PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds)
 {
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
 
-	static char * kwlist[] = {"policy", NULL};
+	static char * kwlist[] = {"policy", "options", NULL};
 
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|O:results", kwlist, &py_policy) == false ) {
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist, &py_policy, &py_options) == false ) {
 		return NULL;
 	}
 
 	as_error err;
 	as_error_init(&err);
 
+	LocalData data;
+	data.results = NULL;
+	ResultOptions result_options = { .nokey = false, .digest_bytes = false };
+	result_converter_init(&data.converter, &result_options);
+
 	as_policy_query query_policy;
 	as_policy_query * query_policy_p = NULL;
 
@@ -93,7 +106,7 @@ PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -105,27 +118,36 @@ PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
+	pyobject_to_result_options(&err, py_options, &data.converter.options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
 	TRACE();
 	PyObject * py_results = NULL;
 	py_results = PyList_New(0);
+	data.results = py_results;
 
 	TRACE();
 	PyThreadState * _save = PyEval_SaveThread();
 
 	TRACE();
-    aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, py_results);
+    aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, &data);
 
 	TRACE();
 	PyEval_RestoreThread(_save);
 
 CLEANUP:/*??trace()*/
 	TRACE();
+	result_converter_destroy(&data.converter);
+
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(data.results);
 		TRACE();
 		return NULL;
 	}
@@ -137,5 +159,5 @@ CLEANUP:/*??trace()*/
 	}
 	self->query.apply.arglist = NULL;
 
-	return py_results;
+	return data.results;
 }
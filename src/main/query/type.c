@@ -44,6 +44,9 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
     {"results",	(PyCFunction) AerospikeQuery_Results,	METH_VARARGS | METH_KEYWORDS,
     			"Return a list of all records in the resultset."},
 
+    {"iter",	(PyCFunction) AerospikeQuery_Iter,		METH_VARARGS | METH_KEYWORDS,
+    			"Return an iterator streaming the records in the resultset."},
+
     {"select",	(PyCFunction) AerospikeQuery_Select,	METH_VARARGS | METH_KEYWORDS,
     			"Bins to project in the query."},
 
@@ -131,12 +134,10 @@ CLEANUP:
 
 static void AerospikeQuery_Type_Dealloc(AerospikeQuery * self)
 {
-	int i;
-	for (i=0; i < self->u_objs.size; i++){
-		Py_DECREF(self->u_objs.ob[i]);
-	}
+	unicode_objects_destroy(&self->u_objs);
 
 	as_query_destroy(&self->query);
+	as_static_pool_destroy(&self->static_pool);
     self->ob_type->tp_free((PyObject *) self);
 }
 
@@ -211,9 +212,5 @@ AerospikeQuery * AerospikeQuery_New(AerospikeClient * client, PyObject * args, P
 	}
 }
 PyObject * StoreUnicodePyObject(AerospikeQuery * self, PyObject *obj){
-
-	if (self->u_objs.size < MAX_UNICODE_OBJECTS){
-		self->u_objs.ob[self->u_objs.size++] = obj;
-	}
-	return obj;
+	return unicode_objects_add(&self->u_objs, obj);
 }
@@ -0,0 +1,522 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "conversions.h"
+#include "exceptions.h"
+#include "record.h"
+
+// A record is indexed like the (key, meta, bins) tuple it stands for
+#define RECORD_TUPLE_SIZE 3
+
+/*******************************************************************************
+ * CONVERSION
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Raise the exception matching err.
+ *
+ * @param err                   The error to raise.
+ *
+ * Returns NULL.
+ *******************************************************************************************************
+ */
+static PyObject * record_raise(as_error * err)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	return NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Convert a bin of the record, the first time it is accessed.
+ *
+ * @param self                  The record.
+ * @param i                     The position of the bin in the as_record.
+ *
+ * Returns a new reference to the value of the bin, or NULL with an
+ * exception set.
+ *******************************************************************************************************
+ */
+static PyObject * record_bin_value(AerospikeRecord * self, uint16_t i)
+{
+	if ( self->values == NULL ) {
+		self->values = (PyObject **) calloc(self->rec->bins.size, sizeof(PyObject *));
+		if ( self->values == NULL ) {
+			return PyErr_NoMemory();
+		}
+	}
+
+	if ( self->values[i] == NULL ) {
+		as_bin * bin = &self->rec->bins.entries[i];
+		PyObject * py_val = NULL;
+
+		if ( bin->valuep == NULL ) {
+			Py_INCREF(Py_None);
+			py_val = Py_None;
+		}
+		else {
+			as_error err;
+			as_error_init(&err);
+			val_to_pyobject(&err, (as_val *) bin->valuep, &py_val);
+			if ( err.code != AEROSPIKE_OK ) {
+				Py_XDECREF(py_val);
+				return record_raise(&err);
+			}
+		}
+		self->values[i] = py_val;
+	}
+
+	Py_INCREF(self->values[i]);
+	return self->values[i];
+}
+
+/**
+ *******************************************************************************************************
+ * Build the bins dict of the record, converting the bins not accessed yet.
+ * The dict is then the only copy of the bins, so the as_record is released.
+ *
+ * @param self                  The record.
+ *
+ * Returns a borrowed reference to the bins dict, or NULL with an exception
+ * set.
+ *******************************************************************************************************
+ */
+static PyObject * record_bins(AerospikeRecord * self)
+{
+	if ( self->bins ) {
+		return self->bins;
+	}
+
+	PyObject * py_bins = _PyDict_NewPresized(self->rec->bins.size);
+	if ( py_bins == NULL ) {
+		return NULL;
+	}
+
+	for ( uint16_t i = 0; i < self->rec->bins.size; i++ ) {
+		PyObject * py_val = record_bin_value(self, i);
+		if ( py_val == NULL ) {
+			Py_DECREF(py_bins);
+			return NULL;
+		}
+		PyObject * py_name = bin_name_to_pyobject(self->rec->bins.entries[i].name);
+		if ( py_name == NULL ) {
+			Py_DECREF(py_val);
+			Py_DECREF(py_bins);
+			return NULL;
+		}
+		PyDict_SetItem(py_bins, py_name, py_val);
+		Py_DECREF(py_name);
+		Py_DECREF(py_val);
+	}
+
+	for ( uint16_t i = 0; i < self->rec->bins.size; i++ ) {
+		Py_DECREF(self->values[i]);
+	}
+	free(self->values);
+	self->values = NULL;
+	as_record_destroy(self->rec);
+	self->rec = NULL;
+
+	self->bins = py_bins;
+	return self->bins;
+}
+
+/**
+ *******************************************************************************************************
+ * Return the key, meta or bins of the record.
+ *
+ * @param self                  The record.
+ * @param i                     The index in the (key, meta, bins) tuple.
+ *
+ * Returns a new reference, or NULL with an exception set.
+ *******************************************************************************************************
+ */
+static PyObject * record_item(AerospikeRecord * self, Py_ssize_t i)
+{
+	PyObject * py_item = NULL;
+
+	switch ( i ) {
+		case 0:
+			py_item = self->key;
+			break;
+		case 1:
+			if ( self->meta == NULL ) {
+				self->meta = PyDict_New();
+				if ( self->meta == NULL ) {
+					return NULL;
+				}
+				PyObject * py_ttl = PyInt_FromLong(self->ttl);
+				PyObject * py_gen = PyInt_FromLong(self->gen);
+				PyDict_SetItemString(self->meta, "ttl", py_ttl);
+				PyDict_SetItemString(self->meta, "gen", py_gen);
+				Py_DECREF(py_ttl);
+				Py_DECREF(py_gen);
+			}
+			py_item = self->meta;
+			break;
+		case 2:
+			py_item = record_bins(self);
+			if ( py_item == NULL ) {
+				return NULL;
+			}
+			break;
+		default:
+			PyErr_SetString(PyExc_IndexError, "record index out of range");
+			return NULL;
+	}
+
+	Py_INCREF(py_item);
+	return py_item;
+}
+
+/**
+ *******************************************************************************************************
+ * Convert the record to the (key, meta, bins) tuple it stands for.
+ *
+ * @param self                  The record.
+ *
+ * Returns a new reference, or NULL with an exception set.
+ *******************************************************************************************************
+ */
+static PyObject * record_to_tuple(AerospikeRecord * self)
+{
+	PyObject * py_tuple = PyTuple_New(RECORD_TUPLE_SIZE);
+	if ( py_tuple == NULL ) {
+		return NULL;
+	}
+
+	for ( Py_ssize_t i = 0; i < RECORD_TUPLE_SIZE; i++ ) {
+		PyObject * py_item = record_item(self, i);
+		if ( py_item == NULL ) {
+			Py_DECREF(py_tuple);
+			return NULL;
+		}
+		PyTuple_SET_ITEM(py_tuple, i, py_item);
+	}
+
+	return py_tuple;
+}
+
+/**
+ *******************************************************************************************************
+ * Look up a bin of the record by name, converting only that bin.
+ *
+ * @param self                  The record.
+ * @param py_name               The name of the bin, a str or unicode.
+ * @param py_default            The value returned if the record has no such
+ *                              bin, or NULL to raise a KeyError.
+ *
+ * Returns a new reference, or NULL with an exception set.
+ *******************************************************************************************************
+ */
+static PyObject * record_lookup(AerospikeRecord * self, PyObject * py_name, PyObject * py_default)
+{
+	PyObject * py_val = NULL;
+
+	// Once the bins dict exists, it is the record
+	if ( self->bins ) {
+		py_val = PyDict_GetItem(self->bins, py_name);
+		if ( py_val ) {
+			Py_INCREF(py_val);
+			return py_val;
+		}
+	}
+	else {
+		PyObject * py_ustr = NULL;
+		const char * name = NULL;
+
+		if ( PyUnicode_Check(py_name) ) {
+			py_ustr = PyUnicode_AsUTF8String(py_name);
+			if ( py_ustr == NULL ) {
+				return NULL;
+			}
+			name = PyString_AsString(py_ustr);
+		}
+		else if ( PyString_Check(py_name) ) {
+			name = PyString_AsString(py_name);
+		}
+		else {
+			PyErr_SetString(PyExc_TypeError, "record indices must be integers or bin names");
+			return NULL;
+		}
+
+		for ( uint16_t i = 0; i < self->rec->bins.size; i++ ) {
+			if ( strcmp(self->rec->bins.entries[i].name, name) == 0 ) {
+				py_val = record_bin_value(self, i);
+				break;
+			}
+		}
+		Py_XDECREF(py_ustr);
+
+		if ( py_val || PyErr_Occurred() ) {
+			return py_val;
+		}
+	}
+
+	if ( py_default ) {
+		Py_INCREF(py_default);
+		return py_default;
+	}
+	PyErr_SetObject(PyExc_KeyError, py_name);
+	return NULL;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject * AerospikeRecord_Get(AerospikeRecord * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_name = NULL;
+	PyObject * py_default = Py_None;
+
+	static char * kwlist[] = {"bin", "default", NULL};
+
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get", kwlist, &py_name, &py_default) == false ) {
+		return NULL;
+	}
+
+	return record_lookup(self, py_name, py_default);
+}
+
+static PyMethodDef AerospikeRecord_Type_Methods[] = {
+
+	{"get",	(PyCFunction) AerospikeRecord_Get, METH_VARARGS | METH_KEYWORDS,
+				"Return the value of a bin, or default if the record has no such bin."},
+
+	{NULL}
+};
+
+static PyObject * AerospikeRecord_Type_Get_Key(AerospikeRecord * self, void * closure)
+{
+	return record_item(self, 0);
+}
+
+static PyObject * AerospikeRecord_Type_Get_Meta(AerospikeRecord * self, void * closure)
+{
+	return record_item(self, 1);
+}
+
+static PyObject * AerospikeRecord_Type_Get_Bins(AerospikeRecord * self, void * closure)
+{
+	return record_item(self, 2);
+}
+
+static PyGetSetDef AerospikeRecord_Type_GetSet[] = {
+	{"key", (getter) AerospikeRecord_Type_Get_Key, NULL, "The key tuple of the record.", NULL},
+	{"meta", (getter) AerospikeRecord_Type_Get_Meta, NULL, "The metadata dict of the record.", NULL},
+	{"bins", (getter) AerospikeRecord_Type_Get_Bins, NULL, "The dict of all the bins of the record.", NULL},
+	{NULL}
+};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static Py_ssize_t AerospikeRecord_Type_Length(AerospikeRecord * self)
+{
+	return RECORD_TUPLE_SIZE;
+}
+
+static PyObject * AerospikeRecord_Type_Item(AerospikeRecord * self, Py_ssize_t i)
+{
+	return record_item(self, i);
+}
+
+static PyObject * AerospikeRecord_Type_Subscript(AerospikeRecord * self, PyObject * py_item)
+{
+	if ( PyString_Check(py_item) || PyUnicode_Check(py_item) ) {
+		return record_lookup(self, py_item, NULL);
+	}
+
+	if ( PyIndex_Check(py_item) ) {
+		Py_ssize_t i = PyNumber_AsSsize_t(py_item, PyExc_IndexError);
+		if ( i == -1 && PyErr_Occurred() ) {
+			return NULL;
+		}
+		if ( i < 0 ) {
+			i += RECORD_TUPLE_SIZE;
+		}
+		return record_item(self, i);
+	}
+
+	// Slices and anything else behave as on the tuple
+	PyObject * py_tuple = record_to_tuple(self);
+	if ( py_tuple == NULL ) {
+		return NULL;
+	}
+	PyObject * py_result = PyObject_GetItem(py_tuple, py_item);
+	Py_DECREF(py_tuple);
+	return py_result;
+}
+
+static PyObject * AerospikeRecord_Type_RichCompare(PyObject * self, PyObject * other, int op)
+{
+	PyObject * py_self = record_to_tuple((AerospikeRecord *) self);
+	if ( py_self == NULL ) {
+		return NULL;
+	}
+
+	PyObject * py_other = other;
+	if ( PyObject_TypeCheck(other, self->ob_type) ) {
+		py_other = record_to_tuple((AerospikeRecord *) other);
+		if ( py_other == NULL ) {
+			Py_DECREF(py_self);
+			return NULL;
+		}
+	}
+	else {
+		Py_INCREF(py_other);
+	}
+
+	PyObject * py_result = PyObject_RichCompare(py_self, py_other, op);
+	Py_DECREF(py_self);
+	Py_DECREF(py_other);
+	return py_result;
+}
+
+static PyObject * AerospikeRecord_Type_Repr(AerospikeRecord * self)
+{
+	PyObject * py_tuple = record_to_tuple(self);
+	if ( py_tuple == NULL ) {
+		return NULL;
+	}
+	PyObject * py_repr = PyObject_Repr(py_tuple);
+	Py_DECREF(py_tuple);
+	return py_repr;
+}
+
+static void AerospikeRecord_Type_Dealloc(PyObject * self)
+{
+	AerospikeRecord * record = (AerospikeRecord *) self;
+
+	if ( record->values ) {
+		for ( uint16_t i = 0; i < record->rec->bins.size; i++ ) {
+			Py_XDECREF(record->values[i]);
+		}
+		free(record->values);
+	}
+	if ( record->rec ) {
+		as_record_destroy(record->rec);
+	}
+
+	Py_XDECREF(record->key);
+	Py_XDECREF(record->meta);
+	Py_XDECREF(record->bins);
+	self->ob_type->tp_free(self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PySequenceMethods AerospikeRecord_Type_Sequence = {
+	.sq_length			= (lenfunc) AerospikeRecord_Type_Length,
+	.sq_item			= (ssizeargfunc) AerospikeRecord_Type_Item,
+};
+
+static PyMappingMethods AerospikeRecord_Type_Mapping = {
+	.mp_length			= (lenfunc) AerospikeRecord_Type_Length,
+	.mp_subscript		= (binaryfunc) AerospikeRecord_Type_Subscript,
+};
+
+static PyTypeObject AerospikeRecord_Type = {
+	PyObject_HEAD_INIT(NULL)
+
+    .ob_size			= 0,
+    .tp_name			= "aerospike.Record",
+    .tp_basicsize		= sizeof(AerospikeRecord),
+    .tp_itemsize		= 0,
+    .tp_dealloc			= (destructor) AerospikeRecord_Type_Dealloc,
+    .tp_print			= 0,
+    .tp_getattr			= 0,
+    .tp_setattr			= 0,
+    .tp_compare			= 0,
+    .tp_repr			= (reprfunc) AerospikeRecord_Type_Repr,
+    .tp_as_number		= 0,
+    .tp_as_sequence		= &AerospikeRecord_Type_Sequence,
+    .tp_as_mapping		= &AerospikeRecord_Type_Mapping,
+    .tp_hash			= 0,
+    .tp_call			= 0,
+    .tp_str				= 0,
+    .tp_getattro		= 0,
+    .tp_setattro		= 0,
+    .tp_as_buffer		= 0,
+    .tp_flags			= Py_TPFLAGS_DEFAULT,
+    .tp_doc				=
+    		"The Record class stands for the (key, meta, bins) tuple of a\n"
+    		"record, and is indexed and unpacked like it. The bins are only\n"
+    		"converted when accessed: record['bin'] and record.get('bin')\n"
+    		"convert a single bin, record[2] and record.bins all of them.\n",
+    .tp_traverse		= 0,
+    .tp_clear			= 0,
+    .tp_richcompare		= (richcmpfunc) AerospikeRecord_Type_RichCompare,
+    .tp_weaklistoffset	= 0,
+    .tp_iter			= 0,
+    .tp_iternext		= 0,
+    .tp_methods			= AerospikeRecord_Type_Methods,
+    .tp_members			= 0,
+    .tp_getset			= AerospikeRecord_Type_GetSet,
+    .tp_base			= 0,
+    .tp_dict			= 0,
+    .tp_descr_get		= 0,
+    .tp_descr_set		= 0,
+    .tp_dictoffset		= 0,
+    .tp_init			= 0,
+    .tp_alloc			= 0,
+    .tp_new				= 0
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeRecord_Ready()
+{
+	return PyType_Ready(&AerospikeRecord_Type) == 0 ? &AerospikeRecord_Type : NULL;
+}
+
+PyObject * AerospikeRecord_New(as_record * rec, PyObject * py_key)
+{
+	AerospikeRecord * self = (AerospikeRecord *)
+		AerospikeRecord_Type.tp_alloc(&AerospikeRecord_Type, 0);
+	if ( self == NULL ) {
+		as_record_destroy(rec);
+		Py_DECREF(py_key);
+		return NULL;
+	}
+
+	self->rec = rec;
+	self->gen = rec->gen;
+	self->ttl = rec->ttl;
+	self->key = py_key;
+
+	return (PyObject *) self;
+}
@@ -0,0 +1,426 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_string.h>
+#include <aerospike/as_val.h>
+
+#include "batch.h"
+#include "conversions.h"
+#include "record.h"
+#include "result_buffer.h"
+
+/**
+ *******************************************************************************************************
+ * Return the cached string of a namespace or set name, replacing it when
+ * the name changed, e.g. while scanning all the sets of a namespace.
+ *
+ * @param cached                The cached string, updated by the function.
+ * @param name                  The name of the current record.
+ *
+ * Returns a borrowed reference, or NULL to let the key conversion handle
+ * empty names and allocation failures.
+ *******************************************************************************************************
+ */
+static PyObject * result_name_cached(PyObject ** cached, const char * name)
+{
+	if ( name[0] == '\0' ) {
+		return NULL;
+	}
+
+	if ( *cached == NULL || strcmp(PyString_AS_STRING(*cached), name) != 0 ) {
+		Py_XDECREF(*cached);
+		*cached = PyString_FromString(name);
+		if ( *cached == NULL ) {
+			PyErr_Clear();
+		}
+	}
+
+	return *cached;
+}
+
+as_status pyobject_to_result_options(as_error * err, PyObject * py_options, ResultOptions * options)
+{
+	options->nokey = false;
+	options->digest_bytes = false;
+	options->lazy_bins = false;
+
+	if ( py_options == NULL || py_options == Py_None ) {
+		return err->code;
+	}
+
+	if ( ! PyDict_Check(py_options) ) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid option(type)");
+	}
+
+	PyObject * py_value = PyDict_GetItemString(py_options, "nokey");
+	if ( py_value ) {
+		if ( ! PyBool_Check(py_value) ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value(type) for nokey");
+		}
+		options->nokey = py_value == Py_True;
+	}
+
+	py_value = PyDict_GetItemString(py_options, "digest_bytes");
+	if ( py_value ) {
+		if ( ! PyBool_Check(py_value) ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value(type) for digest_bytes");
+		}
+		options->digest_bytes = py_value == Py_True;
+	}
+
+	py_value = PyDict_GetItemString(py_options, "lazy_bins");
+	if ( py_value ) {
+		if ( ! PyBool_Check(py_value) ) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value(type) for lazy_bins");
+		}
+		options->lazy_bins = py_value == Py_True;
+	}
+
+	return err->code;
+}
+
+void result_converter_init(ResultConverter * conv, const ResultOptions * options)
+{
+	conv->options = *options;
+	conv->py_ns = NULL;
+	conv->py_set = NULL;
+}
+
+as_status result_to_pyobject(as_error * err, ResultConverter * conv, const as_val * val, PyObject ** obj)
+{
+	as_record * rec = as_record_fromval(val);
+
+	// Aggregations return values rather than records
+	if ( rec == NULL ) {
+		return val_to_pyobject(err, val, obj);
+	}
+
+	PyObject * py_key = NULL;
+
+	if ( conv->options.nokey ) {
+		as_error_reset(err);
+		Py_INCREF(Py_None);
+		py_key = Py_None;
+	}
+	else {
+		key_to_pyobject_cached(err, &rec->key,
+				result_name_cached(&conv->py_ns, rec->key.ns),
+				result_name_cached(&conv->py_set, rec->key.set),
+				conv->options.digest_bytes, &py_key);
+		if ( py_key == NULL ) {
+			return err->code;
+		}
+	}
+
+	if ( ! conv->options.lazy_bins ) {
+		return record_with_key_to_pyobject(err, rec, py_key, obj);
+	}
+
+	// The record outlives the callback: values of the C client live on the
+	// stack of its threads, those buffered were already copied to the heap
+	as_record * own = val->free ?
+		as_record_fromval(as_val_reserve((as_val *) val)) :
+		as_record_fromval(result_value_copy(val));
+	if ( own == NULL ) {
+		Py_DECREF(py_key);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+
+	*obj = AerospikeRecord_New(own, py_key);
+	if ( *obj == NULL ) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+	return err->code;
+}
+
+void result_converter_destroy(ResultConverter * conv)
+{
+	Py_XDECREF(conv->py_ns);
+	Py_XDECREF(conv->py_set);
+	conv->py_ns = NULL;
+	conv->py_set = NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Copy the key of a record. The C client keeps the user key value inline in
+ * the key, pointing into the buffer of the response.
+ *
+ * @param src                   The key to copy.
+ * @param dst                   The key to initialise.
+ *
+ * Returns false on allocation failure.
+ *******************************************************************************************************
+ */
+static bool result_key_copy(const as_key * src, as_key * dst)
+{
+	memcpy(dst, src, sizeof(as_key));
+	dst->_free = false;
+	dst->valuep = NULL;
+
+	if ( src->valuep == NULL ) {
+		return true;
+	}
+
+	if ( src->valuep != &src->value ) {
+		dst->valuep = (as_key_value *) as_val_reserve((as_val *) src->valuep);
+		return true;
+	}
+
+	switch ( as_val_type((as_val *) src->valuep) ) {
+		case AS_INTEGER:
+			as_integer_init((as_integer *) &dst->value, src->value.integer.value);
+			break;
+		case AS_STRING: {
+			char * str = strdup(src->value.string.value);
+			if ( str == NULL ) {
+				return false;
+			}
+			as_string_init((as_string *) &dst->value, str, true);
+			break;
+		}
+		case AS_BYTES: {
+			uint8_t * value = (uint8_t *) malloc(src->value.bytes.size ? src->value.bytes.size : 1);
+			if ( value == NULL ) {
+				return false;
+			}
+			memcpy(value, src->value.bytes.value, src->value.bytes.size);
+			as_bytes_init_wrap((as_bytes *) &dst->value, value, src->value.bytes.size, true);
+			break;
+		}
+		default:
+			return true;
+	}
+	dst->valuep = &dst->value;
+	return true;
+}
+
+as_val * result_value_copy(const as_val * val)
+{
+	if ( as_val_type(val) != AS_REC ) {
+		return as_val_reserve((as_val *) val);
+	}
+
+	// Records of scans and queries live on the stack of the C client
+	const as_record * src = as_record_fromval(val);
+	as_record * dst = as_record_new(src->bins.size);
+	if ( dst == NULL ) {
+		return NULL;
+	}
+
+	dst->gen = src->gen;
+	dst->ttl = src->ttl;
+
+	if ( ! result_key_copy(&src->key, &dst->key) ) {
+		as_record_destroy(dst);
+		return NULL;
+	}
+
+	for ( uint16_t i = 0; i < src->bins.size; i++ ) {
+		const as_bin * bin = &src->bins.entries[i];
+		as_bin_value * value = bin_value_copy(bin);
+		if ( value == NULL ) {
+			as_record_destroy(dst);
+			return NULL;
+		}
+		as_record_set(dst, bin->name, value);
+	}
+
+	return as_record_toval(dst);
+}
+
+/**
+ *******************************************************************************************************
+ * Convert the values buffered by a thread to a list and pass it to the
+ * callback. Must be called with the GIL.
+ *
+ * @param buffer                The result buffer.
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param thread                The buffer of the thread to deliver.
+ *
+ * Returns false if the scan or query must stop.
+ *******************************************************************************************************
+ */
+static bool result_buffer_deliver(ResultBuffer * buffer, as_error * err, ResultBufferThread * thread)
+{
+	bool rval = true;
+	uint32_t size = thread->size;
+
+	thread->size = 0;
+
+	if ( buffer->stop ) {
+		for ( uint32_t i = 0; i < size; i++ ) {
+			as_val_destroy(thread->vals[i]);
+		}
+		return false;
+	}
+
+	PyObject * py_results = PyList_New(size);
+
+	for ( uint32_t i = 0; i < size; i++ ) {
+		PyObject * py_result = NULL;
+		if ( py_results ) {
+			result_to_pyobject(err, buffer->converter, thread->vals[i], &py_result);
+		}
+		as_val_destroy(thread->vals[i]);
+
+		if ( py_result ) {
+			PyList_SET_ITEM(py_results, i, py_result);
+		}
+		else if ( py_results ) {
+			// Same as a single record: the error stops the scan and is raised
+			Py_CLEAR(py_results);
+		}
+	}
+
+	if ( py_results == NULL ) {
+		PyErr_Clear();
+		if ( err->code == AEROSPIKE_OK ) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to convert the results");
+		}
+		buffer->stop = true;
+		return false;
+	}
+
+	PyObject * py_return = PyObject_CallFunctionObjArgs(buffer->callback, py_results, NULL);
+	Py_DECREF(py_results);
+
+	if ( py_return == NULL ) {
+		// Same as a single record callback: the error stops the scan
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Callback function contains an error");
+		rval = false;
+	}
+	else {
+		if ( py_return == Py_False ) {
+			rval = false;
+		}
+		Py_DECREF(py_return);
+	}
+
+	if ( ! rval ) {
+		buffer->stop = true;
+	}
+	return rval;
+}
+
+void result_buffer_init(ResultBuffer * buffer, PyObject * py_callback, ResultConverter * converter, uint32_t batch_size)
+{
+	buffer->callback = py_callback;
+	buffer->converter = converter;
+	buffer->batch_size = batch_size;
+	pthread_mutex_init(&buffer->lock, NULL);
+	buffer->threads = NULL;
+	buffer->stop = false;
+}
+
+bool result_buffer_add(ResultBuffer * buffer, as_error * err, const as_val * val)
+{
+	pthread_t self = pthread_self();
+	ResultBufferThread * thread = NULL;
+
+	pthread_mutex_lock(&buffer->lock);
+	if ( buffer->stop ) {
+		pthread_mutex_unlock(&buffer->lock);
+		return false;
+	}
+	for ( thread = buffer->threads; thread; thread = thread->next ) {
+		if ( pthread_equal(thread->thread, self) ) {
+			break;
+		}
+	}
+	if ( thread == NULL ) {
+		thread = (ResultBufferThread *) calloc(1, sizeof(ResultBufferThread));
+		if ( thread ) {
+			thread->vals = (as_val **) malloc(sizeof(as_val *) * buffer->batch_size);
+		}
+		if ( thread == NULL || thread->vals == NULL ) {
+			free(thread);
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+			buffer->stop = true;
+			pthread_mutex_unlock(&buffer->lock);
+			return false;
+		}
+		thread->thread = self;
+		thread->next = buffer->threads;
+		buffer->threads = thread;
+	}
+	pthread_mutex_unlock(&buffer->lock);
+
+	// Only the calling thread uses its buffer until the scan returns
+	as_val * copy = result_value_copy(val);
+	if ( copy == NULL ) {
+		pthread_mutex_lock(&buffer->lock);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+		buffer->stop = true;
+		pthread_mutex_unlock(&buffer->lock);
+		return false;
+	}
+	thread->vals[thread->size++] = copy;
+
+	if ( thread->size < buffer->batch_size ) {
+		return true;
+	}
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	bool rval = result_buffer_deliver(buffer, err, thread);
+	PyGILState_Release(gstate);
+
+	return rval;
+}
+
+bool result_buffer_flush(ResultBuffer * buffer, as_error * err)
+{
+	bool rval = true;
+
+	for ( ResultBufferThread * thread = buffer->threads; thread; thread = thread->next ) {
+		if ( thread->size > 0 ) {
+			rval = result_buffer_deliver(buffer, err, thread) && rval;
+		}
+	}
+
+	return rval;
+}
+
+void result_buffer_destroy(ResultBuffer * buffer)
+{
+	ResultBufferThread * thread = buffer->threads;
+
+	while ( thread ) {
+		ResultBufferThread * next = thread->next;
+		for ( uint32_t i = 0; i < thread->size; i++ ) {
+			as_val_destroy(thread->vals[i]);
+		}
+		free(thread->vals);
+		free(thread);
+		thread = next;
+	}
+
+	buffer->threads = NULL;
+	pthread_mutex_destroy(&buffer->lock);
+}
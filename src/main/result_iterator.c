@@ -0,0 +1,444 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_arraylist.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "result_buffer.h"
+#include "result_iterator.h"
+
+/*******************************************************************************
+ * PRODUCER
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Queue a result of the scan or query, waiting while the queue is full.
+ * Called by the threads of the C client, without the GIL.
+ *
+ * @param val                   The result.
+ * @param udata                 The AerospikeResultIterator.
+ *
+ * Returns false once the consumer has gone away.
+ *******************************************************************************************************
+ */
+static bool each_result(const as_val * val, void * udata)
+{
+	AerospikeResultIterator * self = (AerospikeResultIterator *) udata;
+
+	if ( !val ) {
+		return false;
+	}
+
+	as_val * copy = result_value_copy(val);
+
+	pthread_mutex_lock(&self->lock);
+
+	if ( copy == NULL ) {
+		self->failed = true;
+	}
+
+	while ( copy && self->size == self->capacity && !self->cancelled ) {
+		pthread_cond_wait(&self->not_full, &self->lock);
+	}
+
+	if ( copy == NULL || self->cancelled ) {
+		pthread_mutex_unlock(&self->lock);
+		if ( copy ) {
+			as_val_destroy(copy);
+		}
+		return false;
+	}
+
+	self->queue[(self->head + self->size) % self->capacity] = copy;
+	self->size++;
+	pthread_cond_signal(&self->not_empty);
+
+	pthread_mutex_unlock(&self->lock);
+
+	return true;
+}
+
+/**
+ *******************************************************************************************************
+ * Body of the background thread: run the scan or query to completion.
+ *
+ * @param udata                 The AerospikeResultIterator.
+ *******************************************************************************************************
+ */
+static void * result_iterator_run(void * udata)
+{
+	AerospikeResultIterator * self = (AerospikeResultIterator *) udata;
+	as_error err;
+
+	as_error_init(&err);
+
+	if ( self->query ) {
+		aerospike_query_foreach(self->client->as, &err, (as_policy_query *) self->policy_p,
+				self->query, each_result, self);
+	}
+	else {
+		aerospike_scan_foreach(self->client->as, &err, (as_policy_scan *) self->policy_p,
+				self->scan, each_result, self);
+	}
+
+	pthread_mutex_lock(&self->lock);
+	if ( self->failed && err.code == AEROSPIKE_OK ) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Cannot allocate memory");
+	}
+	if ( ! self->cancelled ) {
+		as_error_copy(&self->err, &err);
+	}
+	self->done = true;
+	pthread_cond_broadcast(&self->not_empty);
+	pthread_mutex_unlock(&self->lock);
+
+	return NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Cancel the scan or query, if its thread runs, and wait for the thread to
+ * stop. Called with the GIL, which is released while waiting.
+ *
+ * @param self                  The AerospikeResultIterator.
+ *******************************************************************************************************
+ */
+static void result_iterator_stop(AerospikeResultIterator * self)
+{
+	if ( ! self->thread_started ) {
+		return;
+	}
+
+	// Forget the thread before releasing the GIL, so it is only joined once
+	self->thread_started = false;
+	AerospikeResultIterator ** it = &self->client->iterators;
+	while ( *it && *it != self ) {
+		it = &(*it)->next;
+	}
+	if ( *it ) {
+		*it = self->next;
+	}
+	self->next = NULL;
+
+	// Release the producers and wait for the scan or query to stop
+	pthread_mutex_lock(&self->lock);
+	self->cancelled = true;
+	pthread_cond_broadcast(&self->not_full);
+	pthread_mutex_unlock(&self->lock);
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_join(self->thread, NULL);
+	Py_END_ALLOW_THREADS
+}
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject * AerospikeResultIterator_Type_Next(AerospikeResultIterator * self)
+{
+	as_val * val = NULL;
+	bool done = false;
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&self->lock);
+	while ( self->size == 0 && !self->done ) {
+		pthread_cond_wait(&self->not_empty, &self->lock);
+	}
+	if ( self->size > 0 ) {
+		val = self->queue[self->head];
+		self->head = (self->head + 1) % self->capacity;
+		self->size--;
+		pthread_cond_signal(&self->not_full);
+	}
+	done = self->done;
+	pthread_mutex_unlock(&self->lock);
+	Py_END_ALLOW_THREADS
+
+	if ( val ) {
+		as_error err;
+		as_error_init(&err);
+		PyObject * py_result = NULL;
+		result_to_pyobject(&err, &self->converter, val, &py_result);
+		as_val_destroy(val);
+		if ( py_result == NULL ) {
+			Py_INCREF(Py_None);
+			py_result = Py_None;
+		}
+		return py_result;
+	}
+
+	// The stream is exhausted, report its error once
+	if ( done && self->err.code != AEROSPIKE_OK ) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&self->err, &py_err);
+		PyObject *exception_type = raise_exception(&self->err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		as_error_reset(&self->err);
+	}
+
+	return NULL;
+}
+
+static void AerospikeResultIterator_Type_Dealloc(PyObject * self)
+{
+	AerospikeResultIterator * it = (AerospikeResultIterator *) self;
+
+	result_iterator_stop(it);
+
+	for ( uint32_t i = 0; i < it->size; i++ ) {
+		as_val_destroy(it->queue[(it->head + i) % it->capacity]);
+	}
+	free(it->queue);
+	result_converter_destroy(&it->converter);
+
+	pthread_cond_destroy(&it->not_full);
+	pthread_cond_destroy(&it->not_empty);
+	pthread_mutex_destroy(&it->lock);
+
+	// The copy owns its arrays of bins and predicates, and the arguments of
+	// the aggregation taken from the query
+	if ( it->scan ) {
+		free(it->scan->select.entries);
+	}
+	if ( it->query ) {
+		free(it->query->select.entries);
+		free(it->query->where.entries);
+		if ( it->query->apply.arglist ) {
+			as_arraylist_destroy( (as_arraylist *) it->query->apply.arglist );
+		}
+	}
+
+	if ( it->owner ) {
+		Py_DECREF(it->owner);
+	}
+	if ( it->client ) {
+		Py_DECREF(it->client);
+	}
+	self->ob_type->tp_free((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeResultIterator_Type = {
+	PyObject_HEAD_INIT(NULL)
+
+    .ob_size			= 0,
+    .tp_name			= "aerospike.ResultIterator",
+    .tp_basicsize		= sizeof(AerospikeResultIterator),
+    .tp_itemsize		= 0,
+    .tp_dealloc			= (destructor) AerospikeResultIterator_Type_Dealloc,
+    .tp_print			= 0,
+    .tp_getattr			= 0,
+    .tp_setattr			= 0,
+    .tp_compare			= 0,
+    .tp_repr			= 0,
+    .tp_as_number		= 0,
+    .tp_as_sequence		= 0,
+    .tp_as_mapping		= 0,
+    .tp_hash			= 0,
+    .tp_call			= 0,
+    .tp_str				= 0,
+    .tp_getattro		= 0,
+    .tp_setattro		= 0,
+    .tp_as_buffer		= 0,
+    .tp_flags			= Py_TPFLAGS_DEFAULT,
+    .tp_doc				=
+    		"The ResultIterator class streams the results of a scan or query\n"
+    		"through a bounded queue. To create a new instance of the\n"
+    		"ResultIterator class, call the iter() method on an instance of a\n"
+    		"Scan or Query class.\n",
+    .tp_traverse		= 0,
+    .tp_clear			= 0,
+    .tp_richcompare		= 0,
+    .tp_weaklistoffset	= 0,
+    .tp_iter			= PyObject_SelfIter,
+    .tp_iternext		= (iternextfunc) AerospikeResultIterator_Type_Next,
+    .tp_methods			= 0,
+    .tp_members			= 0,
+    .tp_getset			= 0,
+    .tp_base			= 0,
+    .tp_dict			= 0,
+    .tp_descr_get		= 0,
+    .tp_descr_set		= 0,
+    .tp_dictoffset		= 0,
+    .tp_init			= 0,
+    .tp_alloc			= 0,
+    .tp_new				= 0
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeResultIterator_Ready()
+{
+	return PyType_Ready(&AerospikeResultIterator_Type) == 0 ? &AerospikeResultIterator_Type : NULL;
+}
+
+AerospikeResultIterator * AerospikeResultIterator_New(AerospikeClient * client, PyObject * owner,
+		uint32_t queue_size)
+{
+	AerospikeResultIterator * self = (AerospikeResultIterator *)
+		AerospikeResultIterator_Type.tp_alloc(&AerospikeResultIterator_Type, 0);
+	if ( self == NULL ) {
+		return NULL;
+	}
+
+	pthread_mutex_init(&self->lock, NULL);
+	pthread_cond_init(&self->not_empty, NULL);
+	pthread_cond_init(&self->not_full, NULL);
+	as_error_init(&self->err);
+
+	ResultOptions result_options = { .nokey = false, .digest_bytes = false };
+	result_converter_init(&self->converter, &result_options);
+
+	self->client = client;
+	Py_INCREF(client);
+	self->owner = owner;
+	Py_INCREF(owner);
+
+	self->capacity = queue_size;
+	self->queue = (as_val **) malloc(sizeof(as_val *) * queue_size);
+	if ( self->queue == NULL ) {
+		Py_DECREF(self);
+		PyErr_NoMemory();
+		return NULL;
+	}
+
+	return self;
+}
+
+bool AerospikeResultIterator_Start(AerospikeResultIterator * self)
+{
+	if ( pthread_create(&self->thread, NULL, result_iterator_run, self) != 0 ) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to start the iterator thread");
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return false;
+	}
+
+	self->thread_started = true;
+	self->next = self->client->iterators;
+	self->client->iterators = self;
+	return true;
+}
+
+/**
+ * Duplicate the n entries of an array, NULL if there are none.
+ */
+static void * result_iterator_dup_entries(const void * entries, uint16_t n, size_t entry_size,
+		bool * ok)
+{
+	void * copy = NULL;
+
+	if ( entries && n > 0 ) {
+		copy = malloc(entry_size * n);
+		if ( copy == NULL ) {
+			*ok = false;
+			return NULL;
+		}
+		memcpy(copy, entries, entry_size * n);
+	}
+	return copy;
+}
+
+bool AerospikeResultIterator_Set_Scan(AerospikeResultIterator * self, const as_scan * scan)
+{
+	bool ok = true;
+
+	self->copy.scan = *scan;
+	self->copy.scan._free = false;
+	self->copy.scan.select.entries = result_iterator_dup_entries(scan->select.entries,
+			scan->select.size, sizeof(as_bin_name), &ok);
+	self->copy.scan.select.capacity = self->copy.scan.select.size;
+	self->copy.scan.select._free = true;
+
+	if ( ok ) {
+		self->scan = &self->copy.scan;
+	}
+	return ok;
+}
+
+bool AerospikeResultIterator_Set_Query(AerospikeResultIterator * self, as_query * query)
+{
+	bool ok = true;
+
+	self->copy.query = *query;
+	self->copy.query._free = false;
+	self->copy.query.select.entries = result_iterator_dup_entries(query->select.entries,
+			query->select.size, sizeof(as_bin_name), &ok);
+	self->copy.query.select.capacity = self->copy.query.select.size;
+	self->copy.query.select._free = true;
+	self->copy.query.where.entries = result_iterator_dup_entries(query->where.entries,
+			query->where.size, sizeof(as_predicate), &ok);
+	self->copy.query.where.capacity = self->copy.query.where.size;
+	self->copy.query.where._free = true;
+	self->copy.query.apply.arglist = NULL;
+
+	if ( ! ok ) {
+		free(self->copy.query.select.entries);
+		free(self->copy.query.where.entries);
+		return false;
+	}
+
+	// Same as results(): the arguments of an aggregation are used once, so
+	// the iterator takes them over
+	self->copy.query.apply.arglist = query->apply.arglist;
+	query->apply.arglist = NULL;
+
+	self->query = &self->copy.query;
+	return true;
+}
+
+void AerospikeResultIterator_Stop_All(AerospikeClient * client)
+{
+	while ( client->iterators ) {
+		AerospikeResultIterator * self = client->iterators;
+
+		pthread_mutex_lock(&self->lock);
+		bool done = self->done;
+		pthread_mutex_unlock(&self->lock);
+
+		result_iterator_stop(self);
+
+		// The results already queued are still returned, then the error
+		if ( ! done ) {
+			as_error_update(&self->err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		}
+	}
+}
@@ -26,19 +26,26 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "result_buffer.h"
 #include "scan.h"
 
 #undef TRACE
 #define TRACE()
 
+// Struct for the Results and their Converter
+typedef struct {
+	PyObject * results;
+	ResultConverter converter;
+} LocalData;
+
 static bool each_result(const as_val * val, void * udata)
 {
 	if ( !val ) {
 		return false;
 	}
 
-	PyObject * py_results = NULL;
-	py_results = (PyObject *) udata;
+	LocalData * data = (LocalData *) udata;
+	PyObject * py_results = data->results;
 	PyObject * py_result = NULL;
 
 	as_error err;
@@ -46,7 +53,7 @@ static bool each_result(const as_val * val, void * udata)
 	PyGILState_STATE gstate;
 	gstate = PyGILState_Ensure();
 
-	val_to_pyobject(&err, val, &py_result);
+	result_to_pyobject(&err, &data->converter, val, &py_result);
 
 	if ( py_result ) {
 		PyList_Append(py_results, py_result);
@@ -61,23 +68,30 @@ static bool each_result(const as_val * val, void * udata)
 PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject * kwds)
 {
 	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+	char * node = NULL;
 	as_policy_scan scan_policy;
 	as_policy_scan * scan_policy_p = NULL;
 
-	static char * kwlist[] = {"policy", NULL};
+	static char * kwlist[] = {"policy", "node", "options", NULL};
 
-	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|O:results", kwlist, &py_policy) == false ) {
+	if ( PyArg_ParseTupleAndKeywords(args, kwds, "|OzO:results", kwlist, &py_policy, &node, &py_options) == false ) {
 		return NULL;
 	}
 
 	as_error err;
 	as_error_init(&err);
 
+	LocalData data;
+	data.results = NULL;
+	ResultOptions result_options = { .nokey = false, .digest_bytes = false };
+	result_converter_init(&data.converter, &result_options);
+
 	if (!self || !self->client->as) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
 	}
-	if (!self->client->is_conn_16) {
+	if (!AerospikeClient_Connected(self->client)) {
 		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
 		goto CLEANUP;
 	}
@@ -90,17 +104,31 @@ PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject
 		goto CLEANUP;
 	}
 
+	// Only the options of the records: results() does not change the scan
+	pyobject_to_result_options(&err, py_options, &data.converter.options);
+	if ( err.code != AEROSPIKE_OK ) {
+		goto CLEANUP;
+	}
+
 	PyObject * py_results = NULL;
 	py_results = PyList_New(0);
+	data.results = py_results;
 
 	PyThreadState * _save = PyEval_SaveThread();
 
-	aerospike_scan_foreach(self->client->as, &err, scan_policy_p, &self->scan, each_result, py_results);
+	if ( node ) {
+		// Scan the partitions owned by a single node of the cluster
+		aerospike_scan_node(self->client->as, &err, scan_policy_p, &self->scan, node, each_result, &data);
+	}
+	else {
+		aerospike_scan_foreach(self->client->as, &err, scan_policy_p, &self->scan, each_result, &data);
+	}
 
 	PyEval_RestoreThread(_save);
 
 
 CLEANUP:
+	result_converter_destroy(&data.converter);
 
 	if ( err.code != AEROSPIKE_OK ) {
 		PyObject * py_err = NULL;
@@ -108,8 +136,9 @@ CLEANUP:
 		PyObject *exception_type = raise_exception(&err);
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(data.results);
 		return NULL;
 	}
 
-	return py_results;
+	return data.results;
 }
@@ -43,6 +43,9 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
 
     {"results",	(PyCFunction) AerospikeScan_Results,	METH_VARARGS | METH_KEYWORDS,
     			"Get a record."},
+
+    {"iter",	(PyCFunction) AerospikeScan_Iter,		METH_VARARGS | METH_KEYWORDS,
+    			"Return an iterator streaming the records."},
 	{NULL}
 };
 
@@ -0,0 +1,143 @@
+/*******************************************************************************
+ * Copyright 2013-2014 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include "thread_pool.h"
+
+static void * thread_pool_worker(void * udata)
+{
+	ThreadPool * pool = (ThreadPool *) udata;
+
+	while ( true ) {
+		pthread_mutex_lock(&pool->lock);
+
+		while ( pool->head == NULL && ! pool->shutdown ) {
+			pthread_cond_wait(&pool->cond, &pool->lock);
+		}
+
+		ThreadPoolTask * task = pool->head;
+
+		if ( task == NULL ) {
+			// Shutting down and nothing left to run
+			pthread_mutex_unlock(&pool->lock);
+			break;
+		}
+
+		pool->head = task->next;
+		if ( pool->head == NULL ) {
+			pool->tail = NULL;
+		}
+
+		pthread_mutex_unlock(&pool->lock);
+
+		task->run(task->udata);
+		free(task);
+	}
+
+	return NULL;
+}
+
+ThreadPool * thread_pool_new(uint32_t size)
+{
+	if ( size == 0 ) {
+		return NULL;
+	}
+
+	ThreadPool * pool = (ThreadPool *) calloc(1, sizeof(ThreadPool));
+	if ( pool == NULL ) {
+		return NULL;
+	}
+
+	pool->threads = (pthread_t *) calloc(size, sizeof(pthread_t));
+	if ( pool->threads == NULL ) {
+		free(pool);
+		return NULL;
+	}
+
+	pthread_mutex_init(&pool->lock, NULL);
+	pthread_cond_init(&pool->cond, NULL);
+
+	for ( uint32_t i = 0; i < size; i++ ) {
+		if ( pthread_create(&pool->threads[i], NULL, thread_pool_worker, pool) != 0 ) {
+			break;
+		}
+		pool->size++;
+	}
+
+	if ( pool->size == 0 ) {
+		thread_pool_destroy(pool);
+		return NULL;
+	}
+
+	return pool;
+}
+
+bool thread_pool_submit(ThreadPool * pool, ThreadPoolTaskFn run, void * udata)
+{
+	ThreadPoolTask * task = (ThreadPoolTask *) malloc(sizeof(ThreadPoolTask));
+	if ( task == NULL ) {
+		return false;
+	}
+
+	task->run = run;
+	task->udata = udata;
+	task->next = NULL;
+
+	pthread_mutex_lock(&pool->lock);
+
+	if ( pool->shutdown ) {
+		pthread_mutex_unlock(&pool->lock);
+		free(task);
+		return false;
+	}
+
+	if ( pool->tail ) {
+		pool->tail->next = task;
+	}
+	else {
+		pool->head = task;
+	}
+	pool->tail = task;
+
+	pthread_cond_signal(&pool->cond);
+	pthread_mutex_unlock(&pool->lock);
+
+	return true;
+}
+
+void thread_pool_destroy(ThreadPool * pool)
+{
+	if ( pool == NULL ) {
+		return;
+	}
+
+	pthread_mutex_lock(&pool->lock);
+	pool->shutdown = true;
+	pthread_cond_broadcast(&pool->cond);
+	pthread_mutex_unlock(&pool->lock);
+
+	for ( uint32_t i = 0; i < pool->size; i++ ) {
+		pthread_join(pool->threads[i], NULL);
+	}
+
+	pthread_cond_destroy(&pool->cond);
+	pthread_mutex_destroy(&pool->lock);
+	free(pool->threads);
+	free(pool);
+}
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+class TestApplyMany(TestBaseClass):
+    def setup_class(cls):
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            TestApplyMany.client = aerospike.client(config).connect()
+        else:
+            TestApplyMany.client = aerospike.client(config).connect(user,
+                                                                    password)
+
+        TestApplyMany.client.udf_put("sample.lua", 0, {})
+
+    def teardown_class(cls):
+        TestApplyMany.client.udf_remove("sample.lua", {'timeout': 0})
+        TestApplyMany.client.close()
+
+    def setup_method(self, method):
+        """
+        Setup method.
+        """
+        self.keys = []
+
+        for i in xrange(10):
+            key = ('test', 'demo', 'apply_many_%d' % i)
+            TestApplyMany.client.put(key, {'name': ['name%d' % i]})
+            self.keys.append(key)
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        TestApplyMany.client.remove_many(self.keys)
+
+    def test_apply_many_without_any_parameter(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestApplyMany.client.apply_many()
+
+        assert "Required argument 'keys' (pos 1) not found" in typeError.value
+
+    def test_apply_many(self):
+
+        results = TestApplyMany.client.apply_many(self.keys, 'sample',
+                                                  'list_append', ['name', 'car'])
+
+        assert results == [0] * len(self.keys)
+        for i, key in enumerate(self.keys):
+            (key, meta, bins) = TestApplyMany.client.get(key)
+            assert bins['name'] == ['name%d' % i, 'car']
+
+    def test_apply_many_with_policy(self):
+
+        results = TestApplyMany.client.apply_many(tuple(self.keys[:3]), u'sample',
+            u'list_append', ['name', 'car'], {'timeout': 1000})
+
+        assert results == [0] * 3
+
+    def test_apply_many_with_failed_keys(self):
+
+        keys = [self.keys[0], ('test', 'demo', 'apply_many_none')]
+
+        results = TestApplyMany.client.apply_many(keys, 'sample',
+                                                  'list_append', ['name', 'car'])
+
+        assert results[0] == 0
+        assert isinstance(results[1], AerospikeError)
+        assert results[1].key[2] == 'apply_many_none'
+
+    def test_apply_many_with_invalid_args(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestApplyMany.client.apply_many(self.keys, 'sample',
+                                            'list_append', 'name')
+
+        assert "expected UDF method arguments in a 'list'" in typeError.value
+
+    def test_apply_many_with_invalid_key(self):
+
+        with pytest.raises(ParamError):
+            TestApplyMany.client.apply_many([self.keys[0], None], 'sample',
+                                            'list_append', ['name', 'car'])
+
+        # nothing is applied when a key is invalid
+        (key, meta, bins) = TestApplyMany.client.get(self.keys[0])
+        assert bins['name'] == ['name0']
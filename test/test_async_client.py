@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import select
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+
+class TestAsyncClient(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            TestAsyncClient.client = aerospike.client(config).connect()
+        else:
+            TestAsyncClient.client = aerospike.client(config).connect(user,
+                                                                      password)
+
+    def teardown_class(cls):
+        TestAsyncClient.client.close()
+
+    def setup_method(self, method):
+        """
+        Setup method.
+        """
+        self.async_client = TestAsyncClient.client.async_client(threads=4)
+        self.results = []
+        self.keys = []
+        for i in xrange(5):
+            key = ('test', 'demo', i)
+            TestAsyncClient.client.put(key, {'name': 'name%s' % (str(i)),
+                                             'age': i})
+            self.keys.append(key)
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        self.async_client.close()
+        for key in self.keys:
+            TestAsyncClient.client.remove(key)
+
+    def callback(self, result, exception):
+        self.results.append((result, exception))
+
+    def wait(self, count):
+        while len(self.results) < count:
+            select.select([self.async_client.fileno()], [], [], 1)
+            self.async_client.process()
+
+    def test_async_get(self):
+        self.async_client.get(('test', 'demo', 1), self.callback)
+        self.wait(1)
+
+        (key, meta, bins), exception = self.results[0]
+        assert exception == None
+        assert bins == {'age': 1, 'name': 'name1'}
+        assert self.async_client.pending == 0
+
+    def test_async_get_non_existent_key(self):
+        self.async_client.get(('test', 'demo', 'non-existent'), self.callback)
+        self.wait(1)
+
+        (key, meta, bins), exception = self.results[0]
+        assert exception == None
+        assert meta == None
+        assert bins == None
+
+    def test_async_put_then_get(self):
+        key = ('test', 'demo', 'async_put')
+        self.keys.append(key)
+        self.async_client.put(key, {'a': 1}, self.callback)
+        self.wait(1)
+        assert self.results[0] == (0, None)
+
+        self.async_client.get(key, self.callback)
+        self.wait(2)
+        (key, meta, bins), exception = self.results[1]
+        assert bins == {'a': 1}
+
+    def test_async_put_bins_changed_after_call(self):
+        key = ('test', 'demo', 'async_put_changed')
+        self.keys.append(key)
+        bins = {'s': 'value-' + 'x' * 512}
+        self.async_client.put(key, bins, self.callback)
+        bins['s'] = None
+        self.wait(1)
+        assert self.results[0] == (0, None)
+
+        key, meta, bins = TestAsyncClient.client.get(key)
+        assert bins == {'s': 'value-' + 'x' * 512}
+
+    def test_async_operate(self):
+        key = ('test', 'demo', 1)
+        ops = [{"op": aerospike.OPERATOR_INCR, "bin": "age", "val": 3},
+               {"op": aerospike.OPERATOR_READ, "bin": "age"}]
+        self.async_client.operate(key, ops, self.callback)
+        self.wait(1)
+
+        (key, meta, bins), exception = self.results[0]
+        assert exception == None
+        assert bins == {'age': 4}
+
+    def test_async_get_many(self):
+        self.async_client.get_many(self.keys, self.callback)
+        self.wait(1)
+
+        records, exception = self.results[0]
+        assert exception == None
+        assert len(records) == 5
+
+    def test_async_many_requests(self):
+        for i in xrange(100):
+            self.async_client.get(self.keys[i % 5], self.callback)
+        self.wait(100)
+
+        assert len(self.results) == 100
+        assert all(exception == None for result, exception in self.results)
+
+    def test_async_error_is_passed_to_callback(self):
+        self.async_client.get(('test', 'demo', 1), self.callback,
+                              {'timeout': 1000})
+        self.async_client.put(('test', 'demo', 1), {'a': 1}, self.callback,
+                              {'gen': 10},
+                              {'gen': aerospike.POLICY_GEN_EQ})
+        self.wait(2)
+
+        exceptions = [exception for result, exception in self.results
+                      if exception is not None]
+        assert len(exceptions) == 1
+        assert exceptions[0].code == 3
+
+    def test_async_invalid_key(self):
+        with pytest.raises(ParamError):
+            self.async_client.get(('test', 'demo', None), self.callback)
+
+    def test_async_callback_not_callable(self):
+        with pytest.raises(ParamError):
+            self.async_client.get(('test', 'demo', 1), None)
+
+    def test_async_close_invokes_pending_callbacks(self):
+        for key in self.keys:
+            self.async_client.get(key, self.callback)
+        self.async_client.close()
+
+        assert len(self.results) == 5
+        with pytest.raises(ClientError):
+            self.async_client.get(('test', 'demo', 1), self.callback)
+
+    def test_client_close_with_pending_requests(self):
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            client = aerospike.client(config).connect()
+        else:
+            client = aerospike.client(config).connect(user, password)
+        async_client = client.async_client(threads=1)
+
+        async_client.get(('test', 'demo', 1), self.callback)
+        with pytest.raises(ClientError):
+            client.close()
+
+        async_client.close()
+        assert len(self.results) == 1
+        client.close()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+
+class TestConfig(TestBaseClass):
+    def setup_class(cls):
+        hostlist, user, password = TestBaseClass.get_hosts()
+
+    def test_config_defaults(self):
+        """
+            Invoke config() on a client configured with hosts only.
+        """
+        client = aerospike.client({'hosts': TestConfig.hostlist})
+
+        config = client.config()
+
+        assert config['hosts'] == [(str(addr), port) for (addr, port) in
+                                   TestConfig.hostlist]
+        assert config['max_conns_per_node'] > 0
+        assert config['tend_interval'] > 0
+        assert config['thread_pool_size'] > 0
+        assert config['async_threads'] == 8
+        assert config['batch_max_keys'] == 5000
+        assert config['batch_max_concurrent'] == 0
+        assert 'timeout' in config['policies']
+        assert 'shm' not in config
+
+    def test_config_tuned(self):
+        """
+            Invoke config() on a client with tuned pools.
+        """
+        client = aerospike.client({
+            'hosts': TestConfig.hostlist,
+            'connect_timeout': 2000,
+            'max_conns_per_node': 64,
+            'tend_interval': 500,
+            'thread_pool_size': 4,
+            'async_threads': 2,
+            'batch_max_keys': 100,
+            'batch_max_concurrent': 3,
+            'policies': {'timeout': 1500},
+            'shm': {'shm_max_nodes': 32}
+        })
+
+        config = client.config()
+
+        assert config['connect_timeout'] == 2000
+        assert config['max_conns_per_node'] == 64
+        assert config['tend_interval'] == 500
+        assert config['thread_pool_size'] == 4
+        assert config['async_threads'] == 2
+        assert config['batch_max_keys'] == 100
+        assert config['batch_max_concurrent'] == 3
+        assert config['policies']['timeout'] == 1500
+        assert config['shm']['shm_max_nodes'] == 32
+
+    def test_config_connected(self):
+        """
+            Invoke config() on a connected client.
+        """
+        config = {'hosts': TestConfig.hostlist, 'thread_pool_size': 8}
+        if TestConfig.user == None and TestConfig.password == None:
+            client = aerospike.client(config).connect()
+        else:
+            client = aerospike.client(config).connect(TestConfig.user,
+                                                      TestConfig.password)
+
+        assert client.config()['thread_pool_size'] == 8
+        client.close()
+
+    def test_config_invalid_values_are_ignored(self):
+        """
+            Invoke config() on a client with invalid pool sizes.
+        """
+        default = aerospike.client({'hosts': TestConfig.hostlist}).config()
+        client = aerospike.client({'hosts': TestConfig.hostlist,
+                                   'max_conns_per_node': -1,
+                                   'thread_pool_size': 'four'})
+
+        config = client.config()
+
+        assert config['max_conns_per_node'] == default['max_conns_per_node']
+        assert config['thread_pool_size'] == default['thread_pool_size']
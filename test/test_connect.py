@@ -158,3 +158,30 @@ class TestConnect(TestBaseClass):
         except ClientError as exception:
             assert exception.code == -1
             assert exception.msg == 'Failed to seed cluster'
+
+    def test_connect_positive_with_shm(self):
+        """
+            Invoke connect() with shared memory cluster tending.
+        """
+        config = {
+            'hosts': TestConnect.hostlist,
+            'shm': {'shm_max_nodes': 32, 'shm_max_namespaces': 8,
+                    'shm_takeover_threshold_sec': 30}
+        }
+        if TestConnect.user == None and TestConnect.password == None:
+            self.client = aerospike.client(config).connect()
+            self.other = aerospike.client(config).connect()
+        else:
+            self.client = aerospike.client(config).connect(
+                TestConnect.user, TestConnect.password)
+            self.other = aerospike.client(config).connect(
+                TestConnect.user, TestConnect.password)
+
+        key = ('test', 'demo', 'shm')
+        self.client.put(key, {'a': 1})
+        (key, meta, bins) = self.other.get(key)
+        assert bins == {'a': 1}
+
+        self.client.remove(key)
+        self.client.close()
+        self.other.close()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import array
 import pytest
 import sys
 from test_base_class import TestBaseClass
@@ -177,3 +178,71 @@ class TestExistsMany(TestBaseClass):
         except ClusterError as exception:
             assert exception.code == 11L
             assert exception.msg == 'No connection to aerospike cluster'
+
+    def test_exists_many_ordered(self):
+
+        digest = TestExistsMany.client.get_key_digest('test', 'demo', 1)
+        keys = [('test', 'demo', 'non-existent'), self.keys[2],
+                ('test', 'demo', None, digest), self.keys[2]]
+
+        records = TestExistsMany.client.exists_many(keys,
+                                                    options={'ordered': True})
+
+        assert type(records) == list
+        assert len(records) == 4
+        assert records[0] == None
+        assert records[1]['gen'] != None
+        assert records[2]['ttl'] != None
+        assert records[3] == records[1]
+
+    def test_exists_many_with_invalid_options(self):
+
+        with pytest.raises(ParamError):
+            TestExistsMany.client.exists_many(self.keys, None, [True])
+
+    def test_exists_many_split(self):
+
+        keys = self.keys + self.keys[:2]
+
+        records = TestExistsMany.client.exists_many(keys, {'max_keys': 2},
+                                                    {'ordered': True})
+
+        assert len(records) == 7
+        for i in xrange(5):
+            assert records[i]['gen'] != None
+        assert records[5] == records[0]
+        assert records[6] == records[1]
+
+    def test_exists_many_bitmap(self):
+
+        keys = [('test', 'demo', 'non-existent')] + self.keys + self.keys[:4]
+
+        bitmap = TestExistsMany.client.exists_many(keys,
+                                                   options={'output': 'bitmap'})
+
+        assert bitmap == '\xfe\x03'
+
+    def test_exists_many_arrays(self):
+
+        keys = [self.keys[0], ('test', 'demo', 'non-existent'), self.keys[1]]
+        TestExistsMany.client.put(self.keys[1], {'age': 10})
+
+        (bitmap, gens, ttls) = TestExistsMany.client.exists_many(keys,
+            options={'output': 'arrays'})
+
+        assert bitmap == '\x05'
+        assert isinstance(gens, array.array)
+        assert gens.tolist() == [1, 0, 2]
+        assert ttls[0] > 0
+        assert ttls[1] == 0
+        assert ttls[2] > 0
+
+    def test_exists_many_with_invalid_output(self):
+
+        with pytest.raises(ParamError):
+            TestExistsMany.client.exists_many(self.keys,
+                                              options={'output': 'bits'})
+
+        with pytest.raises(ParamError):
+            TestExistsMany.client.get_many(self.keys,
+                                           options={'output': 'bitmap'})
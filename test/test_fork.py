@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import os
+import cPickle as pickle
+import multiprocessing
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+
+def get_in_worker(args):
+    client, key = args
+    if TestBaseClass.user == None and TestBaseClass.password == None:
+        client.connect()
+    else:
+        client.connect(TestBaseClass.user, TestBaseClass.password)
+    (key, meta, bins) = client.get(key)
+    client.close()
+    return bins
+
+
+class TestFork(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        TestFork.config = {'hosts': hostlist}
+        if user == None and password == None:
+            TestFork.client = aerospike.client(TestFork.config).connect()
+        else:
+            TestFork.client = aerospike.client(TestFork.config).connect(user,
+                                                                        password)
+
+    def teardown_class(cls):
+        TestFork.client.close()
+
+    def setup_method(self, method):
+        """
+        Setup method.
+        """
+        self.key = ('test', 'demo', 'fork')
+        TestFork.client.put(self.key, {'name': 'fork'})
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        TestFork.client.remove(self.key)
+
+    def run_in_child(self, function):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                status = 0 if function() else 1
+            except:
+                status = 2
+            os._exit(status)
+        (pid, status) = os.waitpid(pid, 0)
+        return os.WEXITSTATUS(status)
+
+    def test_client_used_in_forked_child(self):
+
+        def child():
+            (key, meta, bins) = TestFork.client.get(self.key)
+            return bins == {'name': 'fork'}
+
+        assert self.run_in_child(child) == 0
+
+        # the parent keeps its own connections
+        (key, meta, bins) = TestFork.client.get(self.key)
+        assert bins == {'name': 'fork'}
+
+    def test_client_closed_in_forked_child(self):
+
+        def child():
+            TestFork.client.close()
+            return not TestFork.client.is_connected()
+
+        assert self.run_in_child(child) == 0
+
+        (key, meta, bins) = TestFork.client.get(self.key)
+        assert bins == {'name': 'fork'}
+
+    def test_client_pickled(self):
+
+        client = pickle.loads(pickle.dumps(TestFork.client))
+
+        assert isinstance(client, aerospike.Client)
+        assert client.is_connected() == False
+        assert get_in_worker((client, self.key)) == {'name': 'fork'}
+
+    def test_client_pickled_config_is_a_copy(self):
+
+        config = {'hosts': list(TestFork.config['hosts'])}
+        client = aerospike.client(config)
+        config['hosts'].append(('127.0.0.2', 3000))
+
+        (cls, (pickled_config,)) = client.__reduce__()
+
+        assert cls is aerospike.Client
+        assert pickled_config['hosts'] == TestFork.config['hosts']
+
+    def test_client_sent_to_pool_workers(self):
+
+        pool = multiprocessing.Pool(2)
+        try:
+            results = pool.map(get_in_worker,
+                               [(TestFork.client, self.key)] * 4)
+        finally:
+            pool.close()
+            pool.join()
+
+        assert results == [{'name': 'fork'}] * 4
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import threading
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+futures = pytest.importorskip("concurrent.futures")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+
+class TestGetAsync(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist, 'async_threads': 4}
+        if user == None and password == None:
+            TestGetAsync.client = aerospike.client(config).connect()
+        else:
+            TestGetAsync.client = aerospike.client(config).connect(user,
+                                                                   password)
+
+    def teardown_class(cls):
+        TestGetAsync.client.close()
+
+    def setup_method(self, method):
+        """
+        Setup method.
+        """
+        self.keys = []
+        for i in xrange(5):
+            key = ('test', 'demo', i)
+            TestGetAsync.client.put(key, {'name': 'name%s' % (str(i)),
+                                          'age': i})
+            self.keys.append(key)
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        for key in self.keys:
+            TestGetAsync.client.remove(key)
+
+    def test_get_async(self):
+        future = TestGetAsync.client.get_async(('test', 'demo', 1))
+
+        assert isinstance(future, futures.Future)
+        key, meta, bins = future.result()
+        assert bins == {'age': 1, 'name': 'name1'}
+
+    def test_get_async_non_existent_key(self):
+        future = TestGetAsync.client.get_async(('test', 'demo', 'non-existent'))
+
+        key, meta, bins = future.result()
+        assert meta == None
+        assert bins == None
+
+    def test_get_async_with_invalid_key(self):
+        with pytest.raises(ParamError):
+            TestGetAsync.client.get_async(('test', 'demo', None))
+
+    def test_get_async_many_requests(self):
+        fs = [TestGetAsync.client.get_async(self.keys[i % 5])
+              for i in xrange(200)]
+        done, not_done = futures.wait(fs)
+
+        assert len(done) == 200
+        assert all(f.exception() == None for f in done)
+
+    def test_get_async_done_callback(self):
+        results = []
+        done = threading.Event()
+
+        def callback(future):
+            results.append(future.result())
+            done.set()
+
+        future = TestGetAsync.client.get_async(('test', 'demo', 2))
+        future.add_done_callback(callback)
+        done.wait(5)
+
+        key, meta, bins = results[0]
+        assert bins['age'] == 2
+
+    def test_put_async_then_get(self):
+        key = ('test', 'demo', 'put_async')
+        self.keys.append(key)
+
+        assert TestGetAsync.client.put_async(key, {'a': 1}).result() == 0
+        key, meta, bins = TestGetAsync.client.get(key)
+        assert bins == {'a': 1}
+
+    def test_put_async_generation_error(self):
+        future = TestGetAsync.client.put_async(
+            ('test', 'demo', 1), {'a': 1}, {'gen': 10},
+            {'gen': aerospike.POLICY_GEN_EQ})
+
+        with pytest.raises(RecordGenerationError):
+            future.result()
+
+    def test_put_async_bins_changed_after_call(self):
+        fs = []
+        for i in xrange(50):
+            key = ('test', 'demo', 'put_async_%d' % i)
+            self.keys.append(key)
+            bins = {'s': 'value-%d-' % i + 'x' * 512}
+            fs.append(TestGetAsync.client.put_async(key, bins))
+            # Drop the only reference to the string while the put is queued
+            bins['s'] = None
+        futures.wait(fs)
+
+        for i in xrange(50):
+            key, meta, bins = TestGetAsync.client.get(
+                ('test', 'demo', 'put_async_%d' % i))
+            assert bins == {'s': 'value-%d-' % i + 'x' * 512}
+
+    def test_operate_async_ops_changed_after_call(self):
+        ops = [{"op": aerospike.OPERATOR_WRITE, "bin": "name",
+                "val": 'name-' + 'y' * 512},
+               {"op": aerospike.OPERATOR_APPEND, "bin": "name",
+                "val": '-' + 'z' * 512}]
+        future = TestGetAsync.client.operate_async(('test', 'demo', 1), ops)
+        for op in ops:
+            op['val'] = None
+        future.result()
+
+        key, meta, bins = TestGetAsync.client.get(('test', 'demo', 1))
+        assert bins['name'] == 'name-' + 'y' * 512 + '-' + 'z' * 512
+
+    def test_operate_async(self):
+        ops = [{"op": aerospike.OPERATOR_INCR, "bin": "age", "val": 3},
+               {"op": aerospike.OPERATOR_READ, "bin": "age"}]
+        key, meta, bins = TestGetAsync.client.operate_async(
+            ('test', 'demo', 1), ops).result()
+
+        assert bins == {'age': 4}
+
+    def test_get_many_async(self):
+        records = TestGetAsync.client.get_many_async(self.keys).result()
+
+        assert len(records) == 5
+
+    def test_get_many_async_keys_changed_after_call(self):
+        keys = []
+        for i in xrange(20):
+            key = ('test', 'demo', 'get_many_async_%d-' % i + 'k' * 256)
+            TestGetAsync.client.put(key, {'i': i})
+            self.keys.append(key)
+            # A new string, only referenced by the list
+            keys.append(('test', 'demo', key[2][:-1] + key[2][-1]))
+
+        future = TestGetAsync.client.get_many_async(keys)
+        # Drop the only references to the key tuples while the batch is queued
+        del keys[:]
+        records = future.result()
+
+        assert len(records) == 20
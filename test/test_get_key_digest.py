@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import array
 import pytest
 import sys
 import cPickle as pickle
 from test_base_class import TestBaseClass
 
 aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
 
 
 class SomeClass(object):
@@ -130,3 +136,55 @@ class TestGetKeyDigest(object):
                                                             None)
 
         assert 'Key is invalid' in typeError.value
+
+    def test_get_key_digest_many(self):
+
+        keys = ["get_digest_key", u"unicode_key", 1, 2L ** 40]
+
+        digests = TestGetKeyDigest.client.get_key_digest_many("test", "demo",
+                                                              keys)
+
+        assert type(digests) == str
+        assert len(digests) == 20 * len(keys)
+        for i, key in enumerate(keys):
+            digest = TestGetKeyDigest.client.get_key_digest("test", "demo",
+                                                            key)
+            assert bytearray(digests[20 * i:20 * (i + 1)]) == digest
+
+    def test_get_key_digest_many_int64_array(self):
+
+        keys = array.array('l', [5, 0, -3])
+
+        digests = TestGetKeyDigest.client.get_key_digest_many("test", u"demo",
+                                                              keys)
+
+        assert len(digests) == 60
+        for i, key in enumerate(keys):
+            digest = TestGetKeyDigest.client.get_key_digest("test", "demo",
+                                                            key)
+            assert bytearray(digests[20 * i:20 * (i + 1)]) == digest
+
+    def test_get_key_digest_many_empty(self):
+
+        assert TestGetKeyDigest.client.get_key_digest_many("test", "demo",
+                                                           ()) == ''
+
+    def test_get_key_digest_many_with_invalid_key(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestGetKeyDigest.client.get_key_digest_many("test", "demo",
+                                                        [1, None])
+
+        assert 'Key is invalid' in typeError.value
+
+    def test_get_key_digest_many_with_invalid_keys(self):
+
+        with pytest.raises(ParamError):
+            TestGetKeyDigest.client.get_key_digest_many("test", "demo",
+                                                        array.array('d', [1]))
+
+    def test_get_key_digest_many_with_overflowing_key(self):
+
+        with pytest.raises(OverflowError):
+            TestGetKeyDigest.client.get_key_digest_many("test", "demo",
+                                                        [1, 2 ** 64])
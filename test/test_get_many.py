@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import array
 import pytest
 import sys
 from test_base_class import TestBaseClass
@@ -176,3 +177,135 @@ class TestGetMany(TestBaseClass):
         except ClusterError as exception:
             assert exception.code == 11L
             assert exception.msg == 'No connection to aerospike cluster'
+
+    def test_get_many_ordered(self):
+
+        digest = TestGetMany.client.get_key_digest('test', 'demo', 1)
+        keys = [self.keys[3], ('test', 'demo', None, digest),
+                ('test', 'demo', 'non-existent'), self.keys[3]]
+
+        records = TestGetMany.client.get_many(keys, None, {'ordered': True})
+
+        assert type(records) == list
+        assert len(records) == 4
+        assert records[0][2] == {'name': 'name3', 'age': 3}
+        assert records[1][2] == {'name': 'name1', 'age': 1}
+        assert records[2] == None
+        assert records[3][2] == {'name': 'name3', 'age': 3}
+
+    def test_get_many_ordered_false(self):
+
+        records = TestGetMany.client.get_many(self.keys,
+                                              options={'ordered': False})
+
+        assert type(records) == dict
+        assert len(records.keys()) == 5
+
+    def test_get_many_with_invalid_options(self):
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many(self.keys, options={'ordered': 1})
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many(self.keys, options={'sorted': True})
+
+    def test_get_many_split(self):
+
+        keys = self.keys + [('test', 'demo', 'non-existent')] + self.keys
+
+        records = TestGetMany.client.get_many(keys, {'max_keys': 2,
+                                                     'max_concurrent': 2})
+
+        assert type(records) == dict
+        assert len(records.keys()) == 6
+        for i in xrange(5):
+            assert records[i][2] == {'name': 'name%s' % (str(i)), 'age': i}
+        assert records['non-existent'] == None
+
+    def test_get_many_split_ordered(self):
+
+        keys = [self.keys[4], self.keys[0], self.keys[4],
+                ('test', 'demo', 'non-existent'), self.keys[2]]
+
+        records = TestGetMany.client.get_many(keys, {'max_keys': 1},
+                                              {'ordered': True})
+
+        assert len(records) == 5
+        assert records[0][2] == {'name': 'name4', 'age': 4}
+        assert records[1][2] == {'name': 'name0', 'age': 0}
+        assert records[2][2] == {'name': 'name4', 'age': 4}
+        assert records[3] == None
+        assert records[4][2] == {'name': 'name2', 'age': 2}
+
+    def test_get_many_split_with_long_max_keys(self):
+
+        records = TestGetMany.client.get_many(self.keys, {'max_keys': 2L},
+                                              {'ordered': True})
+
+        assert len(records) == 5
+        for i in xrange(5):
+            assert records[i][2] == {'name': 'name%s' % (str(i)), 'age': i}
+
+    def test_get_many_with_invalid_max_keys(self):
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many(self.keys, {'max_keys': -1})
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many(self.keys, {'max_concurrent': 'all'})
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many(self.keys, {'max_keys': 2 ** 40})
+
+    def test_get_many_int64_array(self):
+
+        keys = array.array('l', [4, 0, 2, 7])
+
+        records = TestGetMany.client.get_many('test', 'demo', keys)
+
+        assert type(records) == dict
+        assert len(records.keys()) == 4
+        assert records[0][2] == {'name': 'name0', 'age': 0}
+        assert records[4][2] == {'name': 'name4', 'age': 4}
+        assert records[7] == None
+
+    def test_get_many_int64_array_ordered(self):
+
+        keys = array.array('l', [3, 1, 3])
+
+        records = TestGetMany.client.get_many('test', u'demo', keys,
+                                              {'timeout': 1000},
+                                              {'ordered': True})
+
+        assert [record[2]['age'] for record in records] == [3, 1, 3]
+        assert records[0][0][:3] == ('test', 'demo', 3)
+
+    def test_get_many_int64_array_with_keywords(self):
+
+        records = TestGetMany.client.get_many(ns='test', set='demo',
+                                              keys=array.array('l', [1]))
+
+        assert records[1][2] == {'name': 'name1', 'age': 1}
+
+    def test_get_many_with_invalid_int64_array(self):
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many('test', 'demo', array.array('i', [1]))
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many('test', 'demo', [1, 2])
+
+        with pytest.raises(ParamError):
+            TestGetMany.client.get_many('test', 5, array.array('l', [1]))
+
+    def test_get_many_shares_bin_names(self):
+
+        records = TestGetMany.client.get_many(self.keys, None,
+                                              {'ordered': True})
+
+        names = set()
+        for (key, meta, bins) in records:
+            names.update(id(name) for name in bins.keys())
+
+        # bin names are interned once, not created per record
+        assert len(names) == 2
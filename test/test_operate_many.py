@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+class TestOperateMany(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            TestOperateMany.client = aerospike.client(config).connect()
+        else:
+            TestOperateMany.client = aerospike.client(config).connect(user,
+                                                                      password)
+
+    def teardown_class(cls):
+        TestOperateMany.client.close()
+
+    def setup_method(self, method):
+        self.keys = []
+
+        for i in xrange(20):
+            key = ('test', 'demo', 'operate_many_%d' % i)
+            TestOperateMany.client.put(key, {'views': i, 'name': 'name%d' % i})
+            self.keys.append(key)
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        TestOperateMany.client.remove_many(self.keys)
+
+    def test_operate_many_without_any_parameter(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestOperateMany.client.operate_many()
+
+        assert "Required argument 'keys' (pos 1) not found" in typeError.value
+
+    def test_operate_many(self):
+
+        ops = [
+            {'op': aerospike.OPERATOR_INCR, 'bin': 'views', 'val': 10},
+            {'op': aerospike.OPERATOR_APPEND, 'bin': 'name', 'val': '_x'},
+            {'op': aerospike.OPERATOR_READ, 'bin': 'views'}
+        ]
+
+        results = TestOperateMany.client.operate_many(self.keys, ops)
+
+        assert len(results) == len(self.keys)
+        for i, (key, meta, bins) in enumerate(results):
+            assert key[2] == self.keys[i][2]
+            assert bins == {'views': i + 10}
+
+        (key, meta, bins) = TestOperateMany.client.get(self.keys[3])
+        assert bins == {'views': 13, 'name': 'name3_x'}
+
+    def test_operate_many_with_meta_and_policy(self):
+
+        ops = [{'op': aerospike.OPERATOR_WRITE, 'bin': 'flag', 'val': 1}]
+
+        results = TestOperateMany.client.operate_many(tuple(self.keys[:5]),
+            ops, {'ttl': 1000}, {'timeout': 1000})
+
+        assert len(results) == 5
+        (key, meta, bins) = TestOperateMany.client.get(self.keys[0])
+        assert bins['flag'] == 1
+        assert 0 < meta['ttl'] <= 1000
+
+    def test_operate_many_with_failed_keys(self):
+
+        keys = [self.keys[0], ('test', 'demo', 'operate_many_none'), self.keys[1]]
+        ops = [{'op': aerospike.OPERATOR_READ, 'bin': 'views'}]
+
+        results = TestOperateMany.client.operate_many(keys, ops)
+
+        assert results[0][2] == {'views': 0}
+        assert isinstance(results[1], RecordNotFound)
+        assert results[1].code == 2
+        assert results[1].key[2] == 'operate_many_none'
+        assert results[2][2] == {'views': 1}
+
+    def test_operate_many_empty(self):
+
+        ops = [{'op': aerospike.OPERATOR_READ, 'bin': 'views'}]
+
+        assert TestOperateMany.client.operate_many([], ops) == []
+
+    def test_operate_many_with_invalid_operations(self):
+
+        with pytest.raises(ParamError) as exception:
+            TestOperateMany.client.operate_many(self.keys, {'op': 1})
+
+        assert exception.value.msg == "Operations should be of type list"
+
+    def test_operate_many_with_invalid_key(self):
+
+        ops = [{'op': aerospike.OPERATOR_INCR, 'bin': 'views', 'val': 1}]
+
+        with pytest.raises(ParamError):
+            TestOperateMany.client.operate_many([self.keys[0], 1], ops)
+
+        # nothing is performed when a key is invalid
+        (key, meta, bins) = TestOperateMany.client.get(self.keys[0])
+        assert bins['views'] == 0
@@ -1051,3 +1051,24 @@ class TestPut(TestBaseClass):
         except ClusterError as exception:
             assert exception.code == 11L
             assert exception.msg == 'No connection to aerospike cluster'
+
+    def test_put_with_more_than_1024_serialized_values(self):
+        """
+            Invoke put() for a record with more bytes values than the
+            former fixed size of the static pool
+        """
+        key = ('test', 'demo', 'put_many_bytes')
+
+        values = [bytearray('value%d' % i) for i in xrange(2000)]
+        rec = {'values': values, 'tuple': (1, 2)}
+
+        res = TestPut.client.put(key, rec)
+
+        assert res == 0
+
+        (key, meta, bins) = TestPut.client.get(key)
+
+        assert bins['values'] == values
+        assert bins['tuple'] == (1, 2)
+
+        TestPut.client.remove(key)
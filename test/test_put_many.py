@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+class TestPutMany(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist, 'async_threads': 4}
+        if user == None and password == None:
+            TestPutMany.client = aerospike.client(config).connect()
+        else:
+            TestPutMany.client = aerospike.client(config).connect(user,
+                                                                  password)
+
+    def teardown_class(cls):
+        TestPutMany.client.close()
+
+    def setup_method(self, method):
+        self.keys = [('test', 'demo', 'put_many_%d' % i) for i in xrange(100)]
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        for key in self.keys:
+            try:
+                TestPutMany.client.remove(key)
+            except RecordNotFound:
+                pass
+
+    def test_put_many_without_any_parameter(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestPutMany.client.put_many()
+
+        assert "Required argument 'records' (pos 1) not found" in typeError.value
+
+    def test_put_many(self):
+
+        records = [(key, {'name': key[2], 'i': i})
+                   for i, key in enumerate(self.keys)]
+
+        status = TestPutMany.client.put_many(records)
+
+        assert list(status) == [0] * len(self.keys)
+        for i, key in enumerate(self.keys):
+            (key, meta, bins) = TestPutMany.client.get(key)
+            assert bins == {'name': key[2], 'i': i}
+
+    def test_put_many_with_meta_and_tuple(self):
+
+        records = tuple((key, {'i': 1}, {'ttl': 1000})
+                        for key in self.keys[:10])
+
+        status = TestPutMany.client.put_many(records)
+
+        assert list(status) == [0] * 10
+        (key, meta, bins) = TestPutMany.client.get(self.keys[0])
+        assert 0 < meta['ttl'] <= 1000
+
+    def test_put_many_with_bytes_and_serialized_values(self):
+
+        records = [(key, {'b': bytearray('abc'), 't': (1, 2), 'l': [bytearray('x')]})
+                   for key in self.keys]
+
+        status = TestPutMany.client.put_many(records)
+
+        assert list(status) == [0] * len(self.keys)
+        (key, meta, bins) = TestPutMany.client.get(self.keys[-1])
+        assert bins == {'b': bytearray('abc'), 't': (1, 2), 'l': [bytearray('x')]}
+
+    def test_put_many_returns_per_key_status(self):
+
+        TestPutMany.client.put(self.keys[1], {'i': 1})
+        records = [(key, {'i': 2}) for key in self.keys[:3]]
+
+        status = TestPutMany.client.put_many(records,
+            policy={'exists': aerospike.POLICY_EXISTS_CREATE})
+
+        assert list(status) == [0, 5, 0]
+        (key, meta, bins) = TestPutMany.client.get(self.keys[1])
+        assert bins == {'i': 1}
+
+    def test_put_many_empty(self):
+
+        status = TestPutMany.client.put_many([])
+
+        assert len(status) == 0
+
+    def test_put_many_with_invalid_key(self):
+
+        records = [(self.keys[0], {'i': 1}), (('test', 'demo'), {'i': 2})]
+
+        with pytest.raises(ParamError):
+            TestPutMany.client.put_many(records)
+
+        # nothing is written when a record is invalid
+        (key, meta, bins) = TestPutMany.client.get(self.keys[0])
+        assert meta == None
+
+    def test_put_many_with_invalid_record(self):
+
+        with pytest.raises(ParamError) as exception:
+            TestPutMany.client.put_many([self.keys[0]])
+
+        assert exception.value.msg == "Record should be a (key, bins[, meta]) tuple."
+
+    def test_put_many_with_invalid_records(self):
+
+        with pytest.raises(ParamError) as exception:
+            TestPutMany.client.put_many({'a': 1})
+
+        assert exception.value.msg == "Records should be specified as a list or tuple."
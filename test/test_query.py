@@ -312,9 +312,9 @@ class TestQuery(TestBaseClass):
             assert metadata['gen'] != None
 
         with pytest.raises(TypeError) as typeError:
-            query.foreach(callback, policy, "")
+            query.foreach(callback, policy, None, 10, "")
 
-        assert "foreach() takes at most 2 arguments (3 given)" in typeError.value
+        assert "foreach() takes at most 4 arguments (5 given)" in typeError.value
 
     def test_query_with_incorrect_policy_value(self):
         """
@@ -772,3 +772,114 @@ class TestQuery(TestBaseClass):
 
         query.foreach(callback, policy)
         assert len(records) == 0
+
+    def test_query_with_batch_size(self):
+        """
+            Invoke query() with records delivered in batches
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        batches = []
+
+        def callback(records):
+            batches.append(records)
+
+        query.foreach(callback, batch_size=2)
+
+        records = [record for batch in batches for record in batch]
+        assert len(records) == 4
+        assert all(0 < len(batch) <= 2 for batch in batches)
+
+    def test_query_iter(self):
+        """
+            Invoke iter() on a query
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        records = [bins for key, meta, bins in query.iter(queue_size=1)]
+
+        assert len(records) == 4
+
+    def test_query_changed_while_iterating(self):
+        """
+            Invoke select() and results() on a query while it is iterated
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        iterator = query.iter(queue_size=1)
+        first = next(iterator)
+        query.select('name')
+        records = query.results()
+        rest = list(iterator)
+
+        assert len(records) == 4
+        assert all(bins.keys() == ['name'] for key, meta, bins in records)
+        assert len(rest) == 3
+        assert all('test_age' in bins for key, meta, bins in [first] + rest)
+
+    def test_query_results_with_digest_bytes(self):
+        """
+            Invoke results() with the digests returned as str
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        records = query.results(options={'digest_bytes': True})
+
+        assert len(records) == 4
+        assert records[0][0][0] is records[1][0][0]
+        digests = set(key[3] for key, meta, bins in records)
+        assert len(digests) == 4
+        assert all(isinstance(digest, str) for digest in digests)
+
+    def test_query_foreach_and_iter_with_nokey(self):
+        """
+            Invoke foreach() and iter() without the key tuples
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        records = []
+
+        def callback((key, meta, bins)):
+            records.append((key, bins))
+
+        query.foreach(callback, options={'nokey': True})
+
+        assert len(records) == 4
+        assert all(key is None for key, bins in records)
+
+        records = [key for key, meta, bins in query.iter(
+            options={'nokey': True})]
+        assert records == [None] * 4
+
+    def test_query_with_invalid_options(self):
+        """
+            Invoke results() with options that are not a dict
+        """
+        query = self.client.query('test', 'demo')
+        query.where(p.between('test_age', 1, 4))
+
+        with pytest.raises(ParamError):
+            query.results(options=['nokey'])
+
+    def test_query_iter_with_lazy_bins(self):
+        """
+            Invoke iter() returning aerospike.Record objects
+        """
+        query = self.client.query('test', 'demo')
+        query.select('name', 'test_age')
+        query.where(p.between('test_age', 1, 4))
+
+        ages = sorted(record['test_age'] for record in query.iter(
+            options={'lazy_bins': True}))
+
+        assert ages == [1, 2, 3, 4]
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    from aerospike.exception import *
+except:
+    print "Please install aerospike python client."
+    sys.exit(1)
+
+class TestRemoveMany(TestBaseClass):
+    def setup_class(cls):
+        """
+        Setup method.
+        """
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            TestRemoveMany.client = aerospike.client(config).connect()
+        else:
+            TestRemoveMany.client = aerospike.client(config).connect(user,
+                                                                     password)
+
+    def teardown_class(cls):
+        TestRemoveMany.client.close()
+
+    def setup_method(self, method):
+        self.keys = []
+
+        for i in xrange(50):
+            key = ('test', 'demo', 'remove_many_%d' % i)
+            TestRemoveMany.client.put(key, {'i': i})
+            self.keys.append(key)
+
+    def teardown_method(self, method):
+        """
+        Teardown method.
+        """
+        TestRemoveMany.client.remove_many(self.keys)
+
+    def test_remove_many_without_any_parameter(self):
+
+        with pytest.raises(TypeError) as typeError:
+            TestRemoveMany.client.remove_many()
+
+        assert "Required argument 'keys' (pos 1) not found" in typeError.value
+
+    def test_remove_many(self):
+
+        status = TestRemoveMany.client.remove_many(self.keys)
+
+        assert list(status) == [0] * len(self.keys)
+        for key in self.keys:
+            (key, meta, bins) = TestRemoveMany.client.get(key)
+            assert meta == None
+
+    def test_remove_many_with_tuple_and_policy(self):
+
+        status = TestRemoveMany.client.remove_many(tuple(self.keys[:5]),
+                                                   {'timeout': 1000})
+
+        assert list(status) == [0] * 5
+
+    def test_remove_many_with_not_found_keys(self):
+
+        keys = [self.keys[0], ('test', 'demo', 'remove_many_none'), self.keys[1]]
+
+        status = TestRemoveMany.client.remove_many(keys)
+
+        assert list(status) == [0, 2, 0]
+
+    def test_remove_many_empty(self):
+
+        status = TestRemoveMany.client.remove_many([])
+
+        assert len(status) == 0
+
+    def test_remove_many_with_invalid_key(self):
+
+        with pytest.raises(ParamError) as exception:
+            TestRemoveMany.client.remove_many([self.keys[0], 'invalid'])
+
+        assert exception.value.msg == "Key should be a tuple."
+        # nothing is removed when a key is invalid
+        (key, meta, bins) = TestRemoveMany.client.get(self.keys[0])
+        assert bins == {'i': 0}
+
+    def test_remove_many_with_invalid_keys(self):
+
+        with pytest.raises(ParamError) as exception:
+            TestRemoveMany.client.remove_many(self.keys[0][2])
+
+        assert exception.value.msg == "Keys should be specified as a list or tuple."
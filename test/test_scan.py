@@ -365,3 +365,226 @@ class TestScan(TestBaseClass):
         records = []
         records = scan_obj.results()
         assert len(records) != 0
+
+    def test_scan_with_batch_size(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        batches = []
+
+        def callback(records):
+            batches.append(records)
+
+        scan_obj.foreach(callback, batch_size=7)
+
+        records = [record for batch in batches for record in batch]
+        assert len(records) >= 20
+        assert all(0 < len(batch) <= 7 for batch in batches)
+        key, meta, bins = records[0]
+        assert 'name' in bins
+
+    def test_scan_with_batch_size_stop_by_returning_false(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        batches = []
+
+        def callback(records):
+            batches.append(records)
+            return False
+
+        scan_obj.foreach(callback, batch_size=5)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 5
+
+    def test_scan_with_negative_batch_size(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        def callback(records):
+            pass
+
+        with pytest.raises(ParamError):
+            scan_obj.foreach(callback, batch_size=-1)
+
+    def test_scan_iter(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        records = list(scan_obj.iter())
+
+        assert len(records) >= 20
+        key, meta, bins = records[0]
+        assert 'name' in bins
+
+    def test_scan_iter_with_small_queue(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        count = 0
+        for key, meta, bins in scan_obj.iter(queue_size=1):
+            count += 1
+
+        assert count >= 20
+
+    def test_scan_iter_stop_early(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        iterator = scan_obj.iter(queue_size=2)
+        first = next(iterator)
+        del iterator
+
+        assert len(first) == 3
+
+    def test_scan_iter_stopped_by_client_close(self):
+
+        hostlist, user, password = TestBaseClass.get_hosts()
+        config = {'hosts': hostlist}
+        if user == None and password == None:
+            client = aerospike.client(config).connect()
+        else:
+            client = aerospike.client(config).connect(user, password)
+
+        iterator = client.scan('test', 'demo').iter(queue_size=1)
+        next(iterator)
+        client.close()
+
+        with pytest.raises(ClusterError):
+            for record in iterator:
+                pass
+
+    def test_scan_iter_with_invalid_queue_size(self):
+
+        scan_obj = self.client.scan('test', 'demo')
+
+        with pytest.raises(ParamError):
+            scan_obj.iter(queue_size=0)
+
+    def test_scan_by_node(self):
+
+        nodes = []
+        for host in self.client.get_nodes():
+            response = self.client.info_node('node', host)
+            nodes.append(response.split('\t')[1].strip())
+
+        total = 0
+        for node in nodes:
+            records = self.client.scan('test', 'demo').results(node=node)
+            total += len(records)
+
+        assert total == len(self.client.scan('test', 'demo').results())
+
+    def test_scan_foreach_by_node(self):
+
+        host = self.client.get_nodes()[0]
+        node = self.client.info_node('node', host).split('\t')[1].strip()
+
+        records = []
+
+        def callback(records_batch):
+            records.extend(records_batch)
+
+        self.client.scan('test', 'demo').foreach(callback, batch_size=10,
+                                                 node=node)
+
+        assert len(records) > 0
+
+    def test_scan_by_invalid_node(self):
+
+        with pytest.raises(ParamError):
+            self.client.scan('test', 'demo').results(node='NO_SUCH_NODE')
+
+    def test_scan_results_share_ns_and_set(self):
+
+        records = self.client.scan('test', 'demo').results()
+
+        assert len(records) >= 20
+        key0, key1 = records[0][0], records[1][0]
+        assert key0[0] == 'test' and key0[1] == 'demo'
+        assert key0[0] is key1[0]
+        assert key0[1] is key1[1]
+
+    def test_scan_results_with_digest_bytes(self):
+
+        records = self.client.scan('test', 'demo').results(
+            options={'digest_bytes': True})
+
+        digests = set(key[3] for key, meta, bins in records)
+        assert len(digests) == len(records)
+        for digest in digests:
+            assert isinstance(digest, str)
+            assert len(digest) == 20
+
+    def test_scan_foreach_with_nokey(self):
+
+        records = []
+
+        def callback((key, meta, bins)):
+            records.append((key, bins))
+
+        self.client.scan('test', 'demo').foreach(callback,
+                                                 options={'nokey': True})
+
+        assert len(records) >= 20
+        for key, bins in records:
+            assert key is None
+            assert 'name' in bins
+
+    def test_scan_batches_and_iter_with_nokey(self):
+
+        records = []
+
+        def callback(records_batch):
+            records.extend(records_batch)
+
+        self.client.scan('test', 'demo').foreach(callback,
+                                                 options={'nokey': True},
+                                                 batch_size=5)
+
+        assert len(records) >= 20
+        assert all(key is None for key, meta, bins in records)
+        for key, meta, bins in self.client.scan('test', 'demo').iter(
+                options={'nokey': True}):
+            assert key is None
+
+    def test_scan_with_invalid_nokey(self):
+
+        with pytest.raises(ParamError):
+            self.client.scan('test', 'demo').results(options={'nokey': 1})
+
+    def test_scan_results_with_lazy_bins(self):
+
+        records = self.client.scan('test', 'demo').results(
+            options={'lazy_bins': True})
+
+        assert len(records) >= 20
+        record = records[0]
+        assert isinstance(record, aerospike.Record)
+        assert len(record) == 3
+        assert record['name'] == 'name%s' % record['age']
+        assert record.get('no_such_bin', 7) == 7
+        with pytest.raises(KeyError):
+            record['no_such_bin']
+        key, meta, bins = record
+        assert key is record[0] is record.key
+        assert meta == record.meta and 'gen' in meta
+        assert bins == {'name': record['name'], 'age': record['age']}
+        assert record == (key, meta, bins)
+        assert record[-1] is bins
+
+    def test_scan_foreach_with_lazy_bins_and_batch_size(self):
+
+        records = []
+
+        def callback(records_batch):
+            records.extend(records_batch)
+
+        self.client.scan('test', 'demo').foreach(
+            callback, options={'lazy_bins': True, 'nokey': True}, batch_size=4)
+
+        assert len(records) >= 20
+        for record in records:
+            assert record[0] is None
+            assert record['name'].startswith('name')
@@ -216,6 +216,16 @@ class TestSelectMany(object):
             bins = records[k][2].keys()
             assert set(bins).intersection(set(filter_bins)) == set(bins)
 
+    def test_select_many_with_many_unicode_bins(self):
+
+        # More unicode bin names than the initial storage of their encodings
+        filter_bins = [u'name', u'age'] + [u'missing%d' % i for i in xrange(40)]
+        records = TestSelectMany.client.select_many(self.keys, filter_bins)
+
+        assert len(records.keys()) == 5
+        for k in records.keys():
+            assert set(records[k][2].keys()) == set(['name', 'age'])
+
     def test_select_many_with_empty_bins_list(self):
 
         records = TestSelectMany.client.select_many(self.keys, [])
@@ -236,3 +246,69 @@ class TestSelectMany(object):
         except ClusterError as exception:
             assert exception.code == 11L
             assert exception.msg == 'No connection to aerospike cluster'
+
+    def test_select_many_ordered(self):
+
+        digest = TestSelectMany.client.get_key_digest('test', 'demo', 4)
+        keys = [('test', 'demo', None, digest), self.keys[0],
+                ('test', 'demo', 'non-existent')]
+
+        records = TestSelectMany.client.select_many(keys, ['name'],
+                                                    options={'ordered': True})
+
+        assert type(records) == list
+        assert len(records) == 3
+        assert records[0][2] == {'name': 'name4'}
+        assert records[1][2] == {'name': 'name0'}
+        assert records[2] == None
+
+    def test_select_many_with_invalid_options(self):
+
+        with pytest.raises(ParamError):
+            TestSelectMany.client.select_many(self.keys, ['name'], None,
+                                              {'ordered': 'yes'})
+
+    def test_select_many_split(self):
+
+        keys = list(reversed(self.keys)) + [('test', 'demo', 'non-existent')]
+
+        records = TestSelectMany.client.select_many(keys, ['age'],
+                                                    {'max_keys': 2},
+                                                    {'ordered': True})
+
+        assert len(records) == 6
+        for i in xrange(5):
+            assert records[i][2] == {'age': 4 - i}
+        assert records[5] == None
+
+    def test_select_many_columns(self):
+
+        keys = [self.keys[2], ('test', 'demo', 'non-existent'), self.keys[0],
+                self.keys[2]]
+
+        columns = TestSelectMany.client.select_many(keys,
+            ['name', u'age', 'missing'], options={'output': 'columns'})
+
+        assert columns == {
+            'name': ['name2', None, 'name0', 'name2'],
+            'age': [2, None, 0, 2],
+            'missing': [None, None, None, None]
+        }
+
+    def test_select_many_columns_split(self):
+
+        columns = TestSelectMany.client.select_many(self.keys, ['age'],
+                                                    {'max_keys': 2},
+                                                    {'output': 'columns'})
+
+        assert columns == {'age': [0, 1, 2, 3, 4]}
+
+    def test_select_many_with_invalid_output(self):
+
+        with pytest.raises(ParamError):
+            TestSelectMany.client.select_many(self.keys, ['age'],
+                                              options={'output': 'bitmap'})
+
+        with pytest.raises(ParamError):
+            TestSelectMany.client.exists_many(self.keys,
+                                              options={'output': 'columns'})